@@ -10,15 +10,20 @@ def compute_statistics(times):
     median_val = statistics.median(times)
 
     sorted_times = sorted(times)
-    p99_index = int(0.99 * n)
-    if p99_index >= n:
-        p99_index = n - 1
-    p99_val = sorted_times[p99_index]
+
+    def percentile(q):
+        index = int(q * n)
+        if index >= n:
+            index = n - 1
+        return sorted_times[index]
 
     return {
         "mean_ns": mean_val,
         "stdev_ns": stdev_val,
         "median_ns": median_val,
-        "p99_ns": p99_val,
+        "p50_ns": percentile(0.5),
+        "p99_ns": percentile(0.99),
+        "p999_ns": percentile(0.999),
+        "max_ns": sorted_times[-1],
         "count": n,
     }
@@ -0,0 +1,72 @@
+"""
+Orders per second of a many-symbol replay through ``BookManager``, in
+single-process mode and with increasing numbers of worker processes.
+
+Scaling depends on free cores: the parent process encodes and routes every
+order, and the workers only run in parallel with each other and with the
+parent when there are cores for them.
+"""
+
+import gc
+import os
+import time
+
+from workloads import PLACE, market_making
+
+from limit_order_book.book_manager import BookManager
+from limit_order_book.instrument import Instrument
+
+NUM_SYMBOLS = 32
+NUM_OPERATIONS_PER_SYMBOL = 10_000
+FLUSH_EVERY = 20_000
+
+
+def generate_stream():
+    streams = []
+    for i in range(NUM_SYMBOLS):
+        setup, operations = market_making(NUM_OPERATIONS_PER_SYMBOL, seed=i)
+        streams.append((f"SYM{i}", setup + operations))
+    # Interleave the symbols, as a consolidated feed would.
+    stream = []
+    for j in range(max(len(operations) for _, operations in streams)):
+        for symbol, operations in streams:
+            if j < len(operations):
+                stream.append((symbol, *operations[j]))
+    return stream
+
+
+def benchmark_book_manager(stream, num_workers):
+    manager = BookManager(num_workers, instrument=Instrument("0.01"))
+    new_order = manager.new_order
+    cancel_order = manager.cancel_order
+    start = time.perf_counter()
+    for i, (symbol, kind, args) in enumerate(stream, 1):
+        if kind == PLACE:
+            new_order(symbol, *args)
+        else:
+            cancel_order(symbol, *args)
+        if i % FLUSH_EVERY == 0:
+            manager.flush(decode=False)
+    manager.flush(decode=False)
+    elapsed = time.perf_counter() - start
+    manager.close()
+    return len(stream) / elapsed
+
+
+def main():
+    gc.disable()
+
+    stream = generate_stream()
+    print(
+        f"Book manager, {NUM_SYMBOLS} symbols, {len(stream)} orders,"
+        f" flush every {FLUSH_EVERY}, {os.cpu_count()} CPU(s)"
+    )
+    for num_workers in (0, 1, 2, 4):
+        orders_per_second = benchmark_book_manager(stream, num_workers)
+        gc.collect()
+        mode = "single process" if num_workers == 0 else f"{num_workers} worker(s)"
+        print(f"  {mode:<15} {orders_per_second:>9.0f} orders/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+import gc
+import time
+
+from workloads import PLACE, market_making
+
+from limit_order_book.codec import MessageWriter, decode_fills, decode_orders
+from limit_order_book.instrument import Instrument
+from limit_order_book.limit_order_book import LimitOrderBook
+
+NUM_OPERATIONS = 500_000
+
+
+def encode(operations):
+    writer = MessageWriter()
+    for kind, args in operations:
+        if kind == PLACE:
+            writer.new_order(*args)
+        else:
+            writer.cancel_order(*args)
+    return writer
+
+
+def new_book(setup):
+    limit_order_book = LimitOrderBook(instrument=Instrument("0.01"))
+    for _, args in setup:
+        limit_order_book.place_order(*args)
+    return limit_order_book
+
+
+def apply_tuples(limit_order_book, operations):
+    matches = []
+    for kind, args in operations:
+        if kind == PLACE:
+            matches.extend(limit_order_book.place_order(*args))
+        else:
+            limit_order_book.cancel_order(*args)
+    return matches
+
+
+def timed(function, *args):
+    start = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    gc.disable()
+
+    setup, operations = market_making(NUM_OPERATIONS)
+    writer, encode_time = timed(encode, operations)
+    buffer = bytes(writer.getbuffer())
+
+    _, decode_time = timed(lambda: sum(1 for _ in decode_orders(buffer)))
+    matches, tuples_time = timed(apply_tuples, new_book(setup), operations)
+    fills = MessageWriter()
+    _, messages_time = timed(new_book(setup).process_messages, buffer, fills.fill)
+    num_fills = len(list(decode_fills(fills.getbuffer())))
+    assert num_fills == len(matches)
+
+    print(f"Codec, {NUM_OPERATIONS} market-making orders, {num_fills} fills")
+    for name, elapsed, unit in (
+        ("Encode orders", encode_time, "msg/s"),
+        ("Decode orders", decode_time, "msg/s"),
+        ("Tuples -> place_order", tuples_time, "orders/s"),
+        ("Buffer -> process_messages + fills", messages_time, "orders/s"),
+    ):
+        print(f"  {name + ':':<36} {NUM_OPERATIONS / elapsed:>10.0f} {unit}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+import gc
+import time
+import tracemalloc
+from decimal import Decimal
+
+from compute_statistics import compute_statistics
+
+from limit_order_book.fills import FillRingBuffer
+from limit_order_book.instrument import Instrument
+from limit_order_book.limit_order_book import LimitOrderBook
+
+NUM_ORDERS = 100_000
+SWEEP_LEVELS = 1_000
+SWEEP_ORDERS_PER_LEVEL = 10
+
+
+def place_with_list(limit_order_book):
+    place_order = limit_order_book.place_order
+    return lambda *order: place_order(*order)
+
+
+def place_with_callback(limit_order_book):
+    num_matches = [0]
+
+    def on_match(match):
+        num_matches[0] += 1
+
+    limit_order_book.set_fill_sink(on_match)
+    return limit_order_book.submit_order
+
+
+def place_with_ring_buffer(limit_order_book):
+    # Preallocated for the largest burst of fills, so it never grows.
+    fills = FillRingBuffer(capacity=SWEEP_LEVELS * SWEEP_ORDERS_PER_LEVEL)
+    limit_order_book.set_fill_sink(fills.append)
+    submit_order = limit_order_book.submit_order
+
+    def place(*order):
+        submit_order(*order)
+        fills.clear()
+
+    return place
+
+
+def place_with_iter(limit_order_book):
+    place_order_iter = limit_order_book.place_order_iter
+
+    def place(*order):
+        for _ in place_order_iter(*order):
+            pass
+
+    return place
+
+
+MODES = {
+    "list": place_with_list,
+    "callback": place_with_callback,
+    "ring buffer": place_with_ring_buffer,
+    "iter": place_with_iter,
+}
+
+
+def new_limit_order_book():
+    return LimitOrderBook(instrument=Instrument(tick_size="0.01"))
+
+
+def benchmark_non_crossing(make_place):
+    """Place alternating bids and asks that never cross."""
+
+    limit_order_book = new_limit_order_book()
+    place = make_place(limit_order_book)
+    times = []
+    for i in range(NUM_ORDERS):
+        if i % 2:
+            order = (f"O{i}", "buy", Decimal("99.00") - Decimal(i % 100) / 100, 1)
+        else:
+            order = (f"O{i}", "sell", Decimal("101.00") + Decimal(i % 100) / 100, 1)
+        start = time.perf_counter_ns()
+        place(*order)
+        times.append(time.perf_counter_ns() - start)
+    return compute_statistics(times)
+
+
+def benchmark_sweep(make_place):
+    """One buy order sweeping the whole ask side; returns its time and peak memory."""
+
+    limit_order_book = new_limit_order_book()
+    for level in range(SWEEP_LEVELS):
+        price = Decimal("100.00") + Decimal(level) / 100
+        for i in range(SWEEP_ORDERS_PER_LEVEL):
+            limit_order_book.place_order(f"S{level}-{i}", "sell", price, 1)
+    place = make_place(limit_order_book)
+
+    tracemalloc.start()
+    start = time.perf_counter_ns()
+    place("B", "buy", Decimal("200.00"), SWEEP_LEVELS * SWEEP_ORDERS_PER_LEVEL)
+    sweep_time = time.perf_counter_ns() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return sweep_time, peak
+
+
+def main():
+    gc.disable()
+
+    for name, make_place in MODES.items():
+        non_crossing_stats = benchmark_non_crossing(make_place)
+        sweep_time, sweep_peak = benchmark_sweep(make_place)
+        print(f"Fill delivery: {name}")
+        print(
+            f"  Median Place Time (no fills):  {non_crossing_stats['median_ns']:.2f} ns"
+        )
+        print(
+            f"  Sweep of {SWEEP_LEVELS * SWEEP_ORDERS_PER_LEVEL} fills:          "
+            f"{sweep_time / 1e6:.2f} ms (traced, peak {sweep_peak / 1024:.0f} KiB)"
+        )
+        print()
+
+
+if __name__ == "__main__":
+    main()
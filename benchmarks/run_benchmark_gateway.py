@@ -0,0 +1,108 @@
+"""
+End-to-end messages per second through ``OrderGateway`` over a Unix socket.
+
+Clients run in the same event loop as the gateway, each sending its orders
+in windows of ``WINDOW`` messages and waiting for the acknowledgements of a
+window before sending the next, so the gateway sees one write of up to
+``WINDOW`` messages per client and wakeup.
+"""
+
+import asyncio
+import gc
+import os
+import tempfile
+import time
+
+from workloads import PLACE, market_making
+
+from limit_order_book.codec import ACK, MessageWriter
+from limit_order_book.gateway import OrderGateway, read_responses
+from limit_order_book.instrument import Instrument
+from limit_order_book.limit_order_book import LimitOrderBook
+
+NUM_OPERATIONS = 200_000
+
+
+def encode_windows(operations, window):
+    windows = []
+    for i in range(0, len(operations), window):
+        window_operations = operations[i : i + window]
+        messages = MessageWriter()
+        for kind, args in window_operations:
+            if kind == PLACE:
+                messages.new_order(*args)
+            else:
+                messages.cancel_order(*args)
+        windows.append((bytes(messages.getbuffer()), len(window_operations)))
+    return windows
+
+
+async def run_client(path, windows):
+    reader, writer = await asyncio.open_unix_connection(path)
+    buffer = bytearray()
+    num_responses = 0
+    for messages, num_messages in windows:
+        writer.write(messages)
+        await writer.drain()
+        # Fills follow the acknowledgement of their order, so a window is
+        # done once it has been acknowledged in full.
+        acks = 0
+        while acks < num_messages:
+            responses = await read_responses(reader, 1, buffer)
+            acks += sum(1 for response in responses if response[0] == ACK)
+            num_responses += len(responses)
+    writer.close()
+    await writer.wait_closed()
+    return num_responses
+
+
+async def benchmark_gateway(path, setup, client_operations, window):
+    limit_order_book = LimitOrderBook(instrument=Instrument("0.01"))
+    for _, args in setup:
+        limit_order_book.place_order(*args)
+    gateway = OrderGateway(limit_order_book)
+    await gateway.start_unix(path)
+
+    client_windows = [encode_windows(ops, window) for ops in client_operations]
+    start = time.perf_counter()
+    num_responses = await asyncio.gather(
+        *(run_client(path, windows) for windows in client_windows)
+    )
+    elapsed = time.perf_counter() - start
+    await gateway.close()
+    return gateway, sum(num_responses), elapsed
+
+
+def main():
+    gc.disable()
+
+    print(
+        f"Gateway, {NUM_OPERATIONS} market-making orders over a Unix socket"
+        f" ({NUM_OPERATIONS // 10} for a window of 1)"
+    )
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "gateway.sock")
+        for num_clients in (1, 4):
+            for window in (1, 16, 256):
+                # A round trip per message is slow, so fewer are sent.
+                setup, operations = market_making(
+                    NUM_OPERATIONS // 10 if window == 1 else NUM_OPERATIONS
+                )
+                # Clients quote disjoint order ids in the same book.
+                client_operations = [
+                    operations[i::num_clients] for i in range(num_clients)
+                ]
+                gateway, num_responses, elapsed = asyncio.run(
+                    benchmark_gateway(path, setup, client_operations, window)
+                )
+                gc.collect()
+                print(
+                    f"  {num_clients} client(s), window {window:>3}: "
+                    f"{gateway.num_messages / elapsed:>9.0f} msg/s, "
+                    f"{num_responses / elapsed:>9.0f} responses/s, "
+                    f"{gateway.num_messages / gateway.num_batches:>6.1f} msg/batch"
+                )
+
+
+if __name__ == "__main__":
+    main()
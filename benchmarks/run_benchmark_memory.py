@@ -0,0 +1,140 @@
+"""
+Retained memory of resting orders and price levels, measured with tracemalloc.
+
+Books of increasing depth (orders per level) and breadth (levels per side)
+are built with ``LimitOrderBook`` and every traced allocation still alive
+afterwards is attributed by its allocation site to one of the categories
+below. Per-order categories are divided by the number of resting orders and
+per-level categories by the number of price levels. Order ids are created by
+the caller, so they are not counted.
+
+The entire ask side is then swept by a market order, and the growth of
+``filled_orders`` is reported per filled order id.
+
+Results are printed as JSON:
+
+    python3 benchmarks/run_benchmark_memory.py > benchmarks/benchmark_memory_result.json
+"""
+
+import gc
+import json
+import linecache
+import os
+import platform
+import tracemalloc
+from decimal import Decimal
+
+from limit_order_book.instrument import Instrument
+from limit_order_book.limit_order_book import LimitOrderBook
+
+LEVELS_PER_SIDE = (10, 100, 1000)
+ORDERS_PER_LEVEL = (1, 10, 100)
+
+# (category, file, source fragment) in order of precedence; an allocation
+# belongs to the first entry whose file and line match.
+ALLOCATION_SITES = (
+    ("order", "limit_order_book.py", "Order("),
+    ("list_node", "limit_order_book.py", "DoublyLinkedListNode("),
+    ("active_orders", "limit_order_book.py", "active_orders"),
+    ("filled_orders", "limit_order_book.py", "filled_orders"),
+    ("order_records", "order_records.py", ""),
+    ("price_level", "limit_order_book.py", "PriceLevel("),
+    ("price_level", "limit_order_book.py", "DoublyLinkedList()"),
+    ("price_level", "doubly_linked_list.py", "DoublyLinkedListNode("),
+    ("skip_list_node", "skip_list.py", "SkipListNode("),
+    ("skip_list_forward", "skip_list.py", "self.forward = "),
+    # Level prices, their tick counts and the negated bid keys.
+    ("level_prices", "instrument.py", ""),
+    ("level_prices", "limit_order_book.py", "own_key = "),
+)
+
+ORDER_CATEGORIES = ("order", "list_node", "active_orders", "order_records")
+LEVEL_CATEGORIES = ("price_level", "skip_list_node", "skip_list_forward", "level_prices")
+
+
+def category(frame):
+    filename = os.path.basename(frame.filename)
+    line = linecache.getline(frame.filename, frame.lineno)
+    for name, site_filename, fragment in ALLOCATION_SITES:
+        if filename == site_filename and fragment in line:
+            return name
+    return "other"
+
+
+def retained_bytes(snapshot):
+    breakdown = {}
+    for stat in snapshot.statistics("lineno"):
+        name = category(stat.traceback[0])
+        breakdown[name] = breakdown.get(name, 0) + stat.size
+    return breakdown
+
+
+def generate_orders(levels_per_side, orders_per_level):
+    # Levels are filled round-robin, as a book builds up over time.
+    tick = Decimal("0.01")
+    orders = []
+    for i in range(orders_per_level):
+        for level in range(1, levels_per_side + 1):
+            orders.append((f"B{level}-{i}", "buy", 100 - level * tick, 1))
+            orders.append((f"S{level}-{i}", "sell", 100 + level * tick, 1))
+    return orders
+
+
+def benchmark_memory(levels_per_side, orders_per_level):
+    orders = generate_orders(levels_per_side, orders_per_level)
+    num_levels = 2 * levels_per_side
+    num_orders = len(orders)
+
+    gc.collect()
+    tracemalloc.start()
+    limit_order_book = LimitOrderBook(instrument=Instrument(tick_size="0.01"))
+    place_order = limit_order_book.place_order
+    for order in orders:
+        place_order(*order)
+    resting = retained_bytes(tracemalloc.take_snapshot())
+
+    num_filled = num_orders // 2
+    place_order("SWEEP", "buy", None, num_filled, order_type="market")
+    swept = retained_bytes(tracemalloc.take_snapshot())
+    tracemalloc.stop()
+    del limit_order_book, place_order
+    gc.collect()
+
+    per_order = {name: resting.get(name, 0) / num_orders for name in ORDER_CATEGORIES}
+    per_level = {name: resting.get(name, 0) / num_levels for name in LEVEL_CATEGORIES}
+    return {
+        "levels_per_side": levels_per_side,
+        "orders_per_level": orders_per_level,
+        "resting_orders": num_orders,
+        "price_levels": num_levels,
+        "retained_bytes": sum(resting.values()),
+        "breakdown_bytes": resting,
+        "bytes_per_order": per_order,
+        "bytes_per_order_total": sum(per_order.values()),
+        "bytes_per_level": per_level,
+        "bytes_per_level_total": sum(per_level.values()),
+        "filled_orders_bytes_per_id": swept.get("filled_orders", 0) / (num_filled + 1),
+    }
+
+
+def main():
+    gc.disable()
+
+    results = [
+        benchmark_memory(levels_per_side, orders_per_level)
+        for levels_per_side in LEVELS_PER_SIDE
+        for orders_per_level in ORDERS_PER_LEVEL
+    ]
+    document = {
+        "metadata": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "book": "LimitOrderBook(instrument=Instrument(tick_size='0.01'))",
+        },
+        "results": results,
+    }
+    print(json.dumps(document, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""
+Open-loop latency against offered load.
+
+Orders arrive on a fixed schedule at each target rate whether or not the
+book has kept up, and latency is measured from the intended send time, so
+queueing behind a slow operation shows up in the tail instead of being
+hidden by a closed loop that simply waits for it (coordinated omission).
+Latencies are recorded into a fixed-memory ``LatencyHistogram``.
+
+    python3 benchmarks/run_benchmark_open_loop.py --rates 50000 100000 200000
+"""
+
+import argparse
+import gc
+import time
+
+from workloads import PLACE, WORKLOADS
+
+from limit_order_book.instrument import Instrument
+from limit_order_book.latency_histogram import LatencyHistogram
+from limit_order_book.limit_order_book import LimitOrderBook
+
+RATES = (25_000, 50_000, 100_000, 150_000, 200_000, 300_000, 400_000)
+
+
+def run_open_loop(setup, operations, rate):
+    """
+    Send ``operations`` at ``rate`` per second and return the response time
+    histogram (from intended send time to completion), the service time
+    histogram (from actual send time to completion) and the achieved rate.
+    """
+
+    limit_order_book = LimitOrderBook(instrument=Instrument(tick_size="0.01"))
+    place_order = limit_order_book.place_order
+    cancel_order = limit_order_book.cancel_order
+    for kind, args in setup:
+        if kind == PLACE:
+            place_order(*args)
+        else:
+            cancel_order(*args)
+
+    response_times = LatencyHistogram()
+    service_times = LatencyHistogram()
+    record_response_time = response_times.record
+    record_service_time = service_times.record
+    perf_counter_ns = time.perf_counter_ns
+    interval_ns = 1e9 / rate
+
+    start = perf_counter_ns()
+    for i, (kind, args) in enumerate(operations):
+        function = place_order if kind == PLACE else cancel_order
+        intended = start + int(i * interval_ns)
+        now = perf_counter_ns()
+        # Spin rather than sleep: sleeps are far coarser than the interval.
+        while now < intended:
+            now = perf_counter_ns()
+        function(*args)
+        end = perf_counter_ns()
+        record_response_time(end - intended)
+        record_service_time(end - now)
+    elapsed = perf_counter_ns() - start
+    return response_times, service_times, len(operations) / (elapsed / 1e9)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rates", nargs="+", type=int, default=list(RATES))
+    parser.add_argument("--duration", type=float, default=2.0, help="seconds per rate")
+    parser.add_argument(
+        "--workload", choices=list(WORKLOADS), default="market_making"
+    )
+    parser.add_argument(
+        "--p99-target-us",
+        type=float,
+        default=100.0,
+        help="p99 response time a sustainable rate must stay within",
+    )
+    args = parser.parse_args()
+
+    gc.disable()
+
+    num_operations = int(max(args.rates) * args.duration)
+    setup, operations = WORKLOADS[args.workload](num_operations)
+
+    print(f"Open-loop {args.workload}, {args.duration:g} s per rate, times in us")
+    print(
+        f"  {'offered':>9} {'achieved':>9}  {'p50':>8} {'p99':>8} {'p99.9':>8}"
+        f" {'max':>9}   {'service p99':>11}"
+    )
+    sustainable_rate = None
+    for rate in sorted(args.rates):
+        response_times, service_times, achieved_rate = run_open_loop(
+            setup, operations[: int(rate * args.duration)], rate
+        )
+        gc.collect()
+
+        summary = response_times.summary()
+        print(
+            f"  {rate:>9} {achieved_rate:>9.0f}  {summary['p50'] / 1e3:>8.1f}"
+            f" {summary['p99'] / 1e3:>8.1f} {summary['p999'] / 1e3:>8.1f}"
+            f" {summary['max'] / 1e3:>9.1f}"
+            f"   {service_times.value_at_quantile(0.99) / 1e3:>11.1f}"
+        )
+        if (
+            achieved_rate >= 0.99 * rate
+            and summary["p99"] <= args.p99_target_us * 1e3
+        ):
+            sustainable_rate = rate
+
+    if sustainable_rate is None:
+        print(f"No rate kept p99 within {args.p99_target_us:g} us")
+    else:
+        print(
+            f"Sustainable rate: {sustainable_rate} orders/s"
+            f" (p99 within {args.p99_target_us:g} us)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -67,6 +67,86 @@ def benchmark_cancel_order(num_active_orders=10000):
     print(f"99th Percentile:    {stats['p99_ns']:.2f} ns")
 
 
+def benchmark_amend_order(num_active_orders=10000):
+    """Size-down quote updates via amend_order versus cancel and place."""
+
+    results = {}
+    for method in ("amend_order", "cancel + place_order"):
+        limit_order_book = LimitOrderBook()
+        rng = random.Random(0)
+        orders = {}
+        for i in range(num_active_orders):
+            order_id = f"O{i}"
+            # Bids below 100 and asks above it, so that nothing matches.
+            if i % 2:
+                order = ("buy", round(rng.uniform(90, 99.99), 2), 1_000_000)
+            else:
+                order = ("sell", round(rng.uniform(100, 110), 2), 1_000_000)
+            limit_order_book.place_order(order_id, *order)
+            orders[order_id] = order
+
+        order_ids = list(orders)
+        rng.shuffle(order_ids)
+        times = []
+        for step, order_id in enumerate(order_ids * 5):
+            order_side, order_price, _ = orders[order_id]
+            new_quantity = 1_000_000 - 1 - step
+            start = time.perf_counter_ns()
+            if method == "amend_order":
+                limit_order_book.amend_order(order_id, new_quantity)
+            else:
+                limit_order_book.cancel_order(order_id)
+                limit_order_book.place_order(
+                    order_id, order_side, order_price, new_quantity
+                )
+            end = time.perf_counter_ns()
+            times.append(end - start)
+        results[method] = compute_statistics(times)
+
+    for method, stats in results.items():
+        print(f"\nBenchmark:          Reduce Order Size ({method})")
+        print(f"Amends:             {stats['count']}")
+        print(f"Mean Time:          {stats['mean_ns']:.2f} ns")
+        print(f"Standard Deviation: {stats['stdev_ns']:.2f} ns")
+        print(f"Median Time:        {stats['median_ns']:.2f} ns")
+        print(f"99th Percentile:    {stats['p99_ns']:.2f} ns")
+
+
+def benchmark_ioc_order(num_orders=10000):
+    """Non-resting orders that partly match: IOC versus place then cancel."""
+
+    results = {}
+    for method in ("ioc", "place + cancel_order"):
+        limit_order_book = LimitOrderBook()
+        rng = random.Random(0)
+        times = []
+        for i in range(num_orders):
+            # Refill one unit at a random ask level, then take it with an
+            # order for more than is available at or below its limit.
+            order_price = round(rng.uniform(100, 110), 2)
+            limit_order_book.place_order(f"S{i}", "sell", order_price, 1)
+            order_id = f"B{i}"
+            start = time.perf_counter_ns()
+            if method == "ioc":
+                limit_order_book.place_order(
+                    order_id, "buy", order_price, 5, order_type="ioc"
+                )
+            else:
+                limit_order_book.place_order(order_id, "buy", order_price, 5)
+                limit_order_book.cancel_order(order_id)
+            end = time.perf_counter_ns()
+            times.append(end - start)
+        results[method] = compute_statistics(times)
+
+    for method, stats in results.items():
+        print(f"\nBenchmark:          Immediate-or-Cancel ({method})")
+        print(f"Orders:             {stats['count']}")
+        print(f"Mean Time:          {stats['mean_ns']:.2f} ns")
+        print(f"Standard Deviation: {stats['stdev_ns']:.2f} ns")
+        print(f"Median Time:        {stats['median_ns']:.2f} ns")
+        print(f"99th Percentile:    {stats['p99_ns']:.2f} ns")
+
+
 def main():
     gc.disable()
 
@@ -74,6 +154,8 @@ def main():
 
     benchmark_place_order(num_orders_to_place=n)
     benchmark_cancel_order(num_active_orders=n)
+    benchmark_amend_order(num_active_orders=n)
+    benchmark_ioc_order(num_orders=n)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,78 @@
+import gc
+import random
+import time
+from decimal import Decimal
+
+from compute_statistics import compute_statistics
+
+from limit_order_book.limit_order_book import LimitOrderBook
+
+
+def run_mix(limit_order_book, num_operations, seed=0):
+    """
+    Place/cancel mix as in run_benchmark_time.py, with the GC enabled and
+    the time spent in collections recorded through gc.callbacks.
+    """
+
+    rng = random.Random(seed)
+    gc_pauses = []
+    gc_start = [0]
+
+    def on_gc(phase, info):
+        if phase == "start":
+            gc_start[0] = time.perf_counter_ns()
+        else:
+            gc_pauses.append(time.perf_counter_ns() - gc_start[0])
+
+    probability_of_placing = 1 / 3
+    num_placed_orders = 0
+    place_times = []
+
+    gc.collect()
+    gc.callbacks.append(on_gc)
+    try:
+        for _ in range(num_operations):
+            if rng.random() < probability_of_placing:
+                order_id = f"O{num_placed_orders}"
+                order_side = rng.choice(["buy", "sell"])
+                order_price = Decimal(f"{rng.uniform(90, 110):.2f}")
+                order_quantity = rng.randint(1, 10)
+                start = time.perf_counter_ns()
+                limit_order_book.place_order(
+                    order_id, order_side, order_price, order_quantity
+                )
+                place_times.append(time.perf_counter_ns() - start)
+                num_placed_orders += 1
+            elif num_placed_orders > 1:
+                limit_order_book.cancel_order(
+                    f"O{rng.randint(1, num_placed_orders)}"
+                )
+    finally:
+        gc.callbacks.remove(on_gc)
+
+    return compute_statistics(place_times), gc_pauses
+
+
+def main():
+    num_operations = 1_000_000
+
+    for pooling in (False, True):
+        limit_order_book = LimitOrderBook(pooling=pooling)
+        place_stats, gc_pauses = run_mix(limit_order_book, num_operations)
+        print(f"Pooling:            {pooling}")
+        print(f"Median Place Time:  {place_stats['median_ns']:.2f} ns")
+        print(f"99th Percentile:    {place_stats['p99_ns']:.2f} ns")
+        print(f"GC collections:     {len(gc_pauses)}")
+        print(f"GC total pause:     {sum(gc_pauses) / 1e6:.2f} ms")
+        print(f"GC max pause:       {max(gc_pauses, default=0) / 1e6:.2f} ms")
+        if pooling:
+            for name, stats in limit_order_book.pool_stats().items():
+                print(
+                    f"Pool {name + ':':<14} created {stats['created']}, "
+                    f"reused {stats['reused']}, free {stats['free']}"
+                )
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+import functools
+import gc
+import random
+import time
+import tracemalloc
+from decimal import Decimal
+
+from compute_statistics import compute_statistics
+
+from limit_order_book import (
+    b_tree,
+    price_ladder,
+    price_level_index,
+    skip_list,
+    sorted_array,
+)
+from limit_order_book.b_tree import BTree
+from limit_order_book.instrument import Instrument
+from limit_order_book.limit_order_book import LimitOrderBook
+from limit_order_book.price_ladder import PriceLadder
+from limit_order_book.skip_list import SkipList
+from limit_order_book.sorted_array import SortedArray
+
+BACKENDS = {
+    "SkipList": SkipList,
+    "SortedArray": SortedArray,
+    "BTree": BTree,
+    "PriceLadder": functools.partial(PriceLadder, window=4096),
+}
+
+# Allocations made in these modules belong to the price index: its nodes,
+# arrays and lists. Price levels and orders are allocated by the book and
+# only referenced from the index, so they are not counted.
+INDEX_FILTERS = [
+    tracemalloc.Filter(True, module.__file__)
+    for module in (price_level_index, skip_list, sorted_array, b_tree, price_ladder)
+]
+
+
+def generate_orders(num_orders, seed=0):
+    rng = random.Random(seed)
+    return [
+        (
+            f"O{i}",
+            rng.choice(["buy", "sell"]),
+            Decimal(f"{rng.uniform(90, 110):.2f}"),
+            rng.randint(1, 10),
+        )
+        for i in range(num_orders)
+    ]
+
+
+def build_limit_order_book(price_index):
+    return LimitOrderBook(
+        instrument=Instrument(tick_size="0.01"), price_index=price_index
+    )
+
+
+def benchmark_latency(price_index, orders):
+    limit_order_book = build_limit_order_book(price_index)
+
+    place_times = []
+    for order in orders:
+        start = time.perf_counter_ns()
+        limit_order_book.place_order(*order)
+        end = time.perf_counter_ns()
+        place_times.append(end - start)
+
+    orders_to_cancel = list(limit_order_book.active_orders.keys())
+    random.Random(1).shuffle(orders_to_cancel)
+
+    cancel_times = []
+    for order_id in orders_to_cancel:
+        start = time.perf_counter_ns()
+        limit_order_book.cancel_order(order_id)
+        end = time.perf_counter_ns()
+        cancel_times.append(end - start)
+
+    return compute_statistics(place_times), compute_statistics(cancel_times)
+
+
+def benchmark_memory(price_index, orders):
+    """
+    Return the memory retained by the price indexes alone, by the whole
+    book, and the number of resting orders.
+    """
+
+    tracemalloc.start()
+    limit_order_book = build_limit_order_book(price_index)
+    for order in orders:
+        limit_order_book.place_order(*order)
+    snapshot = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    index_size = sum(
+        stat.size
+        for stat in snapshot.filter_traces(INDEX_FILTERS).statistics("filename")
+    )
+    book_size = sum(stat.size for stat in snapshot.statistics("filename"))
+    return index_size, book_size, len(limit_order_book.active_orders)
+
+
+def main():
+    gc.disable()
+
+    n = 100_000
+    orders = generate_orders(n)
+
+    print(f"Orders per backend: {n} (tick size 0.01, prices 90-110)\n")
+    print(
+        f"{'Backend':<12} {'Place p50':>10} {'Place p99':>10} "
+        f"{'Cancel p50':>11} {'Cancel p99':>11} {'Index':>10} {'Book':>10}"
+    )
+    for name, price_index in BACKENDS.items():
+        place_stats, cancel_stats = benchmark_latency(price_index, orders)
+        index_size, book_size, num_active_orders = benchmark_memory(
+            price_index, orders
+        )
+        print(
+            f"{name:<12} "
+            f"{place_stats['median_ns']:>8.0f}ns {place_stats['p99_ns']:>8.0f}ns "
+            f"{cancel_stats['median_ns']:>9.0f}ns {cancel_stats['p99_ns']:>9.0f}ns "
+            f"{index_size / 2**10:>8.0f}KB {book_size / 2**20:>8.1f}MB"
+        )
+        gc.collect()
+
+    print(f"\nResting orders after placement: {num_active_orders}")
+
+
+if __name__ == "__main__":
+    main()
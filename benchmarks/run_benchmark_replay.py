@@ -0,0 +1,95 @@
+import csv
+import gc
+import os
+import tempfile
+import time
+from decimal import Decimal
+
+from workloads import PLACE, random_walk
+
+from limit_order_book.instrument import Instrument
+from limit_order_book.limit_order_book import LimitOrderBook
+from limit_order_book.replay import convert, read_binary, read_csv, replay
+
+NUM_ORDERS = 1_000_000
+
+
+def write_csv(path, operations):
+    with open(path, "w") as file:
+        file.write("action,order_id,order_side,order_price,order_quantity\n")
+        for kind, args in operations:
+            if kind == PLACE:
+                order_id, order_side, order_price, order_quantity = args
+                file.write(
+                    f"place,{order_id},{order_side},{order_price},{order_quantity}\n"
+                )
+            else:
+                file.write(f"cancel,{args[0]},,,\n")
+
+
+def replay_csv_reader(book, path):
+    # Row by row through csv.reader and Decimal, as the functional tests do.
+    num_orders = 0
+    with open(path) as file:
+        reader = csv.reader(file)
+        next(reader)
+        for action, order_id, order_side, order_price, order_quantity in reader:
+            if action == "place":
+                book.place_order(
+                    order_id, order_side, Decimal(order_price), int(order_quantity)
+                )
+            else:
+                book.cancel_order(order_id)
+            num_orders += 1
+    return num_orders
+
+
+def count_orders(chunks):
+    return sum(len(chunk[0]) for chunk in chunks)
+
+
+def timed(function, *args):
+    start = time.perf_counter()
+    result = function(*args)
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    return result, elapsed
+
+
+def main():
+    gc.disable()
+
+    _, operations = random_walk(NUM_ORDERS)
+    with tempfile.TemporaryDirectory() as directory:
+        csv_path = os.path.join(directory, "orders.csv")
+        binary_path = os.path.join(directory, "orders.bin")
+        write_csv(csv_path, operations)
+        del operations
+        _, convert_time = timed(convert, csv_path, binary_path)
+
+        print(f"Replay of {NUM_ORDERS} orders (random walk), orders per second")
+        print(
+            f"  CSV {os.path.getsize(csv_path) / NUM_ORDERS:.1f} bytes per order,"
+            f" binary {os.path.getsize(binary_path) / NUM_ORDERS:.1f},"
+            f" converted in {convert_time:.2f} s"
+        )
+        results = {
+            "parse only, read_csv": lambda: count_orders(read_csv(csv_path)),
+            "parse only, read_binary": lambda: count_orders(read_binary(binary_path)),
+            "replay, csv.reader + Decimal": lambda: replay_csv_reader(
+                LimitOrderBook(instrument=Instrument("0.01")), csv_path
+            ),
+            "replay, read_csv": lambda: replay(
+                LimitOrderBook(instrument=Instrument("0.01")), read_csv(csv_path)
+            )[0],
+            "replay, read_binary": lambda: replay(
+                LimitOrderBook(instrument=Instrument("0.01")), read_binary(binary_path)
+            )[0],
+        }
+        for name, function in results.items():
+            num_orders, elapsed = timed(function)
+            print(f"  {name:<30} {num_orders / elapsed:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+import gc
+import random
+import time
+
+from compute_statistics import compute_statistics
+
+from limit_order_book.skip_list import SkipList
+
+NUM_LEVELS = 10_000
+NUM_OPERATIONS = 200_000
+NEAR_TOUCH_DEPTH = 8
+
+
+def top_down_search(skip_list, key):
+    """Search descending through every level from the header."""
+    current = skip_list.header
+    for i in range(skip_list.level - 1, -1, -1):
+        while current.forward[i] and current.forward[i].key < key:
+            current = current.forward[i]
+    current = current.forward[0]
+    if current and current.key == key:
+        return current
+    return None
+
+
+def new_skip_list():
+    skip_list = SkipList()
+    for key in range(NUM_LEVELS):
+        skip_list.insert(key, key)
+    return skip_list
+
+
+def time_calls(function, keys, batch_size=100):
+    """Per-call time, measured over batches to keep timer overhead out."""
+    times = []
+    for i in range(0, len(keys), batch_size):
+        batch = keys[i : i + batch_size]
+        start = time.perf_counter_ns()
+        for key in batch:
+            function(key)
+        times.append((time.perf_counter_ns() - start) / len(batch))
+    return compute_statistics(times)
+
+
+def benchmark_search(rng):
+    skip_list = new_skip_list()
+    workloads = {
+        "near touch": [rng.randrange(NEAR_TOUCH_DEPTH) for _ in range(NUM_OPERATIONS)],
+        "uniform": [rng.randrange(NUM_LEVELS) for _ in range(NUM_OPERATIONS)],
+    }
+    results = {}
+    for workload, keys in workloads.items():
+        results[f"search ({workload}, finger)"] = time_calls(skip_list.search, keys)
+        results[f"search ({workload}, top-down)"] = time_calls(
+            lambda key: top_down_search(skip_list, key), keys
+        )
+    return results
+
+
+def benchmark_insert_delete(rng):
+    # A level near the touch appears and disappears, as quotes do.
+    skip_list = new_skip_list()
+    for key in range(NEAR_TOUCH_DEPTH):
+        skip_list.delete(key)
+    keys = [rng.randrange(NEAR_TOUCH_DEPTH) for _ in range(NUM_OPERATIONS)]
+    insert = skip_list.insert
+    delete = skip_list.delete
+
+    def insert_delete(key):
+        insert(key, key)
+        delete(key)
+
+    return {"insert + delete (near touch)": time_calls(insert_delete, keys)}
+
+
+def benchmark_remove_min():
+    results = {}
+    for name in ("pop_min", "delete(min)"):
+        skip_list = new_skip_list()
+        get_min = skip_list.get_min
+        delete = skip_list.delete
+
+        if name == "pop_min":
+            remove_min = skip_list.pop_min
+        else:
+
+            def remove_min():
+                node = get_min()
+                delete(node.key)
+                return node
+
+        # Keys are removed from the head in batches, after which the list is
+        # refilled behind its tail outside the timed region.
+        times = []
+        next_key = NUM_LEVELS
+        for _ in range(NUM_OPERATIONS // 100):
+            start = time.perf_counter_ns()
+            for _ in range(100):
+                remove_min()
+            times.append((time.perf_counter_ns() - start) / 100)
+            for _ in range(100):
+                skip_list.insert(next_key, next_key)
+                next_key += 1
+        results[f"remove best level ({name})"] = compute_statistics(times)
+    return results
+
+
+def main():
+    gc.disable()
+    rng = random.Random(0)
+
+    print(f"Skip list with {NUM_LEVELS} levels, {NUM_OPERATIONS} operations each")
+    results = {}
+    results.update(benchmark_search(rng))
+    results.update(benchmark_insert_delete(rng))
+    results.update(benchmark_remove_min())
+    for name, stats in results.items():
+        print(
+            f"  {name:<36} median {stats['median_ns']:8.2f} ns"
+            f"   p99 {stats['p99_ns']:8.2f} ns"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+import gc
+import os
+import tempfile
+import time
+
+from run_benchmark_storage import STORAGES, generate_resting_orders
+
+from limit_order_book.instrument import Instrument
+
+
+def build_limit_order_book(book_class, orders):
+    limit_order_book = book_class(instrument=Instrument(tick_size="0.01"))
+    start = time.perf_counter_ns()
+    limit_order_book.place_orders(*zip(*orders))
+    return limit_order_book, time.perf_counter_ns() - start
+
+
+def benchmark_snapshot(book_class, orders, path, repeat=3):
+    limit_order_book, replay_time = build_limit_order_book(book_class, orders)
+
+    start = time.perf_counter_ns()
+    limit_order_book.snapshot(path)
+    snapshot_time = time.perf_counter_ns() - start
+    # Books hold reference cycles, so they are only freed by a collection.
+    del limit_order_book
+    gc.collect()
+
+    load_times = []
+    for _ in range(repeat):
+        start = time.perf_counter_ns()
+        loaded_book = book_class.load(path, instrument=Instrument(tick_size="0.01"))
+        load_times.append(time.perf_counter_ns() - start)
+        assert len(loaded_book.active_orders) == len(orders)
+        del loaded_book
+        gc.collect()
+
+    return replay_time, snapshot_time, min(load_times), os.path.getsize(path)
+
+
+def main():
+    gc.disable()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "book.snapshot")
+        for num_resting_orders in (100_000, 1_000_000):
+            orders = generate_resting_orders(num_resting_orders)
+            print(f"Resting orders: {num_resting_orders}")
+            for name, book_class in STORAGES.items():
+                replay_time, snapshot_time, load_time, size = benchmark_snapshot(
+                    book_class, orders, path
+                )
+                print(f"  Storage:                      {name}")
+                print(f"  Rebuild via place_orders:     {replay_time / 1e6:.1f} ms")
+                print(f"  Snapshot:                     {snapshot_time / 1e6:.1f} ms")
+                print(f"  Load (best of 3):             {load_time / 1e6:.1f} ms")
+                print(f"  Snapshot size:                {size / 2**20:.1f} MiB")
+                print()
+
+
+if __name__ == "__main__":
+    main()
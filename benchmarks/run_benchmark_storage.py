@@ -0,0 +1,125 @@
+import gc
+import random
+import time
+import tracemalloc
+from decimal import Decimal
+
+from compute_statistics import compute_statistics
+
+from limit_order_book.array_limit_order_book import ArrayLimitOrderBook
+from limit_order_book.instrument import Instrument
+from limit_order_book.limit_order_book import LimitOrderBook
+
+CANCEL_BLOCK = 1000
+
+STORAGES = {
+    "objects": LimitOrderBook,
+    "arrays": ArrayLimitOrderBook,
+}
+
+
+def generate_resting_orders(num_resting_orders, seed=0):
+    rng = random.Random(seed)
+    orders = []
+    for i in range(num_resting_orders):
+        # Bids below 100 and asks above it, so every order rests.
+        if i % 2:
+            order_side, order_price = "buy", Decimal(f"{rng.uniform(90, 99.99):.2f}")
+        else:
+            order_side, order_price = "sell", Decimal(f"{rng.uniform(100, 110):.2f}")
+        orders.append((f"O{i}", order_side, order_price, 1))
+    return orders
+
+
+def build_limit_order_book(book_class, orders):
+    limit_order_book = book_class(instrument=Instrument(tick_size="0.01"))
+    place_times = []
+    handles = []
+    for order in orders:
+        start = time.perf_counter_ns()
+        handle, _ = limit_order_book.place_order(*order, return_handle=True)
+        place_times.append(time.perf_counter_ns() - start)
+        handles.append(handle)
+    return limit_order_book, place_times, handles
+
+
+def measure_bytes_per_order(book_class, orders):
+    tracemalloc.start()
+    limit_order_book, _, _ = build_limit_order_book(book_class, orders)
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return retained / len(limit_order_book.active_orders)
+
+
+def benchmark_storage(book_class, orders, seed=0):
+    gc.collect()
+    num_tracked_before = len(gc.get_objects())
+    limit_order_book, place_times, handles = build_limit_order_book(
+        book_class, orders
+    )
+    num_tracked = len(gc.get_objects()) - num_tracked_before
+
+    start = time.perf_counter_ns()
+    gc.collect()
+    gc_time = time.perf_counter_ns() - start
+
+    # Cancel half of the orders by id and the other half by handle, in
+    # alternating blocks timed as a whole so that the timer's own overhead
+    # does not swamp the difference.
+    cancels = list(zip((order[0] for order in orders), handles))
+    random.Random(seed).shuffle(cancels)
+    cancel_by_id_time = cancel_by_handle_time = 0
+    cancel_order = limit_order_book.cancel_order
+    cancel_handle = limit_order_book.cancel_handle
+    for i in range(0, len(cancels), 2 * CANCEL_BLOCK):
+        order_ids = [order_id for order_id, _ in cancels[i : i + CANCEL_BLOCK]]
+        block_handles = [
+            handle for _, handle in cancels[i + CANCEL_BLOCK : i + 2 * CANCEL_BLOCK]
+        ]
+        start = time.perf_counter_ns()
+        for order_id in order_ids:
+            cancel_order(order_id)
+        cancel_by_id_time += time.perf_counter_ns() - start
+        start = time.perf_counter_ns()
+        for handle in block_handles:
+            cancel_handle(handle)
+        cancel_by_handle_time += time.perf_counter_ns() - start
+    assert not limit_order_book.active_orders
+    num_cancels = len(cancels) / 2
+
+    return (
+        num_tracked,
+        gc_time,
+        compute_statistics(place_times),
+        cancel_by_id_time / num_cancels,
+        cancel_by_handle_time / num_cancels,
+    )
+
+
+def main():
+    gc.disable()
+
+    for num_resting_orders in (100_000, 1_000_000):
+        orders = generate_resting_orders(num_resting_orders)
+        print(f"Resting orders: {num_resting_orders}")
+        for name, book_class in STORAGES.items():
+            (
+                num_tracked,
+                gc_time,
+                place_stats,
+                cancel_by_id_time,
+                cancel_by_handle_time,
+            ) = benchmark_storage(book_class, orders)
+            bytes_per_order = measure_bytes_per_order(book_class, orders)
+            print(f"  Storage:                      {name}")
+            print(f"  Bytes per resting order:      {bytes_per_order:.1f}")
+            print(f"  GC-tracked objects:           {num_tracked}")
+            print(f"  Full collection:              {gc_time / 1e6:.2f} ms")
+            print(f"  Median Place Time:            {place_stats['median_ns']:.2f} ns")
+            print(f"  Mean Cancel Time (id):        {cancel_by_id_time:.2f} ns")
+            print(f"  Mean Cancel Time (handle):    {cancel_by_handle_time:.2f} ns")
+            print()
+
+
+if __name__ == "__main__":
+    main()
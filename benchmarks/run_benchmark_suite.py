@@ -0,0 +1,240 @@
+"""
+Benchmark suite over the workloads in ``workloads.py``.
+
+Run the suite and write the results as JSON:
+
+    python3 benchmarks/run_benchmark_suite.py run --output results.json
+
+Compare results against a stored baseline, exiting with status 1 if any
+workload regressed by more than the threshold or is missing from the
+results, and with status 2 if they were run with a different book or
+number of operations:
+
+    python3 benchmarks/run_benchmark_suite.py compare \\
+        benchmarks/benchmark_suite_result.json results.json --threshold 0.1
+"""
+
+import argparse
+import datetime
+import gc
+import json
+import platform
+import sys
+import time
+
+from compute_statistics import compute_statistics
+from workloads import PLACE, WORKLOADS
+
+from limit_order_book.array_limit_order_book import ArrayLimitOrderBook
+from limit_order_book.instrument import Instrument
+from limit_order_book.limit_order_book import LimitOrderBook
+
+BOOKS = {
+    "decimal": lambda: LimitOrderBook(),
+    "instrument": lambda: LimitOrderBook(instrument=Instrument(tick_size="0.01")),
+    "arrays": lambda: ArrayLimitOrderBook(instrument=Instrument(tick_size="0.01")),
+}
+
+# Results are only compared if these metadata fields match.
+COMPARED_METADATA = ("book", "num_operations")
+
+# Metrics gated by ``compare``, with True where higher is better. The
+# extreme tail (p99.9, max) is recorded but too noisy to gate on.
+GATED_METRICS = {
+    "throughput_ops_per_s": True,
+    "p50_ns": False,
+    "p99_ns": False,
+}
+
+
+def run_operations(make_book, setup, operations):
+    limit_order_book = make_book()
+    place_order = limit_order_book.place_order
+    cancel_order = limit_order_book.cancel_order
+    for kind, args in setup:
+        if kind == PLACE:
+            place_order(*args)
+        else:
+            cancel_order(*args)
+
+    times = []
+    append_time = times.append
+    perf_counter_ns = time.perf_counter_ns
+    run_start = perf_counter_ns()
+    for kind, args in operations:
+        function = place_order if kind == PLACE else cancel_order
+        start = perf_counter_ns()
+        function(*args)
+        append_time(perf_counter_ns() - start)
+    run_time = perf_counter_ns() - run_start
+    return times, run_time
+
+
+def run_workload(make_book, workload, num_operations, warmup, repeat, seed):
+    setup, operations = workload(num_operations, seed=seed)
+    samples = []
+    throughputs = []
+    for i in range(warmup + repeat):
+        times, run_time = run_operations(make_book, setup, operations)
+        # Books hold reference cycles, so they are only freed by a collection.
+        gc.collect()
+        if i < warmup:
+            continue
+        samples.extend(times)
+        throughputs.append(len(operations) / (run_time / 1e9))
+
+    stats = compute_statistics(samples)
+    throughputs.sort()
+    return {
+        "throughput_ops_per_s": throughputs[len(throughputs) // 2],
+        "mean_ns": stats["mean_ns"],
+        "p50_ns": stats["p50_ns"],
+        "p99_ns": stats["p99_ns"],
+        "p999_ns": stats["p999_ns"],
+        "max_ns": stats["max_ns"],
+        "count": stats["count"],
+    }
+
+
+def run(args):
+    gc.disable()
+
+    results = {}
+    for name in args.workloads:
+        results[name] = run_workload(
+            BOOKS[args.book],
+            WORKLOADS[name],
+            args.num_operations,
+            args.warmup,
+            args.repeat,
+            args.seed,
+        )
+        print_result(name, results[name])
+
+    document = {
+        "metadata": {
+            "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "book": args.book,
+            "num_operations": args.num_operations,
+            "warmup": args.warmup,
+            "repeat": args.repeat,
+            "seed": args.seed,
+        },
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(document, file, indent=2)
+            file.write("\n")
+    return 0
+
+
+def print_result(name, result):
+    print(f"Workload: {name}")
+    print(f"  Throughput:  {result['throughput_ops_per_s']:12.0f} ops/s")
+    for metric in ("p50_ns", "p99_ns", "p999_ns", "max_ns"):
+        label = metric[:-3].replace("p999", "p99.9")
+        print(f"  {label + ':':<12} {result[metric]:12.0f} ns")
+
+
+def compare_results(baseline, current, threshold):
+    """
+    Return ``(rows, missing, regressed)``: one row ``(workload, metric,
+    baseline, current, relative change, is regression)`` per gated metric of
+    every workload present in both result sets, the baseline workloads
+    missing from ``current``, and whether any metric regressed by more than
+    ``threshold`` or any workload is missing.
+
+    Raises ValueError if the results differ in ``COMPARED_METADATA``.
+    """
+
+    for key in COMPARED_METADATA:
+        before = baseline["metadata"].get(key)
+        after = current["metadata"].get(key)
+        if before != after:
+            raise ValueError(
+                f"results are not comparable: {key} is {before!r} in the"
+                f" baseline and {after!r} in the current results"
+            )
+
+    rows = []
+    missing = []
+    for name, baseline_result in baseline["results"].items():
+        current_result = current["results"].get(name)
+        if current_result is None:
+            missing.append(name)
+            continue
+        for metric, higher_is_better in GATED_METRICS.items():
+            before = baseline_result[metric]
+            after = current_result[metric]
+            change = (after - before) / before if before else 0.0
+            worse = -change if higher_is_better else change
+            rows.append((name, metric, before, after, change, worse > threshold))
+    regressed = bool(missing) or any(row[-1] for row in rows)
+    return rows, missing, regressed
+
+
+def compare(args):
+    with open(args.baseline) as file:
+        baseline = json.load(file)
+    with open(args.current) as file:
+        current = json.load(file)
+
+    try:
+        rows, missing, regressed = compare_results(
+            baseline, current, args.threshold
+        )
+    except ValueError as error:
+        print(error, file=sys.stderr)
+        return 2
+    for name, metric, before, after, change, is_regression in rows:
+        flag = "REGRESSION" if is_regression else ""
+        print(
+            f"{name:<16} {metric:<22} {before:14.1f} {after:14.1f} "
+            f"{change:+8.1%}  {flag}"
+        )
+    for name in missing:
+        print(f"{name:<16} missing from the current results")
+    if regressed:
+        print(f"Regression beyond {args.threshold:.0%} threshold")
+        return 1
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="run the workloads")
+    run_parser.add_argument(
+        "--workloads", nargs="+", choices=list(WORKLOADS), default=list(WORKLOADS)
+    )
+    run_parser.add_argument("--book", choices=list(BOOKS), default="instrument")
+    run_parser.add_argument("--num-operations", type=int, default=20_000)
+    run_parser.add_argument("--warmup", type=int, default=1)
+    run_parser.add_argument("--repeat", type=int, default=3)
+    run_parser.add_argument("--seed", type=int, default=0)
+    run_parser.add_argument("--output", help="write the results to this JSON file")
+    run_parser.set_defaults(function=run)
+
+    compare_parser = subparsers.add_parser(
+        "compare", help="compare results against a baseline"
+    )
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="largest tolerated relative regression (default: 0.1)",
+    )
+    compare_parser.set_defaults(function=compare)
+
+    args = parser.parse_args(argv)
+    return args.function(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,44 @@
+import gc
+import time
+
+from compute_statistics import compute_statistics
+
+from limit_order_book.instrument import Instrument
+from limit_order_book.limit_order_book import LimitOrderBook
+
+NUM_LEVELS = 10
+NUM_SWEEPS = 200
+
+
+def benchmark_sweep(orders_per_level):
+    """Buy orders that each sweep ``NUM_LEVELS`` full ask levels."""
+
+    limit_order_book = LimitOrderBook(instrument=Instrument(tick_size="1"))
+    place_order = limit_order_book.place_order
+    times = []
+    for sweep in range(NUM_SWEEPS):
+        for level in range(NUM_LEVELS):
+            for i in range(orders_per_level):
+                place_order(f"S{sweep}-{level}-{i}", "sell", 100 + level, 1)
+        start = time.perf_counter_ns()
+        place_order(f"B{sweep}", "buy", 100 + NUM_LEVELS, NUM_LEVELS * orders_per_level)
+        times.append(
+            (time.perf_counter_ns() - start) / (NUM_LEVELS * orders_per_level)
+        )
+    return compute_statistics(times)
+
+
+def main():
+    gc.disable()
+
+    print(f"Sweeps of {NUM_LEVELS} levels, time per fill")
+    for orders_per_level in (1, 10, 100, 1000):
+        stats = benchmark_sweep(orders_per_level)
+        print(
+            f"  {orders_per_level:>5} orders per level:  "
+            f"median {stats['median_ns']:8.2f} ns   p99 {stats['p99_ns']:8.2f} ns"
+        )
+
+
+if __name__ == "__main__":
+    main()
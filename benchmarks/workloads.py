@@ -0,0 +1,226 @@
+"""
+Workload generators for the benchmark suite.
+
+Every generator is deterministic for a given seed and returns ``(setup,
+operations)``: two lists of operations, the first applied to a fresh book
+before timing starts. An operation is ``(PLACE, (order_id, order_side,
+order_price, order_quantity))`` or ``(CANCEL, (order_id,))``. Prices are
+``Decimal`` on a 0.01 grid and generators are parameterized by keyword.
+"""
+
+import random
+from decimal import Decimal
+
+PLACE = 0
+CANCEL = 1
+
+TICK = Decimal("0.01")
+
+
+def price(ticks):
+    return ticks * TICK
+
+
+class OrderIds:
+    """Fresh order ids, and the ids placed so far for choosing cancels."""
+
+    def __init__(self, prefix="O") -> None:
+        self.prefix = prefix
+        self.placed = []
+
+    def new(self):
+        order_id = f"{self.prefix}{len(self.placed)}"
+        self.placed.append(order_id)
+        return order_id
+
+    def recent(self, rng, window):
+        # Orders are mostly cancelled soon after they are placed.
+        return self.placed[-1 - int(rng.random() * min(window, len(self.placed)))]
+
+
+def random_walk(
+    num_operations,
+    seed=0,
+    mid=10_000,
+    step_probability=0.1,
+    max_offset=20,
+    aggressive_probability=0.05,
+    cancel_probability=0.3,
+    cancel_window=1000,
+):
+    """
+    Passive orders up to ``max_offset`` ticks from a mid price that moves a
+    tick at a time, with occasional aggressive orders and cancels of recent
+    orders.
+    """
+
+    rng = random.Random(seed)
+    order_ids = OrderIds()
+    operations = []
+    for _ in range(num_operations):
+        if rng.random() < step_probability:
+            mid += 1 if rng.random() < 0.5 else -1
+        if order_ids.placed and rng.random() < cancel_probability:
+            operations.append((CANCEL, (order_ids.recent(rng, cancel_window),)))
+            continue
+        order_side = "buy" if rng.random() < 0.5 else "sell"
+        offset = rng.randint(1, max_offset)
+        if rng.random() < aggressive_probability:
+            offset = -offset
+        ticks = mid - offset if order_side == "buy" else mid + offset
+        operations.append(
+            (PLACE, (order_ids.new(), order_side, price(ticks), rng.randint(1, 10)))
+        )
+    return [], operations
+
+
+def near_touch(
+    num_operations,
+    seed=0,
+    mid=10_000,
+    mean_offset=2.0,
+    cancel_probability=0.4,
+    cancel_window=200,
+):
+    """
+    Orders clustered at the touch: offsets from a fixed mid are geometric
+    with mean ``mean_offset`` ticks, so most flow joins the best few levels.
+    """
+
+    rng = random.Random(seed)
+    order_ids = OrderIds()
+    operations = []
+    for _ in range(num_operations):
+        if order_ids.placed and rng.random() < cancel_probability:
+            operations.append((CANCEL, (order_ids.recent(rng, cancel_window),)))
+            continue
+        order_side = "buy" if rng.random() < 0.5 else "sell"
+        offset = 1 + int(rng.expovariate(1 / mean_offset))
+        ticks = mid - offset if order_side == "buy" else mid + offset
+        operations.append(
+            (PLACE, (order_ids.new(), order_side, price(ticks), rng.randint(1, 10)))
+        )
+    return [], operations
+
+
+def market_making(
+    num_operations,
+    seed=0,
+    mid=10_000,
+    num_makers=20,
+    max_quote_offset=5,
+    taker_probability=0.05,
+):
+    """
+    Cancel-heavy quoting: each step a maker replaces one of its two quotes
+    (a cancel followed by a placement), and now and then a taker order
+    crosses the spread.
+    """
+
+    rng = random.Random(seed)
+    order_ids = OrderIds()
+    quotes = {}
+    setup = []
+    for maker in range(num_makers):
+        for order_side in ("buy", "sell"):
+            offset = rng.randint(1, max_quote_offset)
+            ticks = mid - offset if order_side == "buy" else mid + offset
+            order_id = order_ids.new()
+            quotes[maker, order_side] = order_id
+            setup.append((PLACE, (order_id, order_side, price(ticks), 10)))
+
+    operations = []
+    while len(operations) < num_operations:
+        if rng.random() < 0.1:
+            mid += 1 if rng.random() < 0.5 else -1
+        order_side = "buy" if rng.random() < 0.5 else "sell"
+        if rng.random() < taker_probability:
+            offset = max_quote_offset if order_side == "buy" else -max_quote_offset
+            ticks = mid + offset
+            operations.append(
+                (PLACE, (order_ids.new(), order_side, price(ticks), rng.randint(1, 20)))
+            )
+            continue
+        maker = rng.randrange(num_makers)
+        offset = rng.randint(1, max_quote_offset)
+        ticks = mid - offset if order_side == "buy" else mid + offset
+        order_id = order_ids.new()
+        operations.append((CANCEL, (quotes[maker, order_side],)))
+        operations.append((PLACE, (order_id, order_side, price(ticks), 10)))
+        quotes[maker, order_side] = order_id
+    return setup, operations[:num_operations]
+
+
+def sweeps(num_operations, seed=0, mid=10_000, num_levels=10, orders_per_level=10):
+    """
+    Rounds that build ``num_levels`` ask levels of ``orders_per_level``
+    orders each and then sweep all of them with one buy order.
+    """
+
+    rng = random.Random(seed)
+    order_ids = OrderIds()
+    operations = []
+    while len(operations) < num_operations:
+        quantity = 0
+        for level in range(num_levels):
+            for _ in range(orders_per_level):
+                order_quantity = rng.randint(1, 10)
+                quantity += order_quantity
+                operations.append(
+                    (
+                        PLACE,
+                        (order_ids.new(), "sell", price(mid + level), order_quantity),
+                    )
+                )
+        operations.append(
+            (PLACE, (order_ids.new(), "buy", price(mid + num_levels), quantity))
+        )
+    return [], operations[:num_operations]
+
+
+def deep_book(
+    num_operations,
+    seed=0,
+    mid=10_000,
+    num_resting=100_000,
+    num_levels=2_000,
+    cancel_probability=0.5,
+):
+    """
+    Place/cancel flow against a book holding ``num_resting`` orders spread
+    over ``num_levels`` levels per side; cancels hit any resting order.
+    """
+
+    rng = random.Random(seed)
+    order_ids = OrderIds()
+    setup = []
+    for _ in range(num_resting):
+        order_side = "buy" if rng.random() < 0.5 else "sell"
+        offset = rng.randint(1, num_levels)
+        ticks = mid - offset if order_side == "buy" else mid + offset
+        setup.append(
+            (PLACE, (order_ids.new(), order_side, price(ticks), rng.randint(1, 10)))
+        )
+
+    operations = []
+    for _ in range(num_operations):
+        if rng.random() < cancel_probability:
+            order_id = order_ids.placed[rng.randrange(len(order_ids.placed))]
+            operations.append((CANCEL, (order_id,)))
+            continue
+        order_side = "buy" if rng.random() < 0.5 else "sell"
+        offset = rng.randint(1, num_levels)
+        ticks = mid - offset if order_side == "buy" else mid + offset
+        operations.append(
+            (PLACE, (order_ids.new(), order_side, price(ticks), rng.randint(1, 10)))
+        )
+    return setup, operations
+
+
+WORKLOADS = {
+    "random_walk": random_walk,
+    "near_touch": near_touch,
+    "market_making": market_making,
+    "sweeps": sweeps,
+    "deep_book": deep_book,
+}
@@ -0,0 +1,334 @@
+from array import array
+
+from limit_order_book.limit_order_book import MARKET_LIMIT_KEY, LimitOrderBook
+from limit_order_book.order_arena import NO_SLOT, OrderArena
+from limit_order_book.order_records import SLOT_BITS, SLOT_MASK
+from limit_order_book.skip_list import SkipList
+
+
+class ArrayPriceLevel:
+    __slots__ = ("price", "head", "tail", "quantity", "order_count")
+
+    def __init__(self, price) -> None:
+        self.price = price
+        # First and last slot of the level's FIFO queue in the order arena.
+        self.head = NO_SLOT
+        self.tail = NO_SLOT
+        self.quantity = 0
+        self.order_count = 0
+
+
+class ArrayLimitOrderBook(LimitOrderBook):
+    """
+    Limit order book keeping resting orders in an ``OrderArena``.
+
+    Behaves exactly like ``LimitOrderBook``, but instead of an ``Order`` and
+    a list node per resting order, each order occupies one slot of typed
+    arrays, FIFO queues are linked through slot indices, and
+    ``active_orders`` maps order ids to arena handles. With millions of
+    resting orders the cyclic GC only has the price levels left to scan.
+
+    Keys are stored in ``array('q')`` columns, so an instrument is required.
+    """
+
+    def __init__(
+        self,
+        instrument,
+        price_index=SkipList,
+        filled_orders=set,
+        capacity=1024,
+        journal=None,
+        instrumented=False,
+    ) -> None:
+        if instrument is None:
+            raise ValueError("ArrayLimitOrderBook requires an instrument")
+        self.arena = OrderArena(capacity)
+        super().__init__(
+            instrument=instrument,
+            price_index=price_index,
+            filled_orders=filled_orders,
+            journal=journal,
+            instrumented=instrumented,
+        )
+
+    def _place_order(
+        self,
+        order_id,
+        order_side,
+        order_price,
+        order_quantity,
+        append_match,
+        order_type="limit",
+    ):
+        instrument = self.instrument
+        if order_type == "market":
+            order_price = None
+        else:
+            order_price = instrument.price_to_ticks(order_price)
+        instrument.check_quantity(order_quantity)
+
+        if order_side == "buy":
+            is_buy = True
+            opposite_orders = self.sell_orders
+            own_orders = self.buy_orders
+        elif order_side == "sell":
+            is_buy = False
+            opposite_orders = self.buy_orders
+            own_orders = self.sell_orders
+        else:
+            return
+
+        if order_price is None:
+            limit_key = MARKET_LIMIT_KEY
+        elif is_buy:
+            limit_key = order_price
+        else:
+            limit_key = -order_price
+        if order_type != "limit" and not self._check_order_type(
+            order_type, opposite_orders, limit_key, order_quantity
+        ):
+            return None
+
+        arena = self.arena
+        order_ids = arena.order_ids
+        quantities = arena.quantities
+        prev = arena.prev
+        next_ = arena.next
+
+        remaining_quantity = order_quantity
+        while remaining_quantity > 0:
+            best_node = opposite_orders.get_min()
+            if best_node is None or best_node.key > limit_key:
+                break
+            price_level = best_node.value
+            if remaining_quantity >= price_level.quantity:
+                # The order covers the whole level: fill all its orders in
+                # one pass and remove the level at once.
+                remaining_quantity -= price_level.quantity
+                self._sweep_level(price_level, order_id, is_buy, append_match)
+                opposite_orders.pop_min()
+                continue
+            slot = price_level.head
+            resting_quantity = quantities[slot]
+            resting_order_id = order_ids[slot]
+            matched_quantity = min(remaining_quantity, resting_quantity)
+            remaining_quantity -= matched_quantity
+            price_level.quantity -= matched_quantity
+            if is_buy:
+                append_match(
+                    (order_id, resting_order_id, matched_quantity, price_level.price)
+                )
+            else:
+                append_match(
+                    (resting_order_id, order_id, matched_quantity, price_level.price)
+                )
+            if matched_quantity < resting_quantity:
+                quantities[slot] = resting_quantity - matched_quantity
+                continue
+
+            # The resting order is fully filled: unlink it from the queue head.
+            next_slot = next_[slot]
+            price_level.head = next_slot
+            if next_slot == NO_SLOT:
+                price_level.tail = NO_SLOT
+            else:
+                prev[next_slot] = NO_SLOT
+            price_level.order_count -= 1
+            self.active_orders.pop(resting_order_id, None)
+            self.filled_orders.add(resting_order_id)
+            arena.release(slot)
+            if price_level.order_count == 0:
+                opposite_orders.pop_min()
+
+        if remaining_quantity == 0:
+            self.filled_orders.add(order_id)
+            return None
+        if order_type != "limit":
+            return None
+
+        own_key = -limit_key
+        node = own_orders.search(own_key)
+        if not node:
+            price_level = self._new_price_level(order_price)
+            own_orders.insert(own_key, price_level)
+        else:
+            price_level = node.value
+
+        slot = arena.allocate()
+        order_ids[slot] = order_id
+        arena.is_buy[slot] = is_buy
+        arena.keys[slot] = own_key
+        quantities[slot] = remaining_quantity
+        arena.levels[slot] = price_level
+        tail = price_level.tail
+        prev[slot] = tail
+        next_[slot] = NO_SLOT
+        if tail == NO_SLOT:
+            price_level.head = slot
+        else:
+            next_[tail] = slot
+        price_level.tail = slot
+        price_level.quantity += remaining_quantity
+        price_level.order_count += 1
+        handle = arena.handle(slot)
+        self.active_orders[order_id] = handle
+        return handle
+
+    def _order_state(self, order_id):
+        handle = self.active_orders.get(order_id)
+        if handle is None:
+            return None
+        arena = self.arena
+        slot = handle & SLOT_MASK
+        if arena.is_buy[slot]:
+            return order_id, handle, "buy", -arena.keys[slot], arena.quantities[slot]
+        return order_id, handle, "sell", arena.keys[slot], arena.quantities[slot]
+
+    def _handle_state(self, handle):
+        arena = self.arena
+        slot = arena.slot(handle)
+        if slot is None:
+            return None
+        order_id = arena.order_ids[slot]
+        if arena.is_buy[slot]:
+            return order_id, handle, "buy", -arena.keys[slot], arena.quantities[slot]
+        return order_id, handle, "sell", arena.keys[slot], arena.quantities[slot]
+
+    def _reduce_order(self, order_id, handle, order_quantity):
+        slot = handle & SLOT_MASK
+        quantities = self.arena.quantities
+        self.arena.levels[slot].quantity -= quantities[slot] - order_quantity
+        quantities[slot] = order_quantity
+
+    def _sweep_level(self, price_level, order_id, is_buy, append_match):
+        arena = self.arena
+        order_ids = arena.order_ids
+        quantities = arena.quantities
+        next_ = arena.next
+        release = arena.release
+        pop_handle = self.active_orders.pop
+        price = price_level.price
+        filled_order_ids = []
+        slot = price_level.head
+        while slot != NO_SLOT:
+            resting_order_id = order_ids[slot]
+            if is_buy:
+                append_match((order_id, resting_order_id, quantities[slot], price))
+            else:
+                append_match((resting_order_id, order_id, quantities[slot], price))
+            pop_handle(resting_order_id, None)
+            filled_order_ids.append(resting_order_id)
+            next_slot = next_[slot]
+            release(slot)
+            slot = next_slot
+
+        price_level.head = NO_SLOT
+        price_level.tail = NO_SLOT
+        price_level.quantity = 0
+        price_level.order_count = 0
+        self.filled_orders.update(filled_order_ids)
+
+    def cancel_handle(self, handle):
+        # ``OrderArena.slot``, inlined. Preallocated slots that were never
+        # used have generation 0 but no order id.
+        arena = self.arena
+        slot = handle & SLOT_MASK
+        if (
+            slot >= arena.capacity
+            or arena.generations[slot] != handle >> SLOT_BITS
+            or arena.order_ids[slot] is None
+        ):
+            return False
+        self._cancel_slot(slot, handle)
+        return True
+
+    def _cancel_slot(self, slot, handle):
+        arena = self.arena
+        order_id = arena.order_ids[slot]
+        prev = arena.prev
+        next_ = arena.next
+        price_level = arena.levels[slot]
+        prev_slot = prev[slot]
+        next_slot = next_[slot]
+        if prev_slot == NO_SLOT:
+            price_level.head = next_slot
+        else:
+            next_[prev_slot] = next_slot
+        if next_slot == NO_SLOT:
+            price_level.tail = prev_slot
+        else:
+            prev[next_slot] = prev_slot
+        price_level.quantity -= arena.quantities[slot]
+        price_level.order_count -= 1
+        del self.active_orders[order_id]
+
+        if price_level.order_count == 0:
+            if arena.is_buy[slot]:
+                self.buy_orders.delete(arena.keys[slot])
+            else:
+                self.sell_orders.delete(arena.keys[slot])
+        arena.release(slot)
+
+        return order_id
+
+    def _snapshot_side(self, index):
+        arena = self.arena
+        order_ids = arena.order_ids
+        quantities = arena.quantities
+        levels = []
+        side_ids = []
+        side_quantities = array("q")
+        for node in index.iter_range():
+            price_level = node.value
+            levels.append((price_level.price, price_level.order_count))
+            for slot in arena.iter_queue(price_level):
+                side_ids.append(order_ids[slot])
+                side_quantities.append(quantities[slot])
+        return levels, side_ids, side_quantities
+
+    def _load_side(self, is_buy, index, levels, order_ids, quantities):
+        instrument = self.instrument
+        items = []
+        for price, _ in levels:
+            price = instrument.price_to_ticks(price)
+            items.append((-price if is_buy else price, self._new_price_level(price)))
+        level_nodes = index.bulk_load(items)
+
+        # The side's orders take one block of consecutive slots in price-time
+        # order, so the columns are filled by slice assignment and each queue
+        # links slot ``i`` to ``i + 1`` except at the ends of its level.
+        arena = self.arena
+        num_orders = len(order_ids)
+        start = arena.allocate_block(num_orders)
+        stop = start + num_orders
+        arena.order_ids[start:stop] = order_ids
+        arena.is_buy[start:stop] = bytes([is_buy]) * num_orders
+        memoryview(arena.quantities)[start:stop] = quantities
+        prev = arena.prev
+        next_ = arena.next
+        prev[start:stop] = array("q", range(start - 1, stop - 1))
+        next_[start:stop] = array("q", range(start + 1, stop + 1))
+
+        keys = array("q")
+        price_levels = []
+        head = start
+        for level_node, (_, order_count) in zip(level_nodes, levels):
+            price_level = level_node.value
+            tail = head + order_count - 1
+            prev[head] = NO_SLOT
+            next_[tail] = NO_SLOT
+            price_level.head = head
+            price_level.tail = tail
+            price_level.quantity = sum(quantities[head - start : tail - start + 1])
+            price_level.order_count = order_count
+            keys.extend(array("q", [level_node.key]) * order_count)
+            price_levels.extend([price_level] * order_count)
+            head = tail + 1
+        arena.keys[start:stop] = keys
+        arena.levels[start:stop] = price_levels
+
+        # New slots start at generation 0, so their handles equal the slots.
+        self.active_orders.update(zip(order_ids, range(start, stop)))
+
+    def _new_price_level(self, price):
+        return ArrayPriceLevel(self.instrument.ticks_to_price(price))
@@ -0,0 +1,131 @@
+from bisect import bisect_left, bisect_right
+
+from limit_order_book.price_level_index import IndexNode, PriceLevelIndex
+
+
+class BTree(PriceLevelIndex):
+    """
+    Two-level B+-tree of price levels.
+
+    Leaves are sorted blocks of at most ``2 * leaf_size`` keys, and the
+    index layer holds the first key of every leaf. Price levels number in
+    the thousands at most, so the tree never needs a third level: a lookup
+    is one bisect over the index plus one bisect within a leaf, and every
+    list that is shifted on insert or delete stays short.
+    """
+
+    def __init__(self, leaf_size=64) -> None:
+        self.leaf_size = leaf_size
+        self.firsts = []
+        self.leaf_keys = []
+        self.leaf_nodes = []
+
+    def _leaf(self, key):
+        i = bisect_right(self.firsts, key) - 1
+        return i if i > 0 else 0
+
+    def insert(self, key, value):
+        if not self.firsts:
+            node = IndexNode(key, value)
+            self.firsts.append(key)
+            self.leaf_keys.append([key])
+            self.leaf_nodes.append([node])
+            return node
+
+        i = self._leaf(key)
+        keys = self.leaf_keys[i]
+        j = bisect_left(keys, key)
+        if j < len(keys) and keys[j] == key:
+            node = self.leaf_nodes[i][j]
+            node.value = value
+            return node
+
+        node = IndexNode(key, value)
+        keys.insert(j, key)
+        self.leaf_nodes[i].insert(j, node)
+        if j == 0:
+            self.firsts[i] = key
+
+        if len(keys) > 2 * self.leaf_size:
+            half = self.leaf_size
+            nodes = self.leaf_nodes[i]
+            self.leaf_keys.insert(i + 1, keys[half:])
+            self.leaf_nodes.insert(i + 1, nodes[half:])
+            self.firsts.insert(i + 1, keys[half])
+            del keys[half:]
+            del nodes[half:]
+
+        return node
+
+    def search(self, key):
+        if not self.firsts:
+            return None
+        i = self._leaf(key)
+        keys = self.leaf_keys[i]
+        j = bisect_left(keys, key)
+        if j < len(keys) and keys[j] == key:
+            return self.leaf_nodes[i][j]
+        return None
+
+    def delete(self, key):
+        if not self.firsts:
+            return False
+        i = self._leaf(key)
+        keys = self.leaf_keys[i]
+        j = bisect_left(keys, key)
+        if j == len(keys) or keys[j] != key:
+            return False
+
+        del keys[j]
+        del self.leaf_nodes[i][j]
+        if not keys:
+            del self.firsts[i]
+            del self.leaf_keys[i]
+            del self.leaf_nodes[i]
+        elif j == 0:
+            self.firsts[i] = keys[0]
+        return True
+
+    def get_min(self):
+        return self.leaf_nodes[0][0] if self.leaf_nodes else None
+
+    def bulk_load(self, items):
+        # Leaves are filled to ``leaf_size``, leaving room on both sides of
+        # every leaf for inserts before a split.
+        nodes = [IndexNode(key, value) for key, value in items]
+        for i in range(0, len(nodes), self.leaf_size):
+            leaf_nodes = nodes[i : i + self.leaf_size]
+            self.firsts.append(leaf_nodes[0].key)
+            self.leaf_keys.append([node.key for node in leaf_nodes])
+            self.leaf_nodes.append(leaf_nodes)
+        return nodes
+
+    def pop_min(self):
+        if not self.leaf_nodes:
+            return None
+        keys = self.leaf_keys[0]
+        node = self.leaf_nodes[0].pop(0)
+        del keys[0]
+        if keys:
+            self.firsts[0] = keys[0]
+        else:
+            del self.firsts[0]
+            del self.leaf_keys[0]
+            del self.leaf_nodes[0]
+        return node
+
+    def iter_range(self, lo=None, hi=None):
+        if not self.firsts:
+            return
+        i = 0 if lo is None else self._leaf(lo)
+        j = 0 if lo is None else bisect_left(self.leaf_keys[i], lo)
+        while i < len(self.leaf_nodes):
+            keys = self.leaf_keys[i]
+            nodes = self.leaf_nodes[i]
+            while j < len(keys):
+                if hi is not None and keys[j] > hi:
+                    return
+                yield nodes[j]
+                j += 1
+            i += 1
+            j = 0
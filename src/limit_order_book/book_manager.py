@@ -0,0 +1,285 @@
+import multiprocessing
+import queue
+import threading
+import zlib
+
+from limit_order_book.codec import MessageWriter, decode_responses
+from limit_order_book.gateway import apply_messages
+from limit_order_book.limit_order_book import LimitOrderBook
+
+
+class BookManager:
+    """
+    Books of many symbols, sharded across worker processes.
+
+    Every symbol is pinned to one worker by a stable hash of its name, and
+    each worker owns the books of its symbols, so symbols on different
+    workers match in parallel. Orders are encoded with
+    ``limit_order_book.codec`` as they are submitted and sent to their
+    worker over a pipe, one message holding an encoded buffer per symbol,
+    whenever ``batch_size`` orders are pending for it and on ``flush``. The
+    workers thus match while further orders are still being encoded, and a
+    thread per worker receives their responses (acknowledgements and fills,
+    see ``gateway.apply_messages``), which ``flush`` returns per symbol in
+    submission order.
+
+    With ``num_workers=0`` the books live in the calling process and
+    ``flush`` applies the buffers directly, for comparison.
+
+    Parameters
+    ----------
+    num_workers : int, default 0
+        Number of worker processes, or 0 for single-process mode.
+    batch_size : int, default 4096
+        Number of orders pending for a worker at which they are sent to it
+        before the next flush.
+    book_factory : callable, default LimitOrderBook
+        Creates the book of a new symbol, called with ``book_kwargs``. It is
+        sent to the workers, so it must be picklable when they are started
+        with spawn.
+    mp_context : multiprocessing context, optional
+        Context used to start the workers.
+    **book_kwargs
+        Passed to ``book_factory``, e.g. ``instrument``.
+    """
+
+    def __init__(
+        self,
+        num_workers=0,
+        batch_size=1 << 12,
+        book_factory=LimitOrderBook,
+        mp_context=None,
+        **book_kwargs,
+    ) -> None:
+        self.num_workers = num_workers
+        self.batch_size = batch_size
+        self.book_factory = book_factory
+        self.book_kwargs = book_kwargs
+        # Messages of each symbol not sent to its worker yet.
+        self.pending = {}
+        self.books = {}
+        self.connections = []
+        self.processes = []
+        self.symbol_workers = {}
+        # Per worker: its symbols, the number of orders pending for it, the
+        # number of batches sent since the last flush and the queue its
+        # receiver thread puts the responses to them in.
+        self.worker_symbols = [[] for _ in range(num_workers)]
+        self.num_pending = [0] * num_workers
+        self.num_sent = [0] * num_workers
+        self.replies = [queue.SimpleQueue() for _ in range(num_workers)]
+        self.receivers = []
+        if num_workers:
+            context = mp_context or multiprocessing.get_context()
+            for _ in range(num_workers):
+                connection, worker_connection = context.Pipe()
+                process = context.Process(
+                    target=_run_worker,
+                    args=(worker_connection, book_factory, book_kwargs),
+                    daemon=True,
+                )
+                process.start()
+                worker_connection.close()
+                self.connections.append(connection)
+                self.processes.append(process)
+            # Started once every worker has been forked.
+            for connection, replies in zip(self.connections, self.replies):
+                receiver = threading.Thread(
+                    target=_receive, args=(connection, replies), daemon=True
+                )
+                receiver.start()
+                self.receivers.append(receiver)
+
+    def worker_of(self, symbol):
+        """
+        Return the index of the worker owning ``symbol``, always 0 in
+        single-process mode.
+        """
+        if not self.num_workers:
+            return 0
+        return zlib.crc32(symbol.encode()) % self.num_workers
+
+    def new_order(
+        self,
+        symbol,
+        order_id,
+        order_side,
+        order_price,
+        order_quantity,
+        order_type="limit",
+    ):
+        self._messages(symbol).new_order(
+            order_id, order_side, order_price, order_quantity, order_type
+        )
+
+    def cancel_order(self, symbol, order_id):
+        self._messages(symbol).cancel_order(order_id)
+
+    def amend_order(self, symbol, order_id, new_quantity=None, new_price=None):
+        self._messages(symbol).amend_order(order_id, new_quantity, new_price)
+
+    def flush(self, decode=True):
+        """
+        Apply the orders submitted since the last flush.
+
+        If a worker raised an error while applying its orders, the error is
+        raised here once every worker has answered; the other workers'
+        orders have been applied, and the worker goes on serving.
+
+        Parameters
+        ----------
+        decode : bool, default True
+            Decode the responses with ``codec.decode_responses``; otherwise
+            return the encoded response buffers.
+
+        Returns
+        -------
+        dict
+            The responses of every symbol with orders in this flush, in the
+            order the orders were submitted.
+        """
+
+        if not self.num_workers:
+            pending = {
+                symbol: bytes(messages.getbuffer())
+                for symbol, messages in self.pending.items()
+                if len(messages)
+            }
+            for messages in self.pending.values():
+                messages.clear()
+            output = MessageWriter()
+            responses = {}
+            for symbol, buffer in pending.items():
+                book = self.books.get(symbol)
+                if book is None:
+                    book = self.books[symbol] = self.book_factory(**self.book_kwargs)
+                apply_messages(book, buffer, output)
+                responses[symbol] = bytes(output.getbuffer())
+                output.clear()
+        else:
+            # Every worker gets its last batch before any result is awaited,
+            # so that the workers run in parallel.
+            for worker in range(self.num_workers):
+                if self.num_pending[worker]:
+                    self._send(worker)
+            buffers = {}
+            error = None
+            for worker, replies in enumerate(self.replies):
+                for _ in range(self.num_sent[worker]):
+                    reply = replies.get()
+                    if isinstance(reply, BaseException):
+                        if error is None:
+                            error = reply
+                        if isinstance(reply, EOFError):
+                            # The worker is gone, no more replies will come.
+                            break
+                        continue
+                    for symbol, buffer in reply:
+                        buffers.setdefault(symbol, []).append(buffer)
+                self.num_sent[worker] = 0
+            if error is not None:
+                raise error
+            responses = {
+                symbol: b"".join(symbol_buffers)
+                for symbol, symbol_buffers in buffers.items()
+            }
+
+        if decode:
+            return {
+                symbol: decode_responses(buffer)[0]
+                for symbol, buffer in responses.items()
+            }
+        return responses
+
+    def close(self):
+        """Stop the workers. Orders not flushed are discarded."""
+        for connection in self.connections:
+            try:
+                connection.send(None)
+            except OSError:
+                # The worker has died already; it is still joined below.
+                pass
+        for process in self.processes:
+            process.join()
+        # Receivers stop once their worker has closed its end of the pipe.
+        for receiver in self.receivers:
+            receiver.join()
+        for connection in self.connections:
+            connection.close()
+        self.connections = []
+        self.processes = []
+        self.receivers = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _messages(self, symbol):
+        messages = self.pending.get(symbol)
+        if messages is None:
+            messages = self.pending[symbol] = MessageWriter(capacity=1 << 12)
+            if self.num_workers:
+                worker = self.symbol_workers[symbol] = self.worker_of(symbol)
+                self.worker_symbols[worker].append(symbol)
+        if self.num_workers:
+            # Counted before the message is added, so a full batch is sent
+            # on the next order for its worker or on flush.
+            worker = self.symbol_workers[symbol]
+            if self.num_pending[worker] >= self.batch_size:
+                self._send(worker)
+            self.num_pending[worker] += 1
+        return messages
+
+    def _send(self, worker):
+        batch = []
+        for symbol in self.worker_symbols[worker]:
+            messages = self.pending[symbol]
+            if len(messages):
+                batch.append((symbol, bytes(messages.getbuffer())))
+                messages.clear()
+        self.connections[worker].send(batch)
+        self.num_pending[worker] = 0
+        self.num_sent[worker] += 1
+
+
+def _receive(connection, replies):
+    # Runs in a thread per worker, so that the worker never blocks on a
+    # full pipe while the caller is still sending to it.
+    while True:
+        try:
+            reply = connection.recv()
+        except (EOFError, OSError):
+            replies.put(EOFError("the worker has exited"))
+            return
+        replies.put(reply)
+
+
+def _run_worker(connection, book_factory, book_kwargs):
+    books = {}
+    output = MessageWriter()
+    while True:
+        batch = connection.recv()
+        if batch is None:
+            break
+        responses = []
+        try:
+            for symbol, buffer in batch:
+                book = books.get(symbol)
+                if book is None:
+                    book = books[symbol] = book_factory(**book_kwargs)
+                apply_messages(book, buffer, output)
+                responses.append((symbol, bytes(output.getbuffer())))
+                output.clear()
+        except Exception as error:
+            # Sent back instead of the responses, so that the caller is not
+            # left waiting for them.
+            output.clear()
+            try:
+                connection.send(error)
+            except Exception:
+                connection.send(RuntimeError(repr(error)))
+            continue
+        connection.send(responses)
+    connection.close()
@@ -0,0 +1,278 @@
+"""
+Fixed-width little-endian wire messages for orders and fills.
+
+Every order message is ``ORDER.size`` (56) bytes, every fill message
+``FILL_MESSAGE.size`` (88) bytes and every acknowledgement ``ACK_MESSAGE.size``
+(40) bytes, so a buffer of orders or of fills is decoded with a single
+``struct.iter_unpack`` over a ``memoryview`` of it, without slicing it into
+intermediate bytes objects. Prices travel as an int64 coefficient and an
+int8 exponent as in the journal, and order ids as NUL-padded UTF-8 of at
+most ``ORDER_ID_SIZE`` bytes.
+"""
+
+import struct
+from decimal import Decimal
+
+from limit_order_book.journal import (
+    AMEND,
+    CANCEL,
+    ORDER_TYPE_CODES,
+    PLACE,
+    SIDE_CODES,
+    SIDES,
+    decode_price,
+    encode_price,
+)
+from limit_order_book.order import ORDER_TYPES
+
+FILL = 4
+ACK = 5
+
+# Statuses of acknowledgements.
+ACCEPTED = 0
+REJECTED = 1
+UNKNOWN_ORDER = 2
+
+ORDER_ID_SIZE = 32
+
+# kind, side, order type, price exponent, flags, padding, price coefficient,
+# quantity, order id.
+ORDER = struct.Struct(f"<BBBbB3xqq{ORDER_ID_SIZE}s")
+# kind, price exponent, padding, quantity, price coefficient, buy order id,
+# sell order id.
+FILL_MESSAGE = struct.Struct(f"<Bb6xqq{ORDER_ID_SIZE}s{ORDER_ID_SIZE}s")
+# kind, kind of the acknowledged order message, status, padding, order id.
+ACK_MESSAGE = struct.Struct(f"<BBB5x{ORDER_ID_SIZE}s")
+
+# Set when an order message carries a price: limit orders, and amends that
+# change the price.
+HAS_PRICE = 1
+
+# Distinct prices seen by an encoder or decoder are converted once; the
+# caches are cleared when they grow past this many entries.
+PRICE_CACHE_SIZE = 1 << 12
+
+
+class MessageWriter:
+    """
+    Reusable output buffer of encoded messages.
+
+    Messages are packed into a preallocated ``bytearray`` that doubles when
+    full. ``getbuffer`` returns a view of the messages written since the last
+    ``clear``; the view must be released before the buffer can grow again.
+    """
+
+    def __init__(self, capacity=1 << 16) -> None:
+        self.buffer = bytearray(capacity)
+        self.size = 0
+        self.prices = {}
+
+    def new_order(
+        self,
+        order_id,
+        order_side,
+        order_price,
+        order_quantity,
+        order_type="limit",
+    ):
+        if order_type == "market":
+            flags, coefficient, exponent = 0, 0, 0
+        else:
+            flags = HAS_PRICE
+            coefficient, exponent = self._encode_price(order_price)
+        self._pack(
+            ORDER,
+            PLACE,
+            SIDE_CODES[order_side],
+            ORDER_TYPE_CODES[order_type],
+            exponent,
+            flags,
+            coefficient,
+            order_quantity,
+            _encode_order_id(order_id),
+        )
+
+    def cancel_order(self, order_id):
+        self._pack(ORDER, CANCEL, 0, 0, 0, 0, 0, 0, _encode_order_id(order_id))
+
+    def amend_order(self, order_id, new_quantity=None, new_price=None):
+        # A quantity of 0 leaves the quantity unchanged.
+        if new_price is None:
+            flags, coefficient, exponent = 0, 0, 0
+        else:
+            flags = HAS_PRICE
+            coefficient, exponent = self._encode_price(new_price)
+        self._pack(
+            ORDER,
+            AMEND,
+            0,
+            0,
+            exponent,
+            flags,
+            coefficient,
+            new_quantity or 0,
+            _encode_order_id(order_id),
+        )
+
+    def fill(self, match):
+        """Append a fill given as a ``(buy_id, sell_id, quantity, price)`` match."""
+        buy_order_id, sell_order_id, quantity, price = match
+        coefficient, exponent = self._encode_price(price)
+        self._pack(
+            FILL_MESSAGE,
+            FILL,
+            exponent,
+            quantity,
+            coefficient,
+            _encode_order_id(buy_order_id),
+            _encode_order_id(sell_order_id),
+        )
+
+    def ack(self, order_id, order_kind, status):
+        """Append the acknowledgement of an order message of ``order_kind``."""
+        self._pack(ACK_MESSAGE, ACK, order_kind, status, _encode_order_id(order_id))
+
+    def getbuffer(self):
+        return memoryview(self.buffer)[: self.size]
+
+    def clear(self):
+        self.size = 0
+
+    def __len__(self):
+        return self.size
+
+    def _pack(self, message, *fields):
+        end = self.size + message.size
+        if end > len(self.buffer):
+            self.buffer.extend(bytes(max(len(self.buffer), message.size)))
+        message.pack_into(self.buffer, self.size, *fields)
+        self.size = end
+
+    def _encode_price(self, price):
+        encoded = self.prices.get(price)
+        if encoded is None:
+            if len(self.prices) >= PRICE_CACHE_SIZE:
+                self.prices.clear()
+            encoded = self.prices[price] = encode_price(Decimal(price))
+        return encoded
+
+
+def decode_orders(buffer):
+    """
+    Yield ``(kind, order_id, order_side, order_price, order_quantity,
+    order_type)`` for every order message in ``buffer``, a bytes-like object
+    holding whole messages.
+
+    Cancels have no side, price, quantity or type. Amends carry the new
+    quantity and price, each None if unchanged.
+
+    Raises ValueError for a message of unknown kind, or for a placement
+    other than a market order without a price.
+    """
+
+    prices = {}
+    for (
+        kind,
+        side,
+        order_type,
+        exponent,
+        flags,
+        coefficient,
+        quantity,
+        encoded_order_id,
+    ) in ORDER.iter_unpack(buffer):
+        order_id = encoded_order_id.rstrip(b"\0").decode()
+        price = None
+        if flags & HAS_PRICE:
+            price = prices.get((coefficient, exponent))
+            if price is None:
+                if len(prices) >= PRICE_CACHE_SIZE:
+                    prices.clear()
+                price = prices[coefficient, exponent] = decode_price(
+                    coefficient, exponent
+                )
+        if kind == PLACE:
+            order_side = SIDES[side]
+            order_type = ORDER_TYPES[order_type]
+            if price is None and order_type != "market":
+                raise ValueError(f"{order_type} order {order_id!r} has no price")
+            yield kind, order_id, order_side, price, quantity, order_type
+        elif kind == CANCEL:
+            yield kind, order_id, None, None, None, None
+        elif kind == AMEND:
+            yield kind, order_id, None, price, quantity or None, None
+        else:
+            raise ValueError(f"unknown order message kind {kind}")
+
+
+def decode_fills(buffer):
+    """
+    Yield ``(buy_order_id, sell_order_id, quantity, price)`` for every fill
+    message in ``buffer``, a bytes-like object holding whole messages.
+    """
+
+    for (
+        kind,
+        exponent,
+        quantity,
+        coefficient,
+        encoded_buy_order_id,
+        encoded_sell_order_id,
+    ) in FILL_MESSAGE.iter_unpack(buffer):
+        if kind != FILL:
+            raise ValueError(f"unknown fill message kind {kind}")
+        yield (
+            encoded_buy_order_id.rstrip(b"\0").decode(),
+            encoded_sell_order_id.rstrip(b"\0").decode(),
+            quantity,
+            decode_price(coefficient, exponent),
+        )
+
+
+def decode_responses(buffer):
+    """
+    Decode the acknowledgements and fills at the start of ``buffer``, as
+    written back by ``OrderGateway``.
+
+    Returns
+    -------
+    tuple
+        A list of ``(ACK, order_id, order_kind, status)`` and ``(FILL,
+        buy_order_id, sell_order_id, quantity, price)`` tuples, and the
+        number of bytes they took up. A partial message at the end is left
+        for the caller to complete.
+    """
+
+    responses = []
+    offset = 0
+    size = len(buffer)
+    while offset < size:
+        kind = buffer[offset]
+        if kind == ACK:
+            if offset + ACK_MESSAGE.size > size:
+                break
+            _, order_kind, status, encoded_order_id = ACK_MESSAGE.unpack_from(
+                buffer, offset
+            )
+            responses.append(
+                (ACK, encoded_order_id.rstrip(b"\0").decode(), order_kind, status)
+            )
+            offset += ACK_MESSAGE.size
+        elif kind == FILL:
+            if offset + FILL_MESSAGE.size > size:
+                break
+            (fill,) = decode_fills(buffer[offset : offset + FILL_MESSAGE.size])
+            responses.append((FILL, *fill))
+            offset += FILL_MESSAGE.size
+        else:
+            raise ValueError(f"unknown response message kind {kind}")
+    return responses, offset
+
+
+def _encode_order_id(order_id):
+    encoded_order_id = order_id.encode()
+    if len(encoded_order_id) > ORDER_ID_SIZE:
+        raise ValueError(
+            f"order id {order_id!r} is longer than {ORDER_ID_SIZE} bytes"
+        )
+    return encoded_order_id
@@ -16,8 +16,9 @@ class DoublyLinkedList:
         self.tail.prev = self.head
 
     def append(self, data):
-        new_node = DoublyLinkedListNode(data)
+        return self.append_node(DoublyLinkedListNode(data))
 
+    def append_node(self, new_node):
         last = self.tail.prev
         last.next = new_node
 
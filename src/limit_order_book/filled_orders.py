@@ -0,0 +1,109 @@
+from collections import deque
+
+
+class BloomFilter:
+    """
+    Fixed-size Bloom filter over hashable items.
+
+    ``k`` bit positions are derived from one ``hash()`` call by double
+    hashing, so a lookup costs a single hash regardless of ``k``.
+    """
+
+    __slots__ = ("num_bits", "num_hashes", "bits")
+
+    def __init__(self, num_bits, num_hashes=4) -> None:
+        self.num_bits = num_bits
+        self.num_hashes = num_hashes
+        self.bits = bytearray((num_bits + 7) // 8)
+
+    def add(self, item):
+        h = hash(item)
+        h1 = h & 0xFFFFFFFF
+        h2 = (h >> 32) | 1
+        bits = self.bits
+        for i in range(self.num_hashes):
+            position = (h1 + i * h2) % self.num_bits
+            bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, item):
+        h = hash(item)
+        h1 = h & 0xFFFFFFFF
+        h2 = (h >> 32) | 1
+        bits = self.bits
+        for i in range(self.num_hashes):
+            position = (h1 + i * h2) % self.num_bits
+            if not bits[position >> 3] & (1 << (position & 7)):
+                return False
+        return True
+
+    def clear(self):
+        self.bits = bytearray(len(self.bits))
+
+
+class FilledOrders:
+    """
+    Set of filled order ids with bounded memory.
+
+    Ids are recorded in generations of ``generation_size`` ids. When the
+    current generation is full a new one is started, and once there are
+    more than ``generations`` of them the oldest is dropped. Every id is
+    therefore retained for at least the next ``(generations - 1) *
+    generation_size`` fills, and at most ``generations * generation_size``
+    ids are held at any time.
+
+    With ``bloom_bits`` set, a Bloom filter mirroring the retained ids
+    answers "definitely not filled" before any generation is probed. It is
+    rebuilt from the retained generations whenever one is dropped.
+    """
+
+    def __init__(self, generation_size=1_000_000, generations=2, bloom_bits=0) -> None:
+        if generation_size <= 0 or generations <= 0:
+            raise ValueError("generation_size and generations must be positive")
+
+        self.generation_size = generation_size
+        self.generations = deque([set()], maxlen=generations)
+        self.current = self.generations[-1]
+        self.bloom = BloomFilter(bloom_bits) if bloom_bits else None
+
+    def add(self, order_id):
+        if len(self.current) >= self.generation_size:
+            self._rotate()
+        self.current.add(order_id)
+        if self.bloom is not None:
+            self.bloom.add(order_id)
+
+    def update(self, order_ids):
+        """Add a list of ids, a generation-sized chunk at a time."""
+        start = 0
+        while start < len(order_ids):
+            if len(self.current) >= self.generation_size:
+                self._rotate()
+            stop = start + self.generation_size - len(self.current)
+            chunk = order_ids[start:stop]
+            self.current.update(chunk)
+            if self.bloom is not None:
+                for order_id in chunk:
+                    self.bloom.add(order_id)
+            start = stop
+
+    def __contains__(self, order_id):
+        if self.bloom is not None and order_id not in self.bloom:
+            return False
+        # Recent ids are the ones most likely to be asked about.
+        for generation in reversed(self.generations):
+            if order_id in generation:
+                return True
+        return False
+
+    def __len__(self):
+        return sum(len(generation) for generation in self.generations)
+
+    def _rotate(self):
+        evicting = len(self.generations) == self.generations.maxlen
+        self.current = set()
+        self.generations.append(self.current)
+        if evicting and self.bloom is not None:
+            self.bloom.clear()
+            for generation in self.generations:
+                for order_id in generation:
+                    self.bloom.add(order_id)
@@ -0,0 +1,144 @@
+from array import array
+
+
+class Fills:
+    """
+    Matches in columnar form.
+
+    Row ``i`` of the columns is the match
+    ``(buy_order_ids[i], sell_order_ids[i], quantities[i], prices[i])``,
+    triggered by the order at position ``order_indices[i]`` of its batch.
+    """
+
+    __slots__ = (
+        "buy_order_ids",
+        "sell_order_ids",
+        "quantities",
+        "prices",
+        "order_indices",
+    )
+
+    def __init__(
+        self,
+        buy_order_ids,
+        sell_order_ids,
+        quantities,
+        prices,
+        order_indices,
+    ) -> None:
+        self.buy_order_ids = buy_order_ids
+        self.sell_order_ids = sell_order_ids
+        self.quantities = quantities
+        self.prices = prices
+        self.order_indices = order_indices
+
+    @classmethod
+    def from_matches(cls, matches, order_indices):
+        if not matches:
+            return cls([], [], array("q"), [], order_indices)
+        buy_order_ids, sell_order_ids, quantities, prices = zip(*matches)
+        return cls(
+            list(buy_order_ids),
+            list(sell_order_ids),
+            array("q", quantities),
+            list(prices),
+            order_indices,
+        )
+
+    def __len__(self):
+        return len(self.order_indices)
+
+    def __iter__(self):
+        return zip(
+            self.buy_order_ids, self.sell_order_ids, self.quantities, self.prices
+        )
+
+
+class FillRingBuffer:
+    """
+    FIFO of matches kept in preallocated columns, for use as a fill sink.
+
+    ``append`` stores a match tuple into the next free row and ``pop`` and
+    ``drain`` hand matches back oldest first. Rows are reused as they are
+    consumed, so a consumer keeping up with the book causes no allocation
+    beyond the match tuples themselves. A full buffer doubles its capacity
+    instead of dropping matches or raising in the middle of matching.
+    """
+
+    __slots__ = (
+        "capacity",
+        "buy_order_ids",
+        "sell_order_ids",
+        "quantities",
+        "prices",
+        "start",
+        "size",
+    )
+
+    def __init__(self, capacity=1024) -> None:
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+
+        self.capacity = capacity
+        self.buy_order_ids = [None] * capacity
+        self.sell_order_ids = [None] * capacity
+        self.quantities = array("q", bytes(8 * capacity))
+        self.prices = [None] * capacity
+        # Row of the oldest match and number of buffered matches.
+        self.start = 0
+        self.size = 0
+
+    def append(self, match):
+        if self.size == self.capacity:
+            self._grow()
+        i = self.start + self.size
+        if i >= self.capacity:
+            i -= self.capacity
+        (
+            self.buy_order_ids[i],
+            self.sell_order_ids[i],
+            self.quantities[i],
+            self.prices[i],
+        ) = match
+        self.size += 1
+
+    def pop(self):
+        """Remove and return the oldest match, or None if the buffer is empty."""
+        if not self.size:
+            return None
+        i = self.start
+        match = (
+            self.buy_order_ids[i],
+            self.sell_order_ids[i],
+            self.quantities[i],
+            self.prices[i],
+        )
+        self.buy_order_ids[i] = self.sell_order_ids[i] = self.prices[i] = None
+        self.start = 0 if i + 1 == self.capacity else i + 1
+        self.size -= 1
+        return match
+
+    def drain(self):
+        """Yield and remove the buffered matches, oldest first."""
+        while self.size:
+            yield self.pop()
+
+    def clear(self):
+        while self.size:
+            self.pop()
+        self.start = 0
+
+    def __len__(self):
+        return self.size
+
+    def _grow(self):
+        # Unroll the buffered rows to the front of columns twice the size.
+        order = [(self.start + k) % self.capacity for k in range(self.size)]
+        extra = self.capacity
+        self.buy_order_ids = [self.buy_order_ids[i] for i in order] + [None] * extra
+        self.sell_order_ids = [self.sell_order_ids[i] for i in order] + [None] * extra
+        self.quantities = array("q", [self.quantities[i] for i in order])
+        self.quantities.extend(array("q", bytes(8 * extra)))
+        self.prices = [self.prices[i] for i in order] + [None] * extra
+        self.capacity += extra
+        self.start = 0
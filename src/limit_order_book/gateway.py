@@ -0,0 +1,284 @@
+import asyncio
+
+from limit_order_book.codec import (
+    ACCEPTED,
+    ORDER,
+    REJECTED,
+    UNKNOWN_ORDER,
+    MessageWriter,
+    decode_orders,
+    decode_responses,
+)
+from limit_order_book.journal import CANCEL, PLACE
+
+
+class OrderGateway:
+    """
+    Asyncio server applying streams of encoded order messages (see
+    ``limit_order_book.codec``) to one book.
+
+    Every connection has a reader task that takes whatever bytes are
+    readable at each wakeup and queues the complete messages among them.
+    A single matching task drains every chunk queued at that point, from all
+    connections, and applies them to the book as one batch without yielding
+    to the event loop. Each order message is answered with an acknowledgement
+    followed by the fills it triggered, and every connection gets the
+    responses of a batch with a single ``writelines`` call. A fill is also
+    sent to the connection that placed the resting order, if that is another
+    one that is still open.
+
+    Backpressure is bounded at both ends: readers wait while
+    ``max_queued_chunks`` chunks are queued, which stops reading from their
+    sockets, and a connection whose unread output exceeds
+    ``max_unread_bytes`` after a batch is aborted, so that a slow reader
+    never holds up the others.
+
+    A connection that sends a malformed message, or whose messages raise
+    any other error, is closed; the messages before the faulty one have
+    been applied and answered. Chunks it still has queued are dropped, and
+    the other connections are served as usual.
+    """
+
+    def __init__(
+        self, book, max_queued_chunks=64, read_size=1 << 16, max_unread_bytes=1 << 22
+    ) -> None:
+        self.book = book
+        self.read_size = read_size
+        self.max_unread_bytes = max_unread_bytes
+        self.queue = asyncio.Queue(max_queued_chunks)
+        self.server = None
+        self.matcher = None
+        # Reader task of every connection the gateway has not closed yet.
+        self.connections = {}
+        self.num_messages = 0
+        self.num_batches = 0
+
+    async def start_unix(self, path):
+        """Listen on the Unix socket ``path`` and return the server."""
+        self.server = await asyncio.start_unix_server(self._handle_connection, path)
+        self.matcher = asyncio.create_task(self._match())
+        return self.server
+
+    async def start_tcp(self, host="127.0.0.1", port=0):
+        """Listen on ``host`` and ``port`` (0 for any free port)."""
+        self.server = await asyncio.start_server(self._handle_connection, host, port)
+        self.matcher = asyncio.create_task(self._match())
+        return self.server
+
+    async def close(self):
+        """
+        Stop listening and close every connection. Responses not yet sent
+        are dropped.
+        """
+
+        if self.server is not None:
+            self.server.close()
+        if self.matcher is not None:
+            self.matcher.cancel()
+            try:
+                await self.matcher
+            except asyncio.CancelledError:
+                pass
+        # ``wait_closed`` also waits for open connections, so they are
+        # closed first.
+        readers = list(self.connections.values())
+        for writer, reader_task in self.connections.items():
+            reader_task.cancel()
+            writer.transport.abort()
+        self.connections.clear()
+        await asyncio.gather(*readers, return_exceptions=True)
+        if self.server is not None:
+            await self.server.wait_closed()
+
+    async def _handle_connection(self, reader, writer):
+        self.connections[writer] = asyncio.current_task()
+        pending = bytearray()
+        try:
+            while True:
+                data = await reader.read(self.read_size)
+                if not data:
+                    break
+                pending += data
+                complete = len(pending) - len(pending) % ORDER.size
+                if complete == len(pending):
+                    chunk, pending = pending, bytearray()
+                elif complete:
+                    chunk = pending[:complete]
+                    del pending[:complete]
+                else:
+                    continue
+                await self.queue.put((writer, chunk))
+        except ConnectionError:
+            pass
+        # Closing is queued behind the connection's last chunk, so that its
+        # responses are written first.
+        await self.queue.put((writer, None))
+
+    async def _match(self):
+        queue = self.queue
+        outputs = {}
+        # Output of the connection that placed each resting order.
+        owners = {}
+        # Connections closed by the gateway whose readers have not queued
+        # their end yet. Chunks they queued before that are dropped.
+        dead = set()
+        while True:
+            batch = [await queue.get()]
+            while not queue.empty():
+                batch.append(queue.get_nowait())
+
+            # Connections whose readers ended, and connections to close after
+            # an error.
+            ended = set()
+            closing = set()
+            for writer, chunk in batch:
+                if chunk is None:
+                    if writer in dead:
+                        dead.discard(writer)
+                    else:
+                        ended.add(writer)
+                    continue
+                if writer in closing or writer in dead:
+                    continue
+                output = outputs.get(writer)
+                if output is None:
+                    output = outputs[writer] = MessageWriter()
+                try:
+                    self.num_messages += apply_messages(
+                        self.book, chunk, output, owners
+                    )
+                except Exception:
+                    # Malformed messages, or any other error they raise, end
+                    # the connection but not the gateway.
+                    closing.add(writer)
+            self.num_batches += 1
+
+            slow = set()
+            for writer, output in outputs.items():
+                if output.size:
+                    # Copied, since the transport may hold on to what it is
+                    # given while the output buffer is reused.
+                    writer.writelines([bytes(output.getbuffer())])
+                    output.clear()
+                    transport = writer.transport
+                    if transport.get_write_buffer_size() > self.max_unread_bytes:
+                        transport.abort()
+                        slow.add(writer)
+            for writer in ended | closing | slow:
+                output = outputs.pop(writer, None)
+                if output is not None:
+                    for order_id in [
+                        order_id
+                        for order_id, owner in owners.items()
+                        if owner is output
+                    ]:
+                        del owners[order_id]
+                self.connections.pop(writer, None)
+                writer.close()
+                if writer not in ended:
+                    dead.add(writer)
+
+
+def apply_messages(book, buffer, output, owners=None):
+    """
+    Apply a buffer of order messages to ``book`` and write the responses to
+    ``output``, a ``MessageWriter``: an acknowledgement per message followed
+    by the fills the message triggered. Returns the number of messages.
+
+    ``owners`` optionally maps the ids of resting orders to the output of
+    whoever placed them. Fills against those orders are then also written to
+    that output, if it is not ``output``, and the orders these messages leave
+    resting are entered into it.
+
+    Raises ValueError or IndexError for malformed messages; the messages
+    before them have been applied and answered.
+    """
+
+    place_order = book._place_order
+    cancel_order = book.cancel_order
+    active_orders = book.active_orders
+    ack = output.ack
+    fill = output.fill
+    num_messages = 0
+    for (
+        kind,
+        order_id,
+        order_side,
+        order_price,
+        order_quantity,
+        order_type,
+    ) in decode_orders(buffer):
+        num_messages += 1
+        matches = []
+        if kind == PLACE:
+            try:
+                place_order(
+                    order_id,
+                    order_side,
+                    order_price,
+                    order_quantity,
+                    matches.append,
+                    order_type,
+                )
+                status = ACCEPTED
+            except ValueError:
+                status = REJECTED
+        elif kind == CANCEL:
+            status = ACCEPTED if cancel_order(order_id) else UNKNOWN_ORDER
+        else:
+            try:
+                matches = book.amend_order(order_id, order_quantity, order_price)
+                status = UNKNOWN_ORDER if matches is None else ACCEPTED
+            except ValueError:
+                matches = None
+                status = REJECTED
+        ack(order_id, kind, status)
+        if matches:
+            for match in matches:
+                fill(match)
+        if owners is not None:
+            if matches:
+                for match in matches:
+                    resting_id = match[1]
+                    owner = owners.get(resting_id)
+                    if owner is None:
+                        continue
+                    if owner is not output:
+                        owner.fill(match)
+                    if resting_id not in active_orders:
+                        del owners[resting_id]
+            if status == ACCEPTED:
+                if order_id in active_orders:
+                    owners[order_id] = output
+                else:
+                    owners.pop(order_id, None)
+    return num_messages
+
+
+async def read_responses(reader, count, buffer=None):
+    """
+    Read from ``reader`` until ``count`` responses have been decoded, or the
+    connection is closed, and return them as decoded by
+    ``codec.decode_responses``.
+
+    Parameters
+    ----------
+    reader : asyncio.StreamReader
+    count : int
+    buffer : bytearray, optional
+        Bytes received but not yet decoded, carried over between calls.
+    """
+
+    if buffer is None:
+        buffer = bytearray()
+    responses = []
+    while True:
+        decoded, consumed = decode_responses(buffer)
+        responses.extend(decoded)
+        del buffer[:consumed]
+        if len(responses) >= count:
+            return responses
+        data = await reader.read(1 << 16)
+        if not data:
+            return responses
+        buffer += data
@@ -0,0 +1,92 @@
+from decimal import ROUND_CEILING, ROUND_FLOOR, Decimal
+
+TICK_CACHE_SIZE = 1 << 16
+
+
+class Instrument:
+    """
+    Per-instrument price and size granularity.
+
+    A book configured with an instrument converts prices to integer tick
+    counts once when an order enters, runs matching and price-level keying
+    on plain ints, and converts back to ``Decimal`` only for reported prices.
+    """
+
+    __slots__ = ("tick_size", "lot_size", "_ticks")
+
+    def __init__(self, tick_size, lot_size=1) -> None:
+        self.tick_size = _to_decimal(tick_size)
+        self.lot_size = lot_size
+        self._ticks = {}
+
+        if self.tick_size <= 0:
+            raise ValueError(f"tick size must be positive, got {tick_size}")
+        if lot_size <= 0:
+            raise ValueError(f"lot size must be positive, got {lot_size}")
+
+    def price_to_ticks(self, price):
+        """
+        Parameters
+        ----------
+        price : Decimal, int, float or str
+            A price that lies on the tick grid.
+
+        Returns
+        -------
+        int
+            The price expressed as a number of ticks.
+
+        Raises
+        ------
+        ValueError
+            If the price is not a multiple of the tick size.
+        """
+
+        # Instruments trade in a narrow band, so most prices have been seen
+        # before and the Decimal division is skipped.
+        ticks = self._ticks.get(price)
+        if ticks is not None:
+            return ticks
+
+        ticks, remainder = divmod(_to_decimal(price), self.tick_size)
+        if remainder:
+            raise ValueError(
+                f"price {price} is not a multiple of tick size {self.tick_size}"
+            )
+        if len(self._ticks) >= TICK_CACHE_SIZE:
+            self._ticks.clear()
+        ticks = self._ticks[price] = int(ticks)
+        return ticks
+
+    def price_range_to_ticks(self, lo, hi):
+        """
+        Returns
+        -------
+        tuple of int
+            The smallest and largest tick counts whose prices lie within
+            ``[lo, hi]``; ``lo`` and ``hi`` need not be on the tick grid.
+        """
+
+        lo_ticks = _to_decimal(lo) / self.tick_size
+        hi_ticks = _to_decimal(hi) / self.tick_size
+        return (
+            int(lo_ticks.to_integral_value(rounding=ROUND_CEILING)),
+            int(hi_ticks.to_integral_value(rounding=ROUND_FLOOR)),
+        )
+
+    def ticks_to_price(self, ticks):
+        return ticks * self.tick_size
+
+    def check_quantity(self, quantity) -> None:
+        if self.lot_size != 1 and quantity % self.lot_size:
+            raise ValueError(
+                f"quantity {quantity} is not a multiple of lot size {self.lot_size}"
+            )
+
+
+def _to_decimal(value):
+    # Floats go through their shortest repr so that 99.99 means Decimal("99.99")
+    # rather than its exact binary expansion.
+    if isinstance(value, float):
+        return Decimal(repr(value))
+    return Decimal(value)
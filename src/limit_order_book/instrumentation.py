@@ -0,0 +1,273 @@
+from time import perf_counter_ns
+
+from limit_order_book.latency_histogram import LatencyHistogram
+from limit_order_book.price_level_index import PriceLevelIndex
+
+COUNTERS = (
+    "orders_placed",
+    "orders_matched",
+    "levels_created",
+    "levels_deleted",
+    "skip_list_nodes_traversed",
+    "cancels",
+    "cancels_unknown",
+    "cancels_filled",
+    "amends",
+)
+
+# Timed phases. ``place_order`` and ``cancel_order`` cover whole calls and
+# include the phases below them; the time of the matching loop itself is what
+# ``place_order`` spends outside the index, level creation and sweeps. The
+# extra skip-list walks that count traversed nodes are left out of all of
+# them.
+PHASES = (
+    "place_order",
+    "cancel_order",
+    "index_search",
+    "index_insert",
+    "index_remove",
+    "new_price_level",
+    "sweep_level",
+)
+
+QUANTILES = (("p50", 0.5), ("p99", 0.99), ("p999", 0.999))
+
+
+class BookMetrics:
+    """
+    Counters and per-phase latency histograms of an instrumented book.
+
+    All state has a fixed size: counters are plain ints and latencies (in
+    nanoseconds) and matches per placed order go into ``LatencyHistogram``
+    buckets, however long the book runs.
+    """
+
+    __slots__ = ("counters", "latencies", "matches_per_order")
+
+    def __init__(self) -> None:
+        self.counters = dict.fromkeys(COUNTERS, 0)
+        self.latencies = {phase: LatencyHistogram() for phase in PHASES}
+        self.matches_per_order = LatencyHistogram()
+
+    def snapshot(self):
+        """
+        Return the metrics as a flat dict of numbers, e.g. for a metrics
+        scraper.
+
+        Counters keep their names. Every histogram contributes ``_count``,
+        ``_sum``, ``_p50``, ``_p99``, ``_p999`` and ``_max`` entries, prefixed
+        ``<phase>_ns`` for latencies and ``matches_per_order`` for the number
+        of matches per placed order. Quantiles of empty histograms are 0.
+        """
+
+        snapshot = dict(self.counters)
+        histograms = [(f"{phase}_ns", self.latencies[phase]) for phase in PHASES]
+        histograms.append(("matches_per_order", self.matches_per_order))
+        for prefix, histogram in histograms:
+            snapshot[f"{prefix}_count"] = histogram.count
+            snapshot[f"{prefix}_sum"] = histogram.total
+            for label, quantile in QUANTILES:
+                value = histogram.value_at_quantile(quantile)
+                snapshot[f"{prefix}_{label}"] = 0 if value is None else value
+            snapshot[f"{prefix}_max"] = histogram.max or 0
+        return snapshot
+
+    def reset(self):
+        for name in self.counters:
+            self.counters[name] = 0
+        for histogram in self.latencies.values():
+            histogram.reset()
+        self.matches_per_order.reset()
+
+
+def instrument_book(book, metrics):
+    """
+    Wrap the entry points of ``book`` and of its price-level indexes with
+    versions that update ``metrics``.
+
+    The wrappers are bound to the instance, on top of whatever is bound there
+    already (e.g. journaling), so books that are not instrumented keep the
+    plain methods and pay nothing.
+    """
+
+    counters = metrics.counters
+    latencies = metrics.latencies
+    # Nanoseconds spent counting traversed nodes, which the enclosing
+    # placement or cancel subtracts from its own time.
+    untimed = [0]
+    for index in (book.buy_orders, book.sell_orders):
+        _instrument_index(index, metrics, untimed)
+
+    # An amend cancels and places the order again internally; those calls
+    # are counted as one amend, not as a cancel and a placement.
+    amending = False
+
+    place_order = book._place_order
+    record_place_time = latencies["place_order"].record
+    record_matches = metrics.matches_per_order.record
+
+    def instrumented_place_order(
+        order_id,
+        order_side,
+        order_price,
+        order_quantity,
+        append_match,
+        order_type="limit",
+    ):
+        if amending:
+            return place_order(
+                order_id,
+                order_side,
+                order_price,
+                order_quantity,
+                append_match,
+                order_type,
+            )
+        num_matches = 0
+
+        def count_match(match):
+            nonlocal num_matches
+            num_matches += 1
+            append_match(match)
+
+        untimed_before = untimed[0]
+        start = perf_counter_ns()
+        handle = place_order(
+            order_id, order_side, order_price, order_quantity, count_match, order_type
+        )
+        record_place_time(perf_counter_ns() - start - (untimed[0] - untimed_before))
+        counters["orders_placed"] += 1
+        counters["orders_matched"] += num_matches
+        record_matches(num_matches)
+        return handle
+
+    cancel_order = book.cancel_order
+    record_cancel_time = latencies["cancel_order"].record
+
+    def instrumented_cancel_order(order_id):
+        untimed_before = untimed[0]
+        start = perf_counter_ns()
+        cancelled = cancel_order(order_id)
+        record_cancel_time(perf_counter_ns() - start - (untimed[0] - untimed_before))
+        if cancelled:
+            counters["cancels"] += 1
+        elif order_id in book.filled_orders:
+            counters["cancels_filled"] += 1
+        else:
+            counters["cancels_unknown"] += 1
+        return cancelled
+
+    cancel_handle = book.cancel_handle
+
+    def instrumented_cancel_handle(handle):
+        untimed_before = untimed[0]
+        start = perf_counter_ns()
+        cancelled = cancel_handle(handle)
+        record_cancel_time(perf_counter_ns() - start - (untimed[0] - untimed_before))
+        if cancelled:
+            counters["cancels"] += 1
+        else:
+            counters["cancels_unknown"] += 1
+        return cancelled
+
+    amend_order = book._amend_order
+
+    def instrumented_amend_order(state, new_quantity, new_price):
+        nonlocal amending
+        amending = True
+        try:
+            matches = amend_order(state, new_quantity, new_price)
+        finally:
+            amending = False
+        counters["amends"] += 1
+        return matches
+
+    new_price_level = book._new_price_level
+    record_new_level_time = latencies["new_price_level"].record
+
+    def instrumented_new_price_level(price):
+        start = perf_counter_ns()
+        price_level = new_price_level(price)
+        record_new_level_time(perf_counter_ns() - start)
+        counters["levels_created"] += 1
+        return price_level
+
+    sweep_level = book._sweep_level
+    record_sweep_time = latencies["sweep_level"].record
+
+    def instrumented_sweep_level(price_level, order_id, is_buy, append_match):
+        start = perf_counter_ns()
+        sweep_level(price_level, order_id, is_buy, append_match)
+        record_sweep_time(perf_counter_ns() - start)
+
+    book._place_order = instrumented_place_order
+    book.cancel_order = instrumented_cancel_order
+    book.cancel_handle = instrumented_cancel_handle
+    book._amend_order = instrumented_amend_order
+    book._new_price_level = instrumented_new_price_level
+    book._sweep_level = instrumented_sweep_level
+
+
+def _instrument_index(index, metrics, untimed):
+    counters = metrics.counters
+    latencies = metrics.latencies
+    # Counting the nodes a search visits walks the index a second time, so
+    # it happens outside the timed call and its own time goes to ``untimed``.
+    traversal_length = getattr(index, "traversal_length", None)
+
+    def count_traversal(key):
+        start = perf_counter_ns()
+        counters["skip_list_nodes_traversed"] += traversal_length(key)
+        untimed[0] += perf_counter_ns() - start
+
+    search = index.search
+    record_search_time = latencies["index_search"].record
+
+    def instrumented_search(key):
+        if traversal_length is not None:
+            count_traversal(key)
+        start = perf_counter_ns()
+        node = search(key)
+        record_search_time(perf_counter_ns() - start)
+        return node
+
+    insert = index.insert
+    record_insert_time = latencies["index_insert"].record
+
+    def instrumented_insert(key, value):
+        if traversal_length is not None:
+            count_traversal(key)
+        start = perf_counter_ns()
+        node = insert(key, value)
+        record_insert_time(perf_counter_ns() - start)
+        return node
+
+    delete = index.delete
+    pop_min = index.pop_min
+    record_remove_time = latencies["index_remove"].record
+
+    def instrumented_delete(key):
+        if traversal_length is not None:
+            count_traversal(key)
+        start = perf_counter_ns()
+        deleted = delete(key)
+        record_remove_time(perf_counter_ns() - start)
+        if deleted:
+            counters["levels_deleted"] += 1
+        return deleted
+
+    def instrumented_pop_min():
+        start = perf_counter_ns()
+        node = pop_min()
+        record_remove_time(perf_counter_ns() - start)
+        if node is not None:
+            counters["levels_deleted"] += 1
+        return node
+
+    index.search = instrumented_search
+    index.insert = instrumented_insert
+    index.delete = instrumented_delete
+    # The default ``pop_min`` removes through ``delete``, which already
+    # counts and times the removal.
+    if type(index).pop_min is not PriceLevelIndex.pop_min:
+        index.pop_min = instrumented_pop_min
@@ -0,0 +1,190 @@
+import os
+import struct
+from decimal import Decimal
+
+from limit_order_book.order import ORDER_TYPES
+
+# kind, side, price exponent, order type, sequence, price coefficient,
+# quantity, order id (UTF-8, NUL padded).
+RECORD = struct.Struct("<BBbBQqq36s")
+
+PLACE = 1
+CANCEL = 2
+AMEND = 3
+
+SIDES = ("buy", "sell")
+SIDE_CODES = {"buy": 0, "sell": 1}
+ORDER_TYPE_CODES = {order_type: code for code, order_type in enumerate(ORDER_TYPES)}
+
+FSYNC_POLICIES = ("always", "batch", "never")
+
+
+def encode_price(price):
+    """Split a ``Decimal`` price into an int64 coefficient and int8 exponent."""
+    exponent = price.as_tuple().exponent
+    coefficient = int(price.scaleb(-exponent))
+    if not (-(1 << 63) <= coefficient < 1 << 63 and -128 <= exponent < 128):
+        raise ValueError(f"price {price} cannot be stored exactly")
+    return coefficient, exponent
+
+
+def decode_price(coefficient, exponent):
+    return Decimal(coefficient).scaleb(exponent)
+
+
+class Journal:
+    """
+    Append-only journal of accepted book operations.
+
+    Every record is ``RECORD.size`` (64) bytes: the operation, its sequence
+    number, and for placements the side, price and quantity. In-place
+    amends record the new quantity. Prices are
+    stored as an int64 coefficient and an int8 exponent, so they round-trip
+    as the exact ``Decimal`` the book used.
+
+    Records are packed into a preallocated buffer of ``batch_size`` records
+    that is written out when full, on ``flush`` and on ``close``. The
+    ``fsync`` policy decides durability: ``"always"`` writes and fsyncs every
+    record, ``"batch"`` fsyncs every time the buffer is written, and
+    ``"never"`` leaves it to the operating system.
+
+    Opening an existing journal truncates a partial record at its end, left
+    by a crash during a write, so that new records stay aligned.
+    """
+
+    def __init__(self, path, fsync="batch", batch_size=1024) -> None:
+        if fsync not in FSYNC_POLICIES:
+            raise ValueError(f"fsync must be one of {FSYNC_POLICIES}, got {fsync!r}")
+
+        self.path = path
+        self.fsync = fsync
+        self.batch_size = 1 if fsync == "always" else batch_size
+        self.buffer = bytearray(RECORD.size * self.batch_size)
+        self.num_buffered = 0
+        self.file = open(path, "ab")
+        size = self.file.tell()
+        if size % RECORD.size:
+            self.file.truncate(size - size % RECORD.size)
+
+    def append_place(
+        self,
+        sequence,
+        order_id,
+        order_side,
+        order_price,
+        order_quantity,
+        order_type="limit",
+    ):
+        # Market orders have no price.
+        coefficient, exponent = (
+            (0, 0) if order_price is None else encode_price(order_price)
+        )
+        self._append(
+            PLACE,
+            SIDE_CODES[order_side],
+            exponent,
+            ORDER_TYPE_CODES[order_type],
+            sequence,
+            coefficient,
+            order_quantity,
+            order_id,
+        )
+
+    def append_cancel(self, sequence, order_id):
+        self._append(CANCEL, 0, 0, 0, sequence, 0, 0, order_id)
+
+    def append_amend(self, sequence, order_id, order_quantity):
+        self._append(AMEND, 0, 0, 0, sequence, 0, order_quantity, order_id)
+
+    def _append(
+        self,
+        kind,
+        side,
+        exponent,
+        order_type,
+        sequence,
+        coefficient,
+        quantity,
+        order_id,
+    ):
+        encoded_order_id = order_id.encode()
+        if len(encoded_order_id) > 36:
+            raise ValueError(f"order id {order_id!r} is longer than 36 bytes")
+        RECORD.pack_into(
+            self.buffer,
+            self.num_buffered * RECORD.size,
+            kind,
+            side,
+            exponent,
+            order_type,
+            sequence,
+            coefficient,
+            quantity,
+            encoded_order_id,
+        )
+        self.num_buffered += 1
+        if self.num_buffered == self.batch_size:
+            self.flush()
+
+    def flush(self):
+        if self.num_buffered:
+            self.file.write(memoryview(self.buffer)[: self.num_buffered * RECORD.size])
+            self.num_buffered = 0
+        self.file.flush()
+        if self.fsync != "never":
+            os.fsync(self.file.fileno())
+
+    def close(self):
+        if not self.file.closed:
+            self.flush()
+            self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def read_journal(path, chunk_records=4096):
+    """
+    Yield ``(kind, sequence, order_id, order_side, order_price,
+    order_quantity, order_type)`` for every complete record of a journal.
+    A partial record at the end, left by a crash during a write, is ignored.
+    """
+
+    chunk_size = RECORD.size * chunk_records
+    with open(path, "rb") as file:
+        while True:
+            chunk = file.read(chunk_size)
+            complete = len(chunk) - len(chunk) % RECORD.size
+            for (
+                kind,
+                side,
+                exponent,
+                order_type,
+                sequence,
+                coefficient,
+                quantity,
+                encoded_order_id,
+            ) in RECORD.iter_unpack(chunk[:complete]):
+                order_id = encoded_order_id.rstrip(b"\0").decode()
+                if kind == PLACE:
+                    order_type = ORDER_TYPES[order_type]
+                    yield (
+                        kind,
+                        sequence,
+                        order_id,
+                        SIDES[side],
+                        None
+                        if order_type == "market"
+                        else decode_price(coefficient, exponent),
+                        quantity,
+                        order_type,
+                    )
+                elif kind == AMEND:
+                    yield kind, sequence, order_id, None, None, quantity, None
+                else:
+                    yield kind, sequence, order_id, None, None, None, None
+            if len(chunk) < chunk_size:
+                return
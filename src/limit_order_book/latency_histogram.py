@@ -0,0 +1,150 @@
+import math
+from array import array
+
+
+class LatencyHistogram:
+    """
+    Histogram of non-negative integer values, such as latencies in
+    nanoseconds, in fixed memory.
+
+    Buckets are log-linear: every power of two is split into
+    ``2 ** (precision_bits - 1)`` equal buckets and values below
+    ``2 ** precision_bits`` are counted exactly, so a quantile is reported
+    within a relative error of ``2 ** (1 - precision_bits)`` whatever the
+    number of recorded values. Values of ``2 ** max_value_bits`` or more are
+    counted in the last bucket; the exact minimum and maximum are kept
+    separately.
+    """
+
+    __slots__ = (
+        "precision_bits",
+        "half_bucket_count",
+        "counts",
+        "count",
+        "total",
+        "min",
+        "max",
+    )
+
+    def __init__(self, precision_bits=7, max_value_bits=40) -> None:
+        if not 1 <= precision_bits <= max_value_bits:
+            raise ValueError("precision_bits must be between 1 and max_value_bits")
+
+        self.precision_bits = precision_bits
+        self.half_bucket_count = 1 << (precision_bits - 1)
+        num_buckets = (max_value_bits - precision_bits + 2) * self.half_bucket_count
+        self.counts = array("q", bytes(8 * num_buckets))
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = None
+
+    def record(self, value, count=1):
+        """
+        Record ``value`` ``count`` times.
+
+        Parameters
+        ----------
+        value : int
+            Non-negative value, truncated to an integer.
+        count : int
+            Number of occurrences.
+        """
+
+        value = int(value)
+        if value < 0:
+            raise ValueError("value must be non-negative")
+
+        shift = value.bit_length() - self.precision_bits
+        if shift <= 0:
+            index = value
+        else:
+            index = shift * self.half_bucket_count + (value >> shift)
+        if index >= len(self.counts):
+            index = len(self.counts) - 1
+        self.counts[index] += count
+
+        self.count += count
+        self.total += value * count
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+
+    def value_at_quantile(self, quantile):
+        """
+        Return the upper bound of the bucket holding the ``quantile``-th
+        value, capped at the maximum recorded value, or None if the
+        histogram is empty.
+
+        Parameters
+        ----------
+        quantile : float
+            Quantile between 0 and 1, e.g. 0.99 for the 99th percentile.
+        """
+
+        if not self.count:
+            return None
+        if not 0 <= quantile <= 1:
+            raise ValueError("quantile must be between 0 and 1")
+
+        rank = max(1, math.ceil(quantile * self.count))
+        seen = 0
+        last_index = len(self.counts) - 1
+        for index, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= rank:
+                if index == last_index:
+                    # The last bucket also holds values beyond its bounds.
+                    return self.max
+                return min(self._bucket_upper_bound(index), self.max)
+        return self.max
+
+    def mean(self):
+        return self.total / self.count if self.count else None
+
+    def merge(self, other):
+        """Add the values recorded by ``other``, of the same bucket layout."""
+        if len(other.counts) != len(self.counts) or (
+            other.precision_bits != self.precision_bits
+        ):
+            raise ValueError("histograms have different bucket layouts")
+        if not other.count:
+            return
+
+        counts = self.counts
+        for index, bucket_count in enumerate(other.counts):
+            if bucket_count:
+                counts[index] += bucket_count
+        self.count += other.count
+        self.total += other.total
+        self.min = other.min if self.min is None else min(self.min, other.min)
+        self.max = other.max if self.max is None else max(self.max, other.max)
+
+    def reset(self):
+        self.counts = array("q", bytes(8 * len(self.counts)))
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = None
+
+    def summary(self):
+        """Return count, mean, p50, p99, p99.9 and max as a dict."""
+        return {
+            "count": self.count,
+            "mean": self.mean(),
+            "p50": self.value_at_quantile(0.5),
+            "p99": self.value_at_quantile(0.99),
+            "p999": self.value_at_quantile(0.999),
+            "max": self.max,
+        }
+
+    def __len__(self):
+        return self.count
+
+    def _bucket_upper_bound(self, index):
+        shift = index // self.half_bucket_count - 1
+        if shift <= 0:
+            return index
+        mantissa = index - shift * self.half_bucket_count
+        return ((mantissa + 1) << shift) - 1
@@ -1,22 +1,367 @@
-from limit_order_book.doubly_linked_list import DoublyLinkedList
-from limit_order_book.order import Order
+import gc
+from array import array
+from decimal import Decimal
+from itertools import islice, repeat
+
+from limit_order_book.codec import decode_orders
+from limit_order_book.doubly_linked_list import DoublyLinkedList, DoublyLinkedListNode
+from limit_order_book.fills import Fills
+from limit_order_book.instrument import _to_decimal
+from limit_order_book.instrumentation import BookMetrics, instrument_book
+from limit_order_book.journal import AMEND, CANCEL, PLACE, read_journal
+from limit_order_book.object_pool import ObjectPool
+from limit_order_book.order import ORDER_TYPES, Order
+from limit_order_book.order_records import SLOT_BITS, SLOT_MASK, OrderRecords
 from limit_order_book.skip_list import SkipList
+from limit_order_book.snapshot import read_snapshot, write_snapshot
+
+# Limit key of market orders, which cross every level.
+MARKET_LIMIT_KEY = float("inf")
 
 
 class PriceLevel:
-    __slots__ = ("price", "queue")
+    __slots__ = ("price", "queue", "quantity", "order_count")
 
     def __init__(self, price) -> None:
         self.price = price
         self.queue = DoublyLinkedList()
+        # Aggregates over the resting orders in the queue, kept up to date by
+        # the book so that level sizes never require a traversal.
+        self.quantity = 0
+        self.order_count = 0
+
+    def reset(self, price):
+        # Only empty levels are pooled, so the queue and aggregates are
+        # already in their initial state.
+        self.price = price
 
 
 class LimitOrderBook:
-    def __init__(self) -> None:
-        self.sell_orders = SkipList()
-        self.buy_orders = SkipList()
+    def __init__(
+        self,
+        instrument=None,
+        price_index=SkipList,
+        filled_orders=set,
+        pooling=False,
+        journal=None,
+        instrumented=False,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        instrument : Instrument, optional
+            When given, prices are converted to integer tick counts on entry
+            and all matching and price-level keys use plain ints. Reported
+            prices are converted back to ``Decimal``. Without an instrument,
+            prices are kept as ``Decimal`` throughout.
+        price_index : callable, default SkipList
+            Factory returning a ``PriceLevelIndex`` for each side's price
+            levels: ``SkipList``, ``SortedArray``, ``BTree`` or, with an
+            instrument, ``PriceLadder`` (e.g.
+            ``functools.partial(PriceLadder, window=1024)``).
+        filled_orders : callable, default set
+            Factory for the container of filled order ids, which makes
+            ``cancel_order`` refuse ids that have been filled. The default
+            set grows without bound; ``FilledOrders`` keeps only a window of
+            recent fills (e.g.
+            ``functools.partial(FilledOrders, generation_size=1_000_000)``).
+        pooling : bool, default False
+            Reuse ``Order``, ``PriceLevel``, list nodes and skip-list nodes
+            released by fills, cancels and level removal instead of leaving
+            them to the garbage collector. Pooled objects are recycled, so
+            callers must not hold on to levels returned by ``best_bid`` and
+            similar accessors across book operations.
+        journal : Journal, optional
+            Record every accepted placement and successful cancel, so that
+            the book can be rebuilt with ``recover``.
+        instrumented : bool, default False
+            Keep counters and per-phase latency histograms, read with
+            ``metrics_snapshot``. Instrumented methods are swapped in for
+            this book only, so books without instrumentation pay nothing.
+        """
+
+        self.instrument = instrument
+        self.sell_orders = price_index()
+        self.buy_orders = price_index()
+        if instrument is None and self.sell_orders.integer_keys:
+            raise ValueError(
+                f"{type(self.sell_orders).__name__} requires an instrument"
+            )
+        # Maps the id of each resting order to its handle in ``records``.
         self.active_orders = {}
-        self.filled_orders = set()
+        self.records = OrderRecords()
+        self.filled_orders = filled_orders()
+
+        self.order_pool = None
+        self.price_level_pool = None
+        self.list_node_pool = None
+        if pooling:
+            self.order_pool = ObjectPool(Order)
+            self.price_level_pool = ObjectPool(PriceLevel, reset=PriceLevel.reset)
+            self.list_node_pool = ObjectPool(DoublyLinkedListNode)
+            self.buy_orders.enable_pooling()
+            self.sell_orders.enable_pooling()
+
+        # Receives the matches of ``submit_order``; see ``set_fill_sink``.
+        self.fill_sink = None
+
+        # Sequence number of the last journaled operation.
+        self.sequence = 0
+        self.journal = None
+        if journal is not None:
+            self._attach_journal(journal)
+
+        self.metrics = None
+        if instrumented:
+            self._instrument()
+
+    @classmethod
+    def recover(cls, journal_path, journal=None, snapshot_path=None, **kwargs):
+        """
+        Rebuilds a book by replaying a journal.
+
+        Parameters
+        ----------
+        journal_path : str or os.PathLike
+            The journal to replay.
+        journal : Journal, optional
+            Journal the recovered book records further operations to,
+            usually one reopened on ``journal_path``. Sequence numbers
+            continue from the last replayed record.
+        snapshot_path : str or os.PathLike, optional
+            A snapshot to load first. Only journal records newer than the
+            snapshot are replayed.
+        **kwargs
+            Passed on to the constructor. With ``instrumented=True`` the
+            metrics only count operations after the replay.
+
+        Returns
+        -------
+        LimitOrderBook
+            A book in the state the journaled operations left it in. Fills
+            produced during the replay are discarded.
+        """
+
+        instrumented = kwargs.pop("instrumented", False)
+        if snapshot_path is None:
+            book = cls(**kwargs)
+        else:
+            book = cls.load(snapshot_path, **kwargs)
+        place_order = book._place_order
+        cancel_order = book.cancel_order
+        for record in read_journal(journal_path):
+            kind, sequence, order_id, side, price, quantity, order_type = record
+            if sequence <= book.sequence:
+                continue
+            if kind == PLACE:
+                place_order(order_id, side, price, quantity, _discard_match, order_type)
+            elif kind == AMEND:
+                book.amend_order(order_id, quantity)
+            else:
+                cancel_order(order_id)
+            book.sequence = sequence
+        if journal is not None:
+            book._attach_journal(journal)
+        if instrumented:
+            book._instrument()
+        return book
+
+    def snapshot(self, path):
+        """
+        Writes the resting orders to a snapshot file.
+
+        Each side is stored best level first with its orders in time
+        priority, together with the journal sequence number, so that
+        ``load`` can rebuild the book without matching. Filled order ids are
+        not part of the snapshot.
+
+        Parameters
+        ----------
+        path : str or os.PathLike
+            The file to write.
+        """
+
+        write_snapshot(
+            path,
+            self.sequence,
+            [
+                self._snapshot_side(self.buy_orders),
+                self._snapshot_side(self.sell_orders),
+            ],
+        )
+
+    @classmethod
+    def load(cls, path, **kwargs):
+        """
+        Rebuilds a book from a snapshot written by ``snapshot``.
+
+        Price levels arrive sorted, so each side index is bulk-built in one
+        pass and every FIFO queue is linked directly, in time linear in the
+        number of orders. The constant factor is set by creating an
+        ``Order`` and a list node per order; ``ArrayLimitOrderBook`` fills
+        its columns by slice assignment instead and is the storage to use
+        when load time matters.
+
+        Parameters
+        ----------
+        path : str or os.PathLike
+            The snapshot to load.
+        **kwargs
+            Passed on to the constructor. With ``instrumented=True`` the
+            metrics only count operations after the load.
+
+        Returns
+        -------
+        LimitOrderBook
+        """
+
+        instrumented = kwargs.pop("instrumented", False)
+        book = cls(**kwargs)
+        sequence, (buy_side, sell_side) = read_snapshot(path)
+        # Loading only allocates objects that stay alive, so collections
+        # triggered along the way would scan the growing book for nothing.
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            book._load_side(True, book.buy_orders, *buy_side)
+            book._load_side(False, book.sell_orders, *sell_side)
+        finally:
+            if gc_enabled:
+                gc.enable()
+        book.sequence = sequence
+        if instrumented:
+            book._instrument()
+        return book
+
+    def _snapshot_side(self, index):
+        levels = []
+        order_ids = []
+        quantities = array("q")
+        for node in index.iter_range():
+            price_level = node.value
+            levels.append((price_level.price, price_level.order_count))
+            for order in price_level.queue:
+                order_ids.append(order.order_id)
+                quantities.append(order.order_quantity)
+        return levels, order_ids, quantities
+
+    def _load_side(self, is_buy, index, levels, order_ids, quantities):
+        order_side = "buy" if is_buy else "sell"
+        prices = []
+        items = []
+        for price, _ in levels:
+            if self.instrument is not None:
+                price = self.instrument.price_to_ticks(price)
+            prices.append(price)
+            items.append((-price if is_buy else price, self._new_price_level(price)))
+        level_nodes = index.bulk_load(items)
+
+        records = self.records
+        active_orders = self.active_orders
+        start = 0
+        for level_node, price, (_, order_count) in zip(level_nodes, prices, levels):
+            stop = start + order_count
+            level_ids = order_ids[start:stop]
+            level_quantities = quantities[start:stop]
+            order_nodes = list(
+                map(
+                    DoublyLinkedListNode,
+                    map(
+                        Order,
+                        level_ids,
+                        repeat(order_side, order_count),
+                        repeat(price, order_count),
+                        level_quantities,
+                    ),
+                )
+            )
+            price_level = level_node.value
+            queue = price_level.queue
+            previous = queue.head
+            for order_node in order_nodes:
+                previous.next = order_node
+                order_node.prev = previous
+                previous = order_node
+            previous.next = queue.tail
+            queue.tail.prev = previous
+            price_level.quantity = sum(level_quantities)
+            price_level.order_count = order_count
+            active_orders.update(
+                zip(level_ids, records.extend(order_nodes, level_node))
+            )
+            start = stop
+
+    def _instrument(self):
+        # Instrumentation wraps the journaled entry points, if any, so the
+        # journal must be attached first.
+        self.metrics = BookMetrics()
+        instrument_book(self, self.metrics)
+
+    def _attach_journal(self, journal):
+        # Journaling wraps the instance's entry points instead of adding a
+        # check to every call, so books without a journal pay nothing.
+        self.journal = journal
+        self._place_order = self._journaled_place_order
+        self._cancel_slot = self._journaled_cancel_slot
+        self._reduce_order = self._journaled_reduce_order
+
+    def _journaled_place_order(
+        self,
+        order_id,
+        order_side,
+        order_price,
+        order_quantity,
+        append_match,
+        order_type="limit",
+    ):
+        if order_side in ("buy", "sell"):
+            # The record is written ahead of matching and carries the price
+            # as the book will store it; invalid prices and quantities are
+            # rejected here so that a journaled order always replays.
+            instrument = self.instrument
+            if order_type == "market":
+                price = None
+            elif instrument is None:
+                price = Decimal(order_price)
+            else:
+                price = instrument.ticks_to_price(
+                    instrument.price_to_ticks(order_price)
+                )
+            if instrument is not None:
+                instrument.check_quantity(order_quantity)
+            if order_type not in ORDER_TYPES:
+                raise ValueError(
+                    f"order_type must be one of {ORDER_TYPES}, got {order_type!r}"
+                )
+            self.journal.append_place(
+                self.sequence + 1,
+                order_id,
+                order_side,
+                price,
+                order_quantity,
+                order_type,
+            )
+            self.sequence += 1
+        return type(self)._place_order(
+            self,
+            order_id,
+            order_side,
+            order_price,
+            order_quantity,
+            append_match,
+            order_type,
+        )
+
+    def _journaled_cancel_slot(self, slot, handle):
+        order_id = type(self)._cancel_slot(self, slot, handle)
+        self.sequence += 1
+        self.journal.append_cancel(self.sequence, order_id)
+        return order_id
+
+    def _journaled_reduce_order(self, order_id, handle, order_quantity):
+        type(self)._reduce_order(self, order_id, handle, order_quantity)
+        self.sequence += 1
+        self.journal.append_amend(self.sequence, order_id, order_quantity)
 
     def place_order(
         self,
@@ -24,6 +369,8 @@ class LimitOrderBook:
         order_side,
         order_price,
         order_quantity,
+        return_handle=False,
+        order_type="limit",
     ):
         """
         Parameters
@@ -33,9 +380,22 @@ class LimitOrderBook:
         order_side : {'buy', 'sell'}
             The side of the order.
         order_price : Decimal
-            The price at which the order is placed.
+            The price at which the order is placed. With an instrument, it
+            must lie on the instrument's tick grid. Ignored for market
+            orders.
         order_quantity : int
-            The quantity of the asset to be bought or sold.
+            The quantity of the asset to be bought or sold. With an
+            instrument, it must be a multiple of the lot size.
+        return_handle : bool, default False
+            Also return the integer handle of the order, which
+            ``cancel_handle`` and ``amend_handle`` accept.
+        order_type : {'limit', 'market', 'ioc', 'fok'}, default 'limit'
+            What happens to quantity that does not match on entry: a limit
+            order rests it in the book. A market order matches at any price
+            and an immediate-or-cancel ('ioc') order up to its price, and
+            the rest is cancelled. A fill-or-kill ('fok') order is matched
+            only if it can fill completely up to its price, and otherwise
+            cancelled without matching.
 
         Returns
         -------
@@ -44,110 +404,676 @@ class LimitOrderBook:
             (buy_order_id, sell_order_id, quantity, price).
             - If no matches occur, an empty list is returned.
             - If matches occur, each tuple represents a transaction between a buy and sell order.
+        tuple
+            (handle, matches) if ``return_handle`` is set. The handle is None
+            if the order was fully filled on entry.
         """
 
-        order = Order(order_id, order_side, order_price, order_quantity)
         matches = []
+        handle = self._place_order(
+            order_id,
+            order_side,
+            order_price,
+            order_quantity,
+            matches.append,
+            order_type,
+        )
+        if return_handle:
+            return handle, matches
+        return matches
+
+    def set_fill_sink(self, fill_sink):
+        """
+        Registers where ``submit_order`` delivers matches.
+
+        Parameters
+        ----------
+        fill_sink : callable or None
+            Called with each match tuple (buy_order_id, sell_order_id,
+            quantity, price) as it occurs, e.g. a callback or the ``append``
+            method of a ``FillRingBuffer``. The sink runs in the middle of
+            matching and must not call back into the book.
+        """
+
+        self.fill_sink = fill_sink
+
+    def submit_order(
+        self, order_id, order_side, order_price, order_quantity, order_type="limit"
+    ):
+        """
+        Places an order and pushes its matches to the registered fill sink.
+
+        Takes the same parameters as ``place_order``. No result container is
+        built, so an order that does not cross allocates nothing beyond its
+        own resting state.
+
+        Returns
+        -------
+        int or None
+            The handle of the resting order, or None if the order was fully
+            filled on entry.
+        """
+
+        fill_sink = self.fill_sink
+        if fill_sink is None:
+            raise ValueError("no fill sink registered, see set_fill_sink")
+        return self._place_order(
+            order_id, order_side, order_price, order_quantity, fill_sink, order_type
+        )
+
+    def place_order_iter(
+        self, order_id, order_side, order_price, order_quantity, order_type="limit"
+    ):
+        """
+        Places an order and returns an iterator over its matches.
+
+        Takes the same parameters as ``place_order``. The order is placed
+        when this is called, whether or not the iterator is consumed. The
+        matches are still collected into a list first; to avoid building
+        one on large sweeps, use ``submit_order`` with a fill sink such as
+        ``FillRingBuffer.append``.
+
+        Returns
+        -------
+        iterator of tuple
+            (buy_order_id, sell_order_id, quantity, price) for each match.
+        """
+
+        matches = []
+        self._place_order(
+            order_id,
+            order_side,
+            order_price,
+            order_quantity,
+            matches.append,
+            order_type,
+        )
+        return iter(matches)
+
+    def place_orders(self, order_ids, order_sides, order_prices, order_quantities):
+        """
+        Places a batch of orders given as parallel columns.
 
-        if order.order_side == "buy":
-            while order.order_quantity > 0:
-                # 1) Find lowest price level in skip list.
-                best_sell_order_node = self.sell_orders.get_min()
-                if not best_sell_order_node:
-                    break
-                best_sell_order_price = best_sell_order_node.value.price
-                # 2) Check if a match is possible.
-                if order.order_price >= best_sell_order_price:
-                    price_level = best_sell_order_node.value
-                    if price_level.queue.is_empty():
-                        self.sell_orders.delete(best_sell_order_price)
-                        continue
-                    # 3) Process first order in doubly linked list at lowest price level.
-                    resting_node = price_level.queue.head.next
-                    resting_order = resting_node.data
-                    matched_quantity = min(order.order_quantity, resting_order.order_quantity)
-                    order.order_quantity -= matched_quantity
-                    resting_order.order_quantity -= matched_quantity
-                    matches.append(
-                        (
-                            order_id,
-                            resting_order.order_id,
-                            matched_quantity,
-                            best_sell_order_price,
-                        )
+        Orders are processed in sequence with the same semantics as
+        ``place_order``. The columns may be any sequences of equal length,
+        including NumPy arrays. Float prices, e.g. from a float64 column, are
+        read through their shortest repr, so 99.97 means ``Decimal("99.97")``
+        rather than its binary expansion.
+
+        Parameters
+        ----------
+        order_ids : sequence of str
+        order_sides : sequence of {'buy', 'sell'}
+        order_prices : sequence of Decimal, str or float
+        order_quantities : sequence of int
+
+        Returns
+        -------
+        Fills
+            The matches of the whole batch in columnar form, in the order
+            they occurred. ``Fills.order_indices`` holds the position in the
+            batch of the order that triggered each match.
+        """
+
+        columns = [
+            column.tolist() if hasattr(column, "tolist") else column
+            for column in (order_ids, order_sides, order_prices, order_quantities)
+        ]
+        if len({len(column) for column in columns}) > 1:
+            raise ValueError("order columns must have the same length")
+        if any(type(price) is float for price in columns[2]):
+            columns[2] = [
+                _to_decimal(price) if type(price) is float else price
+                for price in columns[2]
+            ]
+
+        matches = []
+        append = matches.append
+        place_order = self._place_order
+        order_indices = array("q")
+        num_matches = 0
+        for i, order in enumerate(zip(*columns)):
+            place_order(*order, append)
+            if len(matches) != num_matches:
+                order_indices.extend([i] * (len(matches) - num_matches))
+                num_matches = len(matches)
+
+        return Fills.from_matches(matches, order_indices)
+
+    def process_messages(self, buffer, append_match=None):
+        """
+        Applies a buffer of encoded order messages (see
+        ``limit_order_book.codec``) in sequence.
+
+        Parameters
+        ----------
+        buffer : bytes-like
+            Whole order messages, e.g. a ``memoryview`` of a receive buffer.
+        append_match : callable, optional
+            Called with each match, e.g. ``MessageWriter.fill`` to encode
+            the fills straight into an output buffer.
+
+        Returns
+        -------
+        list of tuple or None
+            The matches of the whole buffer in the order they occurred, or
+            None when ``append_match`` is given.
+        """
+
+        matches = None
+        if append_match is None:
+            matches = []
+            append_match = matches.append
+        place_order = self._place_order
+        cancel_order = self.cancel_order
+        for (
+            kind,
+            order_id,
+            order_side,
+            order_price,
+            order_quantity,
+            order_type,
+        ) in decode_orders(buffer):
+            if kind == PLACE:
+                place_order(
+                    order_id,
+                    order_side,
+                    order_price,
+                    order_quantity,
+                    append_match,
+                    order_type,
+                )
+            elif kind == CANCEL:
+                cancel_order(order_id)
+            else:
+                amend_matches = self.amend_order(order_id, order_quantity, order_price)
+                if amend_matches:
+                    for match in amend_matches:
+                        append_match(match)
+        return matches
+
+    def _place_order(
+        self,
+        order_id,
+        order_side,
+        order_price,
+        order_quantity,
+        append_match,
+        order_type="limit",
+    ):
+        instrument = self.instrument
+        if order_type == "market":
+            order_price = None
+        elif instrument is None:
+            order_price = Decimal(order_price)
+        else:
+            order_price = instrument.price_to_ticks(order_price)
+        if instrument is not None:
+            instrument.check_quantity(order_quantity)
+
+        if order_side == "buy":
+            is_buy = True
+            opposite_orders = self.sell_orders
+            own_orders = self.buy_orders
+        elif order_side == "sell":
+            is_buy = False
+            opposite_orders = self.buy_orders
+            own_orders = self.sell_orders
+        else:
+            return
+
+        # Bids are keyed by negated price, so on both sides the best level is
+        # the minimum and a level crosses the incoming order when its key is
+        # at most ``limit_key``.
+        if order_price is None:
+            limit_key = MARKET_LIMIT_KEY
+        elif is_buy:
+            limit_key = order_price
+        else:
+            limit_key = -order_price
+        if order_type != "limit" and not self._check_order_type(
+            order_type, opposite_orders, limit_key, order_quantity
+        ):
+            return None
+
+        pooled = self.order_pool is not None
+        remaining_quantity = order_quantity
+        while remaining_quantity > 0:
+            # 1) Find the best price level on the opposite side.
+            best_node = opposite_orders.get_min()
+            # 2) Check if a match is possible.
+            if best_node is None or best_node.key > limit_key:
+                break
+            price_level = best_node.value
+            if remaining_quantity >= price_level.quantity:
+                # 3a) The order covers the whole level: fill all its orders in
+                # one pass and remove the level at once.
+                remaining_quantity -= price_level.quantity
+                self._sweep_level(price_level, order_id, is_buy, append_match)
+                opposite_orders.pop_min()
+                if pooled:
+                    self.price_level_pool.release(price_level)
+                continue
+            # 3b) Process first order in doubly linked list at the best price level.
+            resting_node = price_level.queue.head.next
+            resting_order = resting_node.data
+            matched_quantity = min(remaining_quantity, resting_order.order_quantity)
+            remaining_quantity -= matched_quantity
+            resting_order.order_quantity -= matched_quantity
+            price_level.quantity -= matched_quantity
+            if is_buy:
+                append_match(
+                    (
+                        order_id,
+                        resting_order.order_id,
+                        matched_quantity,
+                        price_level.price,
                     )
-                    # 4) If match was a full match update auxiliary structures.
-                    if resting_order.order_quantity == 0:
-                        price_level.queue.remove(resting_node)
-                        self.active_orders.pop(resting_order.order_id, None)
-                        self.filled_orders.add(resting_order.order_id)
-                    if price_level.queue.is_empty():
-                        self.sell_orders.delete(best_sell_order_price)
-                else:
-                    break
-            # 5) If the match was partial then the remaining
-            # part of the order joins buy orders either on a new price level
-            # or at then end of the queue of an existing price level.
-            if order.order_quantity > 0:
-                key = -order.order_price
-                node = self.buy_orders.search(key)
-                if not node:
-                    price_level = PriceLevel(order.order_price)
-                    node = self.buy_orders.insert(key, price_level)
-                else:
-                    price_level = node.value
-                order_node = price_level.queue.append(order)
-                self.active_orders[order_id] = ("buy", key, node, order_node)
+                )
             else:
-                self.filled_orders.add(order_id)
-            return matches
-
-        # 6) This part is analogous to "buy logic"
-        elif order.order_side == "sell":
-            while order.order_quantity > 0:
-                best_buy_order_node = self.buy_orders.get_min()
-                if not best_buy_order_node:
-                    break
-                best_buy_order_price = -best_buy_order_node.key
-                if order.order_price <= best_buy_order_price:
-                    price_level = best_buy_order_node.value
-                    if price_level.queue.is_empty():
-                        self.buy_orders.delete(best_buy_order_node.key)
-                        continue
-                    resting_node = price_level.queue.head.next
-                    resting_order = resting_node.data
-                    matched_quantity = min(order.order_quantity, resting_order.order_quantity)
-                    order.order_quantity -= matched_quantity
-                    resting_order.order_quantity -= matched_quantity
-                    matches.append(
-                        (
-                            resting_order.order_id,
-                            order_id,
-                            matched_quantity,
-                            best_buy_order_price,
-                        )
+                append_match(
+                    (
+                        resting_order.order_id,
+                        order_id,
+                        matched_quantity,
+                        price_level.price,
                     )
-                    if resting_order.order_quantity == 0:
-                        price_level.queue.remove(resting_node)
-                        self.active_orders.pop(resting_order.order_id, None)
-                        self.filled_orders.add(resting_order.order_id)
-                    if price_level.queue.is_empty():
-                        self.buy_orders.delete(best_buy_order_node.key)
-                else:
-                    break
-            if order.order_quantity > 0:
-                key = order.order_price
-                node = self.sell_orders.search(key)
-                if not node:
-                    price_level = PriceLevel(order.order_price)
-                    node = self.sell_orders.insert(key, price_level)
-                else:
-                    price_level = node.value
-                order_node = price_level.queue.append(order)
-                self.active_orders[order_id] = ("sell", key, node, order_node)
+                )
+            # 4) If match was a full match update auxiliary structures.
+            if resting_order.order_quantity == 0:
+                price_level.queue.remove(resting_node)
+                price_level.order_count -= 1
+                handle = self.active_orders.pop(resting_order.order_id, None)
+                if handle is not None:
+                    self.records.release(handle)
+                self.filled_orders.add(resting_order.order_id)
+                if price_level.order_count == 0:
+                    # The drained level is the best one, so it is removed
+                    # without a search.
+                    opposite_orders.pop_min()
+                    if pooled:
+                        self.price_level_pool.release(price_level)
+                if pooled:
+                    self.list_node_pool.release(resting_node)
+                    self.order_pool.release(resting_order)
+
+        # 5) If the match was partial then the remaining
+        # part of the order joins its side either on a new price level
+        # or at then end of the queue of an existing price level.
+        if remaining_quantity > 0:
+            # Only limit orders rest; other remainders are cancelled before
+            # any level or node is allocated for them.
+            if order_type != "limit":
+                return None
+            own_key = -limit_key
+            node = own_orders.search(own_key)
+            if not node:
+                price_level = self._new_price_level(order_price)
+                node = own_orders.insert(own_key, price_level)
+            else:
+                price_level = node.value
+            if pooled:
+                order = self.order_pool.acquire(
+                    order_id, order_side, order_price, remaining_quantity
+                )
+                order_node = self.list_node_pool.acquire(order)
+            else:
+                order = Order(order_id, order_side, order_price, remaining_quantity)
+                order_node = DoublyLinkedListNode(order)
+            price_level.queue.append_node(order_node)
+            price_level.quantity += remaining_quantity
+            price_level.order_count += 1
+            handle = self.records.add(order_node, node)
+            self.active_orders[order_id] = handle
+            return handle
+        self.filled_orders.add(order_id)
+        return None
+
+    def _sweep_level(self, price_level, order_id, is_buy, append_match):
+        # Fills every order queued at ``price_level`` and empties the level;
+        # removing it from its index is left to the caller.
+        price = price_level.price
+        queue = price_level.queue
+        tail = queue.tail
+        pop_handle = self.active_orders.pop
+        release = self.records.release
+        pooled = self.order_pool is not None
+        filled_order_ids = []
+        resting_node = queue.head.next
+        while resting_node is not tail:
+            resting_order = resting_node.data
+            resting_order_id = resting_order.order_id
+            if is_buy:
+                append_match(
+                    (order_id, resting_order_id, resting_order.order_quantity, price)
+                )
+            else:
+                append_match(
+                    (resting_order_id, order_id, resting_order.order_quantity, price)
+                )
+            handle = pop_handle(resting_order_id, None)
+            if handle is not None:
+                release(handle)
+            filled_order_ids.append(resting_order_id)
+            # Clearing the back link leaves no reference cycles in the
+            # detached chain, so it is freed without the cyclic GC.
+            next_node = resting_node.next
+            resting_node.prev = None
+            if pooled:
+                self.list_node_pool.release(resting_node)
+                self.order_pool.release(resting_order)
+            resting_node = next_node
+
+        # Detach the whole chain from the queue's sentinels in O(1).
+        queue.head.next = tail
+        tail.prev = queue.head
+        price_level.quantity = 0
+        price_level.order_count = 0
+        self.filled_orders.update(filled_order_ids)
+
+    @staticmethod
+    def _check_order_type(order_type, opposite_orders, limit_key, order_quantity):
+        # Whether an order that must not rest may start matching.
+        if order_type == "fok":
+            # Fill-or-kill: the level aggregates within the limit must cover
+            # the whole quantity, or no resting order is touched.
+            for node in opposite_orders.iter_range(None, limit_key):
+                order_quantity -= node.value.quantity
+                if order_quantity <= 0:
+                    return True
+            return False
+        if order_type in ("market", "ioc"):
+            return True
+        raise ValueError(f"order_type must be one of {ORDER_TYPES}, got {order_type!r}")
+
+    def best_bid(self):
+        """
+        Returns
+        -------
+        PriceLevel or None
+            The highest bid level, or None if there are no bids.
+        """
+
+        node = self.buy_orders.get_min()
+        return node.value if node else None
+
+    def best_ask(self):
+        """
+        Returns
+        -------
+        PriceLevel or None
+            The lowest ask level, or None if there are no asks.
+        """
+
+        node = self.sell_orders.get_min()
+        return node.value if node else None
+
+    def spread(self):
+        """
+        Returns
+        -------
+        Decimal or None
+            Best ask price minus best bid price, or None if either side is
+            empty.
+        """
+
+        bid_node = self.buy_orders.get_min()
+        ask_node = self.sell_orders.get_min()
+        if bid_node is None or ask_node is None:
+            return None
+        return ask_node.value.price - bid_node.value.price
+
+    def top_of_book(self):
+        """
+        Returns
+        -------
+        tuple
+            (bid_price, bid_quantity, ask_price, ask_quantity). The price and
+            quantity of an empty side are None.
+        """
+
+        bid_node = self.buy_orders.get_min()
+        ask_node = self.sell_orders.get_min()
+        bid = bid_node.value if bid_node else None
+        ask = ask_node.value if ask_node else None
+        return (
+            bid.price if bid else None,
+            bid.quantity if bid else None,
+            ask.price if ask else None,
+            ask.quantity if ask else None,
+        )
+
+    def depth(self, side, levels=10):
+        """
+        Aggregated depth of the best price levels of one side.
+
+        Parameters
+        ----------
+        side : {'buy', 'sell'}
+            The side of the book.
+        levels : int
+            The maximum number of price levels to return.
+
+        Returns
+        -------
+        tuple
+            (prices, quantities, order_counts), best level first: a list of
+            Decimal prices and two ``array('q')`` columns.
+        """
+
+        return self._depth(islice(self._side_index(side).iter_range(), levels))
+
+    def depth_range(self, side, lo, hi):
+        """
+        Aggregated depth of the price levels of one side priced within
+        ``[lo, hi]``.
+
+        Parameters
+        ----------
+        side : {'buy', 'sell'}
+            The side of the book.
+        lo, hi : Decimal
+            The inclusive price bounds.
+
+        Returns
+        -------
+        tuple
+            (prices, quantities, order_counts), best level first, as in
+            ``depth``.
+        """
+
+        index = self._side_index(side)
+        if self.instrument is None:
+            lo, hi = Decimal(lo), Decimal(hi)
+        else:
+            lo, hi = self.instrument.price_range_to_ticks(lo, hi)
+
+        if side == "buy":
+            return self._depth(index.iter_range(-hi, -lo))
+        return self._depth(index.iter_range(lo, hi))
+
+    def _side_index(self, side):
+        if side == "buy":
+            return self.buy_orders
+        if side == "sell":
+            return self.sell_orders
+        raise ValueError(f"side must be 'buy' or 'sell', got {side!r}")
+
+    @staticmethod
+    def _depth(nodes):
+        prices = []
+        quantities = array("q")
+        order_counts = array("q")
+        for node in nodes:
+            price_level = node.value
+            prices.append(price_level.price)
+            quantities.append(price_level.quantity)
+            order_counts.append(price_level.order_count)
+        return prices, quantities, order_counts
+
+    def pool_stats(self):
+        """
+        Returns
+        -------
+        dict or None
+            Per-pool counts of created and reused objects and of objects
+            waiting in the freelist, or None if pooling is disabled.
+        """
+
+        if self.order_pool is None:
+            return None
+        stats = {
+            "orders": self.order_pool.stats(),
+            "price_levels": self.price_level_pool.stats(),
+            "list_nodes": self.list_node_pool.stats(),
+        }
+        index_stats = [
+            index.pool_stats() for index in (self.buy_orders, self.sell_orders)
+        ]
+        if None not in index_stats:
+            stats["index_nodes"] = {
+                name: sum(side_stats[name] for side_stats in index_stats)
+                for name in index_stats[0]
+            }
+        return stats
+
+    def metrics_snapshot(self):
+        """
+        Returns
+        -------
+        dict or None
+            Counters and per-phase latency quantiles as a flat dict of
+            numbers (see ``BookMetrics.snapshot``), or None if the book is
+            not instrumented.
+        """
+
+        if self.metrics is None:
+            return None
+        return self.metrics.snapshot()
+
+    def _new_price_level(self, price):
+        # Levels carry the reported Decimal price so that fills never have to
+        # convert ticks back on the matching path.
+        if self.instrument is not None:
+            price = self.instrument.ticks_to_price(price)
+        if self.price_level_pool is None:
+            return PriceLevel(price)
+        return self.price_level_pool.acquire(price)
+
+    def amend_order(self, order_id, new_quantity=None, new_price=None):
+        """
+        Changes the quantity and/or price of a resting order.
+
+        Reducing the quantity at the same price edits the order in place and
+        keeps its time priority. Any other change cancels the order and
+        places it again under the same order id with the new price and
+        quantity, at the back of its queue; at a new price it may match.
+        The new values are validated before the order is touched.
+
+        Parameters
+        ----------
+        order_id : str
+            The unique identifier of the order.
+        new_quantity : int, optional
+            The new remaining quantity. Defaults to the current one.
+        new_price : Decimal, optional
+            The new price. Defaults to the current one.
+
+        Returns
+        -------
+        list of tuple or None
+            The matches triggered by a price change, as returned by
+            ``place_order`` (empty for an in-place amend), or None if the
+            order is not resting in the book.
+        """
+
+        state = self._order_state(order_id)
+        if state is None:
+            return None
+        return self._amend_order(state, new_quantity, new_price)
+
+    def amend_handle(self, handle, new_quantity=None, new_price=None):
+        """
+        Amends the resting order with the handle returned for it by
+        ``place_order``, as ``amend_order`` does by order id.
+
+        Returns None if the handle is stale: the order was filled,
+        cancelled or amended to a new price since.
+        """
+
+        state = self._handle_state(handle)
+        if state is None:
+            return None
+        return self._amend_order(state, new_quantity, new_price)
+
+    def _amend_order(self, state, new_quantity, new_price):
+        order_id, handle, order_side, order_price, order_quantity = state
+
+        if new_quantity is None:
+            new_quantity = order_quantity
+        elif new_quantity <= 0:
+            raise ValueError("new_quantity must be positive, use cancel_order")
+        instrument = self.instrument
+        if new_price is None:
+            same_price = True
+            new_price = order_price
+        else:
+            if instrument is None:
+                new_price = Decimal(new_price)
             else:
-                self.filled_orders.add(order_id)
-            return matches
+                new_price = instrument.price_to_ticks(new_price)
+            same_price = new_price == order_price
+        if instrument is not None:
+            instrument.check_quantity(new_quantity)
+
+        if same_price and new_quantity <= order_quantity:
+            if new_quantity < order_quantity:
+                self._reduce_order(order_id, handle, new_quantity)
+            return []
+
+        self._cancel_slot(handle & SLOT_MASK, handle)
+        if instrument is not None:
+            new_price = instrument.ticks_to_price(new_price)
+        matches = []
+        self._place_order(order_id, order_side, new_price, new_quantity, matches.append)
+        return matches
+
+    def _order_state(self, order_id):
+        # (order id, handle, side, price in book units, remaining quantity)
+        # of a resting order, or None.
+        handle = self.active_orders.get(order_id)
+        if handle is None:
+            return None
+        order = self.records.order_nodes[handle & SLOT_MASK].data
+        return (
+            order.order_id,
+            handle,
+            order.order_side,
+            order.order_price,
+            order.order_quantity,
+        )
+
+    def _handle_state(self, handle):
+        # As ``_order_state``, for the order with a handle.
+        slot = self.records.slot(handle)
+        if slot is None:
+            return None
+        order = self.records.order_nodes[slot].data
+        return (
+            order.order_id,
+            handle,
+            order.order_side,
+            order.order_price,
+            order.order_quantity,
+        )
+
+    def _reduce_order(self, order_id, handle, order_quantity):
+        slot = handle & SLOT_MASK
+        order = self.records.order_nodes[slot].data
+        self.records.level_nodes[slot].value.quantity -= (
+            order.order_quantity - order_quantity
+        )
+        order.order_quantity = order_quantity
 
     def cancel_order(self, order_id):
         """
@@ -164,20 +1090,68 @@ class LimitOrderBook:
             True if the order was successfully canceled, False if the order was not found or filled.
         """
 
-        if order_id in self.filled_orders:
+        # Unknown ids are the common failure, so they are rejected before the
+        # filled-order lookup.
+        handle = self.active_orders.get(order_id)
+        if handle is None:
             return False
-
-        if order_id not in self.active_orders:
+        if order_id in self.filled_orders:
             return False
+        self._cancel_slot(handle & SLOT_MASK, handle)
+        return True
 
-        side, key, price_level_node, order_node = self.active_orders[order_id]
-        price_level_node.value.queue.remove(order_node)
+    def _cancel_slot(self, slot, handle):
+        # Unlinks the resting order in ``slot`` and returns its id.
+        records = self.records
+        order_node = records.order_nodes[slot]
+        price_level = records.level_nodes[slot].value
+        order = order_node.data
+        order_id = order.order_id
+        price_level.queue.remove(order_node)
+        price_level.quantity -= order.order_quantity
+        price_level.order_count -= 1
         del self.active_orders[order_id]
+        records.release(handle)
 
-        if price_level_node.value.queue.is_empty():
-            if side == "buy":
-                self.buy_orders.delete(key)
+        if price_level.order_count == 0:
+            if order.order_side == "buy":
+                self.buy_orders.delete(-order.order_price)
             else:
-                self.sell_orders.delete(key)
+                self.sell_orders.delete(order.order_price)
+            if self.price_level_pool is not None:
+                self.price_level_pool.release(price_level)
+
+        if self.order_pool is not None:
+            self.list_node_pool.release(order_node)
+            self.order_pool.release(order)
+
+        return order_id
+
+    def cancel_handle(self, handle):
+        """
+        Cancels the resting order with the handle returned for it by
+        ``place_order``.
+
+        A handle is only valid while its order rests at the price it was
+        placed at: after a fill, cancel or amend to a new price, its slot may
+        hold another order, and the stale handle is rejected. The slot comes
+        straight from the handle, so neither ``active_orders`` nor the
+        filled orders are looked up.
+
+        Returns
+        -------
+        bool
+            True if the order was canceled, False if the handle is stale.
+        """
 
+        # ``OrderRecords.slot``, inlined.
+        slot = handle & SLOT_MASK
+        generations = self.records.generations
+        if slot >= len(generations) or generations[slot] != handle >> SLOT_BITS:
+            return False
+        self._cancel_slot(slot, handle)
         return True
+
+
+def _discard_match(match):
+    pass
@@ -0,0 +1,39 @@
+class ObjectPool:
+    """
+    Freelist of objects of one class.
+
+    ``acquire`` reuses a released object by re-running ``__init__`` on it
+    (or ``reset`` when given) and only allocates when the freelist is empty.
+    Released objects must no longer be referenced by anyone else. At most
+    ``max_size`` objects are kept; further releases are left to the GC.
+    """
+
+    __slots__ = ("cls", "reset", "max_size", "free", "created", "reused")
+
+    def __init__(self, cls, reset=None, max_size=1 << 16) -> None:
+        self.cls = cls
+        self.reset = reset if reset is not None else cls.__init__
+        self.max_size = max_size
+        self.free = []
+        self.created = 0
+        self.reused = 0
+
+    def acquire(self, *args):
+        if self.free:
+            obj = self.free.pop()
+            self.reset(obj, *args)
+            self.reused += 1
+            return obj
+        self.created += 1
+        return self.cls(*args)
+
+    def release(self, obj):
+        if len(self.free) < self.max_size:
+            self.free.append(obj)
+
+    def stats(self):
+        return {
+            "created": self.created,
+            "reused": self.reused,
+            "free": len(self.free),
+        }
@@ -1,4 +1,7 @@
-from decimal import Decimal
+# Limit orders rest whatever part does not match on entry. Market orders
+# match at any price, immediate-or-cancel orders up to their limit, and
+# fill-or-kill orders only if they can fill completely; none of them rest.
+ORDER_TYPES = ("limit", "market", "ioc", "fok")
 
 
 class Order:
@@ -13,7 +16,7 @@ class Order:
     ) -> None:
         self.order_id = order_id
         self.order_side = order_side
-        self.order_price = Decimal(order_price)
+        self.order_price = order_price
         self.order_quantity = order_quantity
 
     def __eq__(self, other):
@@ -0,0 +1,96 @@
+from array import array
+
+from limit_order_book.order_records import SLOT_BITS, SLOT_MASK
+
+NO_SLOT = -1
+
+
+class OrderArena:
+    """
+    Resting orders stored column-wise and addressed by slot index.
+
+    Slot ``i`` holds one order: its id, side, price-level key, remaining
+    quantity, the price level it rests at and the previous and next slots
+    of its FIFO queue (``NO_SLOT`` at either end). Numeric columns are
+    ``array`` objects and the remaining columns hold only ids and a few
+    shared level objects, so resting orders add no objects for the cyclic
+    garbage collector to scan. Released slots are reused before the columns
+    grow, and the columns double in size when full.
+
+    As in ``OrderRecords``, a slot's generation is bumped on release and
+    combined with the slot into the order's handle.
+    """
+
+    def __init__(self, capacity=1024) -> None:
+        self.capacity = 0
+        self.order_ids = []
+        self.is_buy = bytearray()
+        self.keys = array("q")
+        self.quantities = array("q")
+        self.prev = array("q")
+        self.next = array("q")
+        self.levels = []
+        self.generations = array("q")
+        self.free = array("q")
+        self._grow(capacity)
+
+    def allocate(self):
+        if not self.free:
+            self._grow(self.capacity)
+        return self.free.pop()
+
+    def allocate_block(self, count):
+        """
+        Allocate ``count`` consecutive new slots and return the first. The
+        slots are appended to the columns, bypassing the freelist.
+        """
+        start = self.capacity
+        self._grow(count)
+        del self.free[len(self.free) - count :]
+        return start
+
+    def release(self, slot):
+        self.order_ids[slot] = None
+        self.levels[slot] = None
+        self.generations[slot] += 1
+        self.free.append(slot)
+
+    def handle(self, slot):
+        return (self.generations[slot] << SLOT_BITS) | slot
+
+    def slot(self, handle):
+        """Return the slot of a live handle, or None for a stale one."""
+        slot = handle & SLOT_MASK
+        if (
+            slot < self.capacity
+            and self.generations[slot] == handle >> SLOT_BITS
+            and self.order_ids[slot] is not None
+        ):
+            return slot
+        return None
+
+    def __len__(self):
+        return self.capacity - len(self.free)
+
+    def iter_queue(self, price_level):
+        """Yield the slots queued at ``price_level`` in time priority."""
+        slot = price_level.head
+        while slot != NO_SLOT:
+            yield slot
+            slot = self.next[slot]
+
+    def _grow(self, extra):
+        # The columns are extended in place, so references held by callers
+        # stay valid across growth.
+        start = self.capacity
+        self.capacity += extra
+        self.order_ids.extend([None] * extra)
+        self.is_buy.extend(bytes(extra))
+        zeros = array("q", bytes(8 * extra))
+        self.keys.extend(zeros)
+        self.quantities.extend(zeros)
+        self.prev.extend(zeros)
+        self.next.extend(zeros)
+        self.generations.extend(zeros)
+        self.levels.extend([None] * extra)
+        self.free.extend(range(self.capacity - 1, start - 1, -1))
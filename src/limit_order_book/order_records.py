@@ -0,0 +1,68 @@
+from array import array
+
+SLOT_BITS = 32
+SLOT_MASK = (1 << SLOT_BITS) - 1
+
+
+class OrderRecords:
+    """
+    Bookkeeping for resting orders, keyed by integer handles.
+
+    A handle packs a slot index in its low ``SLOT_BITS`` bits and the slot's
+    generation above them. Slots are reused once their order leaves the
+    book, and the generation is bumped on release, so a stale handle never
+    resolves to a later order that happens to occupy the same slot.
+
+    Slot ``i`` records the order's list node (whose ``data`` is the
+    ``Order``) and the price-level index node it rests at.
+    """
+
+    def __init__(self) -> None:
+        self.order_nodes = []
+        self.level_nodes = []
+        self.generations = array("q")
+        self.free = array("q")
+
+    def add(self, order_node, level_node):
+        if self.free:
+            slot = self.free.pop()
+            self.order_nodes[slot] = order_node
+            self.level_nodes[slot] = level_node
+        else:
+            slot = len(self.order_nodes)
+            self.order_nodes.append(order_node)
+            self.level_nodes.append(level_node)
+            self.generations.append(0)
+        return (self.generations[slot] << SLOT_BITS) | slot
+
+    def extend(self, order_nodes, level_node):
+        """
+        Add orders resting at the same level in fresh slots and return the
+        range of their handles.
+        """
+        start = len(self.order_nodes)
+        self.order_nodes.extend(order_nodes)
+        self.level_nodes.extend([level_node] * len(order_nodes))
+        self.generations.extend(array("q", bytes(8 * len(order_nodes))))
+        return range(start, len(self.order_nodes))
+
+    def release(self, handle):
+        slot = handle & SLOT_MASK
+        self.order_nodes[slot] = None
+        self.level_nodes[slot] = None
+        self.generations[slot] += 1
+        self.free.append(slot)
+
+    def slot(self, handle):
+        """Return the slot of a live handle, or None for a stale one."""
+        slot = handle & SLOT_MASK
+        if (
+            slot < len(self.generations)
+            and self.generations[slot] == handle >> SLOT_BITS
+            and self.order_nodes[slot] is not None
+        ):
+            return slot
+        return None
+
+    def __len__(self):
+        return len(self.order_nodes) - len(self.free)
@@ -0,0 +1,135 @@
+from limit_order_book.price_level_index import IndexNode, PriceLevelIndex
+from limit_order_book.skip_list import SkipList
+
+WORD_BITS = 64
+
+
+class PriceLadder(PriceLevelIndex):
+    """
+    Price levels stored in an array indexed by tick offset from ``base``.
+
+    Occupied offsets are tracked in a two-level bitmap: one bit per slot in
+    ``words`` and one bit per non-zero word in ``summary``, so the lowest
+    occupied slot is found with two lowest-set-bit operations. Keys outside
+    the window live in an overflow ``SkipList``.
+
+    The window is recentered around the best key whenever a key arrives
+    below ``base`` or the window drains while the overflow still holds
+    levels. As a result, whenever the window is non-empty, every overflow
+    key is greater than every key in the window.
+
+    Keys must be integers (tick counts), so the ladder is only usable by a
+    book configured with an ``Instrument``.
+    """
+
+    integer_keys = True
+
+    def __init__(self, window=4096) -> None:
+        self.window = -(-window // WORD_BITS) * WORD_BITS
+        self.base = None
+        self.count = 0
+        self.levels = [None] * self.window
+        self.words = [0] * (self.window // WORD_BITS)
+        self.summary = 0
+        self.overflow = SkipList()
+
+    def insert(self, key, value):
+        if self.base is None or (
+            key < self.base or (self.count == 0 and key - self.base >= self.window)
+        ):
+            self._recenter(key)
+        return self._insert(key, value)
+
+    def search(self, key):
+        if self.base is not None:
+            offset = key - self.base
+            if 0 <= offset < self.window:
+                return self.levels[offset]
+        return self.overflow.search(key)
+
+    def delete(self, key):
+        if self.base is not None:
+            offset = key - self.base
+            if 0 <= offset < self.window:
+                if self.levels[offset] is None:
+                    return False
+                self.levels[offset] = None
+                self._clear(offset)
+                self.count -= 1
+                if self.count == 0:
+                    overflow_min = self.overflow.get_min()
+                    if overflow_min is not None:
+                        self._recenter(overflow_min.key)
+                return True
+        return self.overflow.delete(key)
+
+    def get_min(self):
+        if self.count:
+            summary = self.summary
+            w = (summary & -summary).bit_length() - 1
+            word = self.words[w]
+            return self.levels[(w * WORD_BITS) + (word & -word).bit_length() - 1]
+        return self.overflow.get_min()
+
+    def iter_range(self, lo=None, hi=None):
+        if self.count:
+            first = 0 if lo is None else max(lo - self.base, 0)
+            last = self.window - 1 if hi is None else min(hi - self.base, self.window - 1)
+            for w in range(first // WORD_BITS, last // WORD_BITS + 1):
+                word = self.words[w]
+                while word:
+                    low_bit = word & -word
+                    offset = w * WORD_BITS + low_bit.bit_length() - 1
+                    if offset > last:
+                        return
+                    if offset >= first:
+                        yield self.levels[offset]
+                    word ^= low_bit
+        yield from self.overflow.iter_range(lo, hi)
+
+    def _insert(self, key, value):
+        offset = key - self.base
+        if 0 <= offset < self.window:
+            node = self.levels[offset]
+            if node is not None:
+                node.value = value
+                return node
+            node = IndexNode(key, value)
+            self.levels[offset] = node
+            self._set(offset)
+            self.count += 1
+            return node
+        return self.overflow.insert(key, value)
+
+    def _set(self, offset):
+        w = offset // WORD_BITS
+        word = self.words[w]
+        if not word:
+            self.summary |= 1 << w
+        self.words[w] = word | (1 << (offset % WORD_BITS))
+
+    def _clear(self, offset):
+        w = offset // WORD_BITS
+        word = self.words[w] & ~(1 << (offset % WORD_BITS))
+        self.words[w] = word
+        if not word:
+            self.summary &= ~(1 << w)
+
+    def _recenter(self, anchor):
+        entries = [node for node in self.levels if node is not None]
+        node = self.overflow.get_min()
+        while node is not None:
+            entries.append(node)
+            node = node.forward[0]
+
+        self.base = anchor - self.window // 2
+        self.count = 0
+        self.levels = [None] * self.window
+        self.words = [0] * (self.window // WORD_BITS)
+        self.summary = 0
+        self.overflow = SkipList()
+
+        # Handles held by callers keep pointing at the same values, so moving
+        # a level between the window and the overflow is invisible to them.
+        for node in entries:
+            self._insert(node.key, node.value)
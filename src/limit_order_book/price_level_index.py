@@ -0,0 +1,68 @@
+from abc import ABC, abstractmethod
+
+
+class IndexNode:
+    __slots__ = ("key", "value")
+
+    def __init__(self, key, value) -> None:
+        self.key = key
+        self.value = value
+
+
+class PriceLevelIndex(ABC):
+    """
+    Ordered map from price-level key to value, smallest key first.
+
+    The book stores asks keyed by price and bids keyed by negated price, so
+    the best level of either side is always the minimum. Lookups return a
+    node exposing ``key`` and ``value``; the book keeps these nodes as
+    handles, so a node must stay valid (its ``value`` unchanged) for as
+    long as its key is present.
+
+    Implementations must provide ``insert``, ``search``, ``delete``,
+    ``get_min`` and ``iter_range``; the other methods have generic defaults.
+    """
+
+    # Set by implementations that can only index integer (tick) keys.
+    integer_keys = False
+
+    @abstractmethod
+    def insert(self, key, value):
+        """Insert or replace ``key`` and return its node."""
+
+    @abstractmethod
+    def search(self, key):
+        """Return the node for ``key`` or None."""
+
+    @abstractmethod
+    def delete(self, key):
+        """Remove ``key``; return True if it was present."""
+
+    @abstractmethod
+    def get_min(self):
+        """Return the node with the smallest key or None."""
+
+    def pop_min(self):
+        """Remove and return the node with the smallest key or None."""
+        node = self.get_min()
+        if node is not None:
+            self.delete(node.key)
+        return node
+
+    @abstractmethod
+    def iter_range(self, lo=None, hi=None):
+        """Yield nodes with ``lo <= key <= hi`` in ascending key order."""
+
+    def bulk_load(self, items):
+        """
+        Fill an empty index from ``(key, value)`` pairs in ascending key
+        order and return their nodes in the same order.
+        """
+        return [self.insert(key, value) for key, value in items]
+
+    def enable_pooling(self):
+        """Reuse deleted nodes where the implementation supports it."""
+
+    def pool_stats(self):
+        """Return node pool statistics, or None without a node pool."""
+        return None
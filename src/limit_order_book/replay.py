@@ -0,0 +1,271 @@
+"""
+Replay of order streams through a book.
+
+Streams are read in chunks either from CSV files in the format of the
+functional tests (``action,order_id,order_side,order_price,order_quantity``
+with a header row, and empty side, price and quantity for cancels) or from
+the binary form written by ``convert``, which needs no parsing and is meant
+for streams replayed more than once.
+
+    python -m limit_order_book.replay orders.csv --convert orders.bin
+    python -m limit_order_book.replay orders.bin --tick-size 0.01 --fills fills.csv
+"""
+
+import argparse
+import struct
+import sys
+import time
+from array import array
+from decimal import Decimal
+
+from limit_order_book.instrument import Instrument
+from limit_order_book.journal import (
+    CANCEL,
+    PLACE,
+    SIDE_CODES,
+    SIDES,
+    decode_price,
+    encode_price,
+)
+from limit_order_book.limit_order_book import LimitOrderBook
+
+MAGIC = b"LOBRPLY1"
+
+# Number of records and size of the order ids section of a chunk. The header
+# is followed by the columns of the chunk: kinds (uint8), sides (uint8),
+# price exponents (int8), price coefficients (int64), quantities (int64),
+# and the order ids as NUL-separated UTF-8 strings.
+CHUNK_HEADER = struct.Struct("<II")
+# Bytes per record in the columns before the order ids.
+COLUMNS_SIZE = 19
+
+ACTIONS = {"place": PLACE, "cancel": CANCEL}
+
+
+def read_csv(path, chunk_records=1 << 16):
+    """
+    Yield the orders of a CSV file in chunks of about ``chunk_records``,
+    each as columns ``(kinds, order_ids, order_sides, order_prices,
+    order_quantities)``. Side, price and quantity are None for cancels.
+
+    Rows are split on commas, without quoting. Each distinct price string is
+    converted to ``Decimal`` once.
+    """
+
+    prices = {}
+    with open(path) as file:
+        file.readline()
+        while True:
+            # Reads whole lines up to an estimated chunk size in bytes.
+            lines = file.readlines(chunk_records * 32)
+            if not lines:
+                return
+            kinds = []
+            order_ids = []
+            order_sides = []
+            order_prices = []
+            order_quantities = []
+            for line in lines:
+                fields = line.rstrip("\r\n").split(",")
+                if len(fields) != 5:
+                    if not line.strip():
+                        continue
+                    raise ValueError(f"malformed order row {line!r}")
+                action, order_id, order_side, order_price, order_quantity = fields
+                kind = ACTIONS.get(action)
+                if kind is None:
+                    raise ValueError(f"unknown action {action!r}")
+                kinds.append(kind)
+                order_ids.append(order_id)
+                if kind == PLACE:
+                    price = prices.get(order_price)
+                    if price is None:
+                        price = prices[order_price] = Decimal(order_price)
+                    order_sides.append(order_side)
+                    order_prices.append(price)
+                    order_quantities.append(int(order_quantity))
+                else:
+                    order_sides.append(None)
+                    order_prices.append(None)
+                    order_quantities.append(None)
+            if kinds:
+                yield kinds, order_ids, order_sides, order_prices, order_quantities
+
+
+def convert(csv_path, binary_path, chunk_records=1 << 16):
+    """
+    Convert a CSV order stream to the binary form and return the number of
+    orders written.
+    """
+
+    num_orders = 0
+    with open(binary_path, "wb") as file:
+        file.write(MAGIC)
+        for kinds, order_ids, order_sides, order_prices, order_quantities in (
+            read_csv(csv_path, chunk_records)
+        ):
+            sides = bytearray(len(kinds))
+            exponents = array("b", bytes(len(kinds)))
+            coefficients = array("q", bytes(8 * len(kinds)))
+            quantities = array("q", bytes(8 * len(kinds)))
+            for i, kind in enumerate(kinds):
+                if kind == PLACE:
+                    sides[i] = SIDE_CODES[order_sides[i]]
+                    coefficients[i], exponents[i] = encode_price(order_prices[i])
+                    quantities[i] = order_quantities[i]
+            if sys.byteorder == "big":
+                coefficients.byteswap()
+                quantities.byteswap()
+            encoded_order_ids = "\0".join(order_ids).encode()
+
+            file.write(CHUNK_HEADER.pack(len(kinds), len(encoded_order_ids)))
+            file.write(bytes(kinds))
+            file.write(sides)
+            file.write(exponents)
+            file.write(coefficients)
+            file.write(quantities)
+            file.write(encoded_order_ids)
+            num_orders += len(kinds)
+    return num_orders
+
+
+def read_binary(path):
+    """
+    Yield the orders of a file written by ``convert`` in the chunks it was
+    written in, as columns like those of ``read_csv``. The side, price and
+    quantity of cancels are placeholders.
+    """
+
+    prices = {}
+    with open(path, "rb") as file:
+        if file.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"{path} is not a replay file")
+        while True:
+            header = file.read(CHUNK_HEADER.size)
+            if not header:
+                return
+            num_records, ids_size = CHUNK_HEADER.unpack(header)
+            chunk = memoryview(file.read(COLUMNS_SIZE * num_records + ids_size))
+            kinds = chunk[:num_records]
+            sides = chunk[num_records : 2 * num_records]
+            exponents = array("b")
+            exponents.frombytes(chunk[2 * num_records : 3 * num_records])
+            offset = 3 * num_records
+            coefficients = array("q")
+            coefficients.frombytes(chunk[offset : offset + 8 * num_records])
+            offset += 8 * num_records
+            quantities = array("q")
+            quantities.frombytes(chunk[offset : offset + 8 * num_records])
+            offset += 8 * num_records
+            if sys.byteorder == "big":
+                coefficients.byteswap()
+                quantities.byteswap()
+            order_ids = str(chunk[offset:], "utf-8").split("\0")
+
+            order_sides = [SIDES[side] for side in sides]
+            order_prices = []
+            for coefficient, exponent in zip(coefficients, exponents):
+                price = prices.get((coefficient, exponent))
+                if price is None:
+                    price = prices[coefficient, exponent] = decode_price(
+                        coefficient, exponent
+                    )
+                order_prices.append(price)
+            yield kinds.tolist(), order_ids, order_sides, order_prices, quantities
+
+
+def read_orders(path, chunk_records=1 << 16):
+    """Chunks of ``read_binary`` or, without the binary magic, ``read_csv``."""
+    with open(path, "rb") as file:
+        is_binary = file.read(len(MAGIC)) == MAGIC
+    if is_binary:
+        return read_binary(path)
+    return read_csv(path, chunk_records)
+
+
+def replay(book, chunks, fills_file=None):
+    """
+    Apply chunks of orders to ``book`` and return the number of orders and
+    of fills.
+
+    Parameters
+    ----------
+    book : LimitOrderBook
+        The book to drive.
+    chunks : iterable
+        Columns as yielded by ``read_csv`` or ``read_binary``.
+    fills_file : file, optional
+        Text file the fills are written to, one
+        ``buy_order_id,sell_order_id,order_price,order_quantity`` line each,
+        once per chunk.
+    """
+
+    place_order = book._place_order
+    cancel_order = book.cancel_order
+    num_orders = 0
+    num_fills = 0
+    for kinds, order_ids, order_sides, order_prices, order_quantities in chunks:
+        matches = []
+        append_match = matches.append
+        for kind, order_id, order_side, order_price, order_quantity in zip(
+            kinds, order_ids, order_sides, order_prices, order_quantities
+        ):
+            if kind == PLACE:
+                place_order(
+                    order_id, order_side, order_price, order_quantity, append_match
+                )
+            else:
+                cancel_order(order_id)
+        num_orders += len(kinds)
+        num_fills += len(matches)
+        if fills_file is not None:
+            fills_file.writelines(
+                f"{buy_order_id},{sell_order_id},{price},{quantity}\n"
+                for buy_order_id, sell_order_id, quantity, price in matches
+            )
+    return num_orders, num_fills
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Replay an order stream through a limit order book."
+    )
+    parser.add_argument("orders", help="CSV order stream or binary replay file")
+    parser.add_argument(
+        "--convert",
+        metavar="PATH",
+        help="convert the CSV stream to a binary replay file instead",
+    )
+    parser.add_argument("--fills", metavar="PATH", help="write the fills as CSV")
+    parser.add_argument(
+        "--tick-size", help="match on integer ticks of this size (e.g. 0.01)"
+    )
+    parser.add_argument("--chunk-records", type=int, default=1 << 16)
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    if args.convert:
+        num_orders = convert(args.orders, args.convert, args.chunk_records)
+        elapsed = time.perf_counter() - start
+        print(f"Converted {num_orders} orders in {elapsed:.2f} s")
+        return 0
+
+    instrument = None if args.tick_size is None else Instrument(args.tick_size)
+    book = LimitOrderBook(instrument=instrument)
+    chunks = read_orders(args.orders, args.chunk_records)
+    if args.fills:
+        with open(args.fills, "w") as fills_file:
+            fills_file.write("buy_order_id,sell_order_id,order_price,order_quantity\n")
+            num_orders, num_fills = replay(book, chunks, fills_file)
+    else:
+        num_orders, num_fills = replay(book, chunks)
+    elapsed = time.perf_counter() - start
+    print(
+        f"Replayed {num_orders} orders ({num_fills} fills) in {elapsed:.2f} s: "
+        f"{num_orders / elapsed:.0f} orders/s"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,5 +1,7 @@
 import random
 
+from limit_order_book.price_level_index import PriceLevelIndex
+
 
 class SkipListNode:
     __slots__ = ("key", "value", "forward")
@@ -10,12 +12,38 @@ class SkipListNode:
         self.forward = [None] * level
 
 
-class SkipList:
+class SkipList(PriceLevelIndex):
     def __init__(self) -> None:
         self.max_level = 16
         self.p = 0.5
         self.level = 1
         self.header = SkipListNode(-float("inf"), None, self.max_level)
+        # Scratch list of the predecessors of a key on each level, reused by
+        # insert and delete.
+        self.update = [None] * self.max_level
+        # Level where searches for keys close to the head start; level
+        # ``finger_level + 1`` first holds a node about 2 ** (finger_level
+        # + 1) positions in.
+        self.finger_level = 3
+        # Deleted nodes bucketed by level, so that a reused node comes with a
+        # forward list of the right length. None unless pooling is enabled.
+        self.free_nodes = None
+        self.free_nodes_max_size = 0
+        self.nodes_created = 0
+        self.nodes_reused = 0
+
+    def enable_pooling(self, max_size=1 << 12):
+        self.free_nodes = [[] for _ in range(self.max_level + 1)]
+        self.free_nodes_max_size = max_size
+
+    def pool_stats(self):
+        if self.free_nodes is None:
+            return None
+        return {
+            "created": self.nodes_created,
+            "reused": self.nodes_reused,
+            "free": sum(len(free) for free in self.free_nodes),
+        }
 
     def random_level(self):
         level = 1
@@ -23,10 +51,24 @@ class SkipList:
             level += 1
         return level
 
+    def _start_level(self, key):
+        # Finger search from the head, which sits next to the best price.
+        # If the first node at the level above ``finger_level`` is not below
+        # ``key``, neither is any node on higher levels, so the descent can
+        # start at ``finger_level``: keys near the touch skip the upper
+        # levels at the cost of a single comparison.
+        top = self.level - 1
+        if top > self.finger_level:
+            first = self.header.forward[self.finger_level + 1]
+            if first is None or first.key >= key:
+                return self.finger_level
+        return top
+
     def insert(self, key, value):
-        update = [None] * self.max_level
+        update = self.update
         current = self.header
-        for i in range(self.level - 1, -1, -1):
+        top = self._start_level(key)
+        for i in range(top, -1, -1):
             while current.forward[i] and current.forward[i].key < key:
                 current = current.forward[i]
             update[i] = current
@@ -37,12 +79,21 @@ class SkipList:
             return current
 
         level = self.random_level()
+        for i in range(top + 1, level):
+            update[i] = self.header
         if level > self.level:
-            for i in range(self.level, level):
-                update[i] = self.header
             self.level = level
 
-        new_node = SkipListNode(key, value, level)
+        if self.free_nodes is None:
+            new_node = SkipListNode(key, value, level)
+        elif self.free_nodes[level]:
+            new_node = self.free_nodes[level].pop()
+            new_node.key = key
+            new_node.value = value
+            self.nodes_reused += 1
+        else:
+            new_node = SkipListNode(key, value, level)
+            self.nodes_created += 1
 
         for i in range(level):
             new_node.forward[i] = update[i].forward[i]
@@ -52,7 +103,13 @@ class SkipList:
 
     def search(self, key):
         current = self.header
-        for i in range(self.level - 1, -1, -1):
+        # ``_start_level`` inlined, as searches are the most frequent call.
+        top = self.level - 1
+        if top > self.finger_level:
+            first = current.forward[self.finger_level + 1]
+            if first is None or first.key >= key:
+                top = self.finger_level
+        for i in range(top, -1, -1):
             while current.forward[i] and current.forward[i].key < key:
                 current = current.forward[i]
         current = current.forward[0]
@@ -62,27 +119,87 @@ class SkipList:
 
         return None
 
+    def traversal_length(self, key):
+        """Return the number of nodes the descent towards ``key`` steps over."""
+        current = self.header
+        length = 0
+        for i in range(self._start_level(key), -1, -1):
+            while current.forward[i] and current.forward[i].key < key:
+                current = current.forward[i]
+                length += 1
+        return length
+
     def delete(self, key):
-        update = [None] * self.max_level
+        update = self.update
         current = self.header
-        for i in range(self.level - 1, -1, -1):
+        top = self._start_level(key)
+        for i in range(top, -1, -1):
             while current.forward[i] and current.forward[i].key < key:
                 current = current.forward[i]
             update[i] = current
         current = current.forward[0]
 
         if current and current.key == key:
-            for i in range(self.level):
-                if update[i].forward[i] != current:
-                    break
+            for i in range(top + 1, len(current.forward)):
+                update[i] = self.header
+            for i in range(len(current.forward)):
                 update[i].forward[i] = current.forward[i]
-            while (
-                self.level > 1 and self.header.forward[self.level - 1] is None
-            ):
-                self.level -= 1
+            if self.free_nodes is not None:
+                current.value = None
+            self._release(current)
             return True
 
         return False
 
+    def pop_min(self):
+        # The first node is the header's successor on every level it spans,
+        # so it is unlinked without a search.
+        node = self.header.forward[0]
+        if node is None:
+            return None
+        header_forward = self.header.forward
+        for i in range(len(node.forward)):
+            header_forward[i] = node.forward[i]
+        self._release(node)
+        return node
+
+    def _release(self, node):
+        while self.level > 1 and self.header.forward[self.level - 1] is None:
+            self.level -= 1
+        if self.free_nodes is not None:
+            free = self.free_nodes[len(node.forward)]
+            if len(free) < self.free_nodes_max_size:
+                free.append(node)
+
     def get_min(self):
         return self.header.forward[0]
+
+    def bulk_load(self, items):
+        # Keys arrive sorted, so every new node goes after the last node
+        # linked at each of its levels and no search is needed: O(n) overall.
+        tails = [self.header] * self.max_level
+        nodes = []
+        for key, value in items:
+            level = self.random_level()
+            node = SkipListNode(key, value, level)
+            for i in range(level):
+                tails[i].forward[i] = node
+                tails[i] = node
+            if level > self.level:
+                self.level = level
+            nodes.append(node)
+        if self.free_nodes is not None:
+            self.nodes_created += len(nodes)
+        return nodes
+
+    def iter_range(self, lo=None, hi=None):
+        current = self.header
+        if lo is not None:
+            for i in range(self.level - 1, -1, -1):
+                while current.forward[i] and current.forward[i].key < lo:
+                    current = current.forward[i]
+        current = current.forward[0]
+
+        while current and (hi is None or current.key <= hi):
+            yield current
+            current = current.forward[0]
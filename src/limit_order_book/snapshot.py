@@ -0,0 +1,120 @@
+import mmap
+import struct
+import sys
+from array import array
+
+from limit_order_book.journal import decode_price, encode_price
+
+MAGIC = b"LOBSNAP1"
+
+# Magic, journal sequence number, and the number of levels and of orders of
+# the buy and then the sell side.
+HEADER = struct.Struct("<8sQqqqq")
+# Price coefficient, price exponent, number of orders queued at the level.
+LEVEL = struct.Struct("<qb7xq")
+
+
+def write_snapshot(path, sequence, sides):
+    """
+    Write the resting orders of a book to ``path``.
+
+    ``sides`` holds the buy and then the sell side, each as ``(levels,
+    order_ids, quantities)``: ``levels`` lists ``(price, order_count)`` best
+    level first, and the order columns list the orders of all levels in
+    price-time order.
+
+    The file is laid out in flat sections, each at an offset that follows
+    from the header: the level records of both sides, the order quantities
+    of both sides as one little-endian int64 column, and finally the order
+    ids as NUL-terminated UTF-8 strings.
+    """
+
+    (buy_levels, buy_ids, buy_quantities), (
+        sell_levels,
+        sell_ids,
+        sell_quantities,
+    ) = sides
+    quantities = array("q", buy_quantities)
+    quantities.extend(sell_quantities)
+    if sys.byteorder == "big":
+        quantities.byteswap()
+
+    with open(path, "wb") as file:
+        file.write(
+            HEADER.pack(
+                MAGIC,
+                sequence,
+                len(buy_levels),
+                len(sell_levels),
+                len(buy_ids),
+                len(sell_ids),
+            )
+        )
+        for price, order_count in buy_levels + sell_levels:
+            file.write(LEVEL.pack(*encode_price(price), order_count))
+        file.write(quantities.tobytes())
+        for order_ids in (buy_ids, sell_ids):
+            if order_ids:
+                file.write("\0".join(order_ids).encode())
+                file.write(b"\0")
+
+
+def read_snapshot(path):
+    """
+    Map a snapshot written by ``write_snapshot`` and return ``(sequence,
+    sides)`` with ``sides`` in the form ``write_snapshot`` accepts.
+
+    The quantity columns are int64 ``memoryview``s of the mapping itself
+    (copied into arrays only on big-endian hosts), which keep it open for
+    as long as they are referenced. Level records and order ids are decoded
+    straight from the mapping without copying it into bytes first, but every
+    id still becomes a ``str`` here: the book keys ``active_orders`` by them.
+    """
+
+    with open(path, "rb") as file:
+        snapshot = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    view = memoryview(snapshot)
+    (
+        magic,
+        sequence,
+        num_buy_levels,
+        num_sell_levels,
+        num_buy_orders,
+        num_sell_orders,
+    ) = HEADER.unpack_from(view)
+    if magic != MAGIC:
+        view.release()
+        snapshot.close()
+        raise ValueError(f"{path} is not a limit order book snapshot")
+
+    offset = HEADER.size
+    size = LEVEL.size * (num_buy_levels + num_sell_levels)
+    levels = [
+        (decode_price(coefficient, exponent), order_count)
+        for coefficient, exponent, order_count in LEVEL.iter_unpack(
+            view[offset : offset + size]
+        )
+    ]
+    offset += size
+
+    size = 8 * (num_buy_orders + num_sell_orders)
+    quantities = view[offset : offset + size].cast("q")
+    if sys.byteorder == "big":
+        quantities = array("q", quantities)
+        quantities.byteswap()
+    offset += size
+
+    order_ids = str(view[offset:], "utf-8").split("\0")
+
+    return sequence, (
+        (
+            levels[:num_buy_levels],
+            order_ids[:num_buy_orders],
+            quantities[:num_buy_orders],
+        ),
+        (
+            levels[num_buy_levels:],
+            order_ids[num_buy_orders : num_buy_orders + num_sell_orders],
+            quantities[num_buy_orders:],
+        ),
+    )
@@ -0,0 +1,67 @@
+from bisect import bisect_left, bisect_right
+
+from limit_order_book.price_level_index import IndexNode, PriceLevelIndex
+
+
+class SortedArray(PriceLevelIndex):
+    """
+    Price levels in two parallel Python lists ordered by descending key.
+
+    Keeping the best (smallest) key at the end makes ``get_min`` and
+    ``pop_min`` O(1), and inserts or deletes near the touch only shift the
+    few elements behind them. Keys are stored negated so that ``bisect``
+    works on an ascending list.
+    """
+
+    def __init__(self) -> None:
+        self.neg_keys = []
+        self.nodes = []
+
+    def insert(self, key, value):
+        neg_key = -key
+        i = bisect_left(self.neg_keys, neg_key)
+        if i < len(self.neg_keys) and self.neg_keys[i] == neg_key:
+            node = self.nodes[i]
+            node.value = value
+            return node
+        node = IndexNode(key, value)
+        self.neg_keys.insert(i, neg_key)
+        self.nodes.insert(i, node)
+        return node
+
+    def search(self, key):
+        neg_key = -key
+        i = bisect_left(self.neg_keys, neg_key)
+        if i < len(self.neg_keys) and self.neg_keys[i] == neg_key:
+            return self.nodes[i]
+        return None
+
+    def delete(self, key):
+        neg_key = -key
+        i = bisect_left(self.neg_keys, neg_key)
+        if i < len(self.neg_keys) and self.neg_keys[i] == neg_key:
+            del self.neg_keys[i]
+            del self.nodes[i]
+            return True
+        return False
+
+    def get_min(self):
+        return self.nodes[-1] if self.nodes else None
+
+    def bulk_load(self, items):
+        nodes = [IndexNode(key, value) for key, value in items]
+        self.nodes = nodes[::-1]
+        self.neg_keys = [-node.key for node in self.nodes]
+        return nodes
+
+    def pop_min(self):
+        if not self.nodes:
+            return None
+        self.neg_keys.pop()
+        return self.nodes.pop()
+
+    def iter_range(self, lo=None, hi=None):
+        start = 0 if hi is None else bisect_left(self.neg_keys, -hi)
+        stop = len(self.nodes) if lo is None else bisect_right(self.neg_keys, -lo)
+        for i in range(stop - 1, start - 1, -1):
+            yield self.nodes[i]
@@ -1,8 +1,40 @@
+import functools
+
 import pytest
 
+from limit_order_book.array_limit_order_book import ArrayLimitOrderBook
+from limit_order_book.filled_orders import FilledOrders
+from limit_order_book.instrument import Instrument
 from limit_order_book.limit_order_book import LimitOrderBook
+from limit_order_book.price_ladder import PriceLadder
+from limit_order_book.sorted_array import SortedArray
 
 
 @pytest.fixture
 def limit_order_book():
     return LimitOrderBook()
+
+
+# One of each storage and price index, on a tick size that every test
+# price fits. The ladder window is small so that tests also cross its edge.
+@pytest.fixture(
+    params=[
+        lambda: LimitOrderBook(),
+        lambda: LimitOrderBook(
+            instrument=Instrument("0.5"),
+            price_index=functools.partial(PriceLadder, window=8),
+            filled_orders=functools.partial(FilledOrders, generation_size=4),
+            pooling=True,
+        ),
+        lambda: LimitOrderBook(instrument=Instrument("0.5"), price_index=SortedArray),
+        lambda: ArrayLimitOrderBook(Instrument("0.5"), capacity=2),
+    ],
+    ids=["decimal", "price_ladder", "sorted_array", "arrays"],
+)
+def make_book(request):
+    return request.param
+
+
+@pytest.fixture
+def book(make_book):
+    return make_book()
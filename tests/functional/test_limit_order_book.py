@@ -1,11 +1,57 @@
 import csv
+import functools
 from decimal import Decimal
 
 import pytest
 
+from limit_order_book.array_limit_order_book import ArrayLimitOrderBook
+from limit_order_book.b_tree import BTree
+from limit_order_book.instrument import Instrument
+from limit_order_book.limit_order_book import LimitOrderBook
+from limit_order_book.price_ladder import PriceLadder
+from limit_order_book.sorted_array import SortedArray
+
 
 @pytest.mark.parametrize("test_case_id", ["00", "01", "02"])
 def test_matches(limit_order_book, test_case_id):
+    assert_matches(limit_order_book, test_case_id)
+
+
+@pytest.mark.parametrize("test_case_id", ["00", "01", "02"])
+def test_matches_with_instrument(test_case_id):
+    limit_order_book = LimitOrderBook(instrument=Instrument(tick_size="0.01"))
+    assert_matches(limit_order_book, test_case_id)
+
+
+@pytest.mark.parametrize("test_case_id", ["00", "01", "02"])
+def test_matches_with_price_ladder(test_case_id):
+    limit_order_book = LimitOrderBook(
+        instrument=Instrument(tick_size="1"),
+        price_index=functools.partial(PriceLadder, window=8),
+    )
+    assert_matches(limit_order_book, test_case_id)
+
+
+@pytest.mark.parametrize("test_case_id", ["00", "01", "02"])
+@pytest.mark.parametrize(
+    "price_index",
+    [SortedArray, functools.partial(BTree, leaf_size=2)],
+    ids=["sorted_array", "b_tree"],
+)
+def test_matches_with_price_index(price_index, test_case_id):
+    limit_order_book = LimitOrderBook(price_index=price_index)
+    assert_matches(limit_order_book, test_case_id)
+
+
+@pytest.mark.parametrize("test_case_id", ["00", "01", "02"])
+def test_matches_with_array_storage(test_case_id):
+    limit_order_book = ArrayLimitOrderBook(
+        instrument=Instrument(tick_size="1"), capacity=4
+    )
+    assert_matches(limit_order_book, test_case_id)
+
+
+def assert_matches(limit_order_book, test_case_id):
     matches = []
     with open(
         f"tests/functional/testcase{test_case_id}/orders.csv", mode="r"
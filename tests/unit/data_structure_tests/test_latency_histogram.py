@@ -0,0 +1,74 @@
+import math
+import random
+
+import pytest
+
+from limit_order_book.latency_histogram import LatencyHistogram
+
+
+def test_small_values_are_exact():
+    histogram = LatencyHistogram(precision_bits=7)
+    for value in range(1, 101):
+        histogram.record(value)
+
+    assert histogram.count == 100
+    assert histogram.min == 1
+    assert histogram.max == 100
+    assert histogram.mean() == 50.5
+    assert histogram.value_at_quantile(0.5) == 50
+    assert histogram.value_at_quantile(0.99) == 99
+    assert histogram.value_at_quantile(1) == 100
+
+
+def test_quantiles_within_relative_error():
+    rng = random.Random(0)
+    values = [int(rng.lognormvariate(8, 2)) for _ in range(20_000)]
+    histogram = LatencyHistogram(precision_bits=7)
+    for value in values:
+        histogram.record(value)
+
+    values.sort()
+    for quantile in (0.5, 0.9, 0.99, 0.999):
+        exact = values[math.ceil(quantile * len(values)) - 1]
+        assert exact <= histogram.value_at_quantile(quantile) <= exact * (1 + 2**-6)
+    assert histogram.value_at_quantile(1) == values[-1]
+
+
+def test_memory_is_fixed():
+    histogram = LatencyHistogram(precision_bits=5, max_value_bits=20)
+    num_buckets = len(histogram.counts)
+    histogram.record(3, count=10)
+    histogram.record(2**30)
+
+    assert len(histogram.counts) == num_buckets
+    assert histogram.max == 2**30
+    assert histogram.value_at_quantile(1) == 2**30
+    assert histogram.value_at_quantile(0.5) == 3
+
+
+def test_merge_and_reset():
+    first = LatencyHistogram()
+    second = LatencyHistogram()
+    first.record(10)
+    second.record(1000, count=3)
+    first.merge(second)
+
+    assert first.summary() == {
+        "count": 4,
+        "mean": 752.5,
+        "p50": 1000,
+        "p99": 1000,
+        "p999": 1000,
+        "max": 1000,
+    }
+    first.reset()
+    assert first.count == 0
+    assert first.value_at_quantile(0.5) is None
+
+    with pytest.raises(ValueError):
+        first.merge(LatencyHistogram(precision_bits=5))
+
+
+def test_rejects_negative_values():
+    with pytest.raises(ValueError):
+        LatencyHistogram().record(-1)
@@ -0,0 +1,108 @@
+import random
+
+import pytest
+
+from limit_order_book.price_ladder import PriceLadder
+
+
+@pytest.fixture
+def price_ladder():
+    return PriceLadder(window=128)
+
+
+def test_window_is_rounded_up_to_whole_words():
+    assert PriceLadder(window=100).window == 128
+
+
+def test_insert_and_search_existing_key(price_ladder):
+    node = price_ladder.insert(10, "ten")
+    assert node.key == 10
+    assert node.value == "ten"
+    assert price_ladder.search(10) is node
+
+
+def test_search_non_existent_key(price_ladder):
+    assert price_ladder.search(42) is None
+    price_ladder.insert(10, "ten")
+    assert price_ladder.search(11) is None
+    assert price_ladder.search(10_000) is None
+
+
+def test_insert_duplicate_keys(price_ladder):
+    price_ladder.insert(5, "old_value")
+    price_ladder.insert(5, "new_value")
+    assert price_ladder.search(5).value == "new_value"
+
+
+def test_delete_existing_key(price_ladder):
+    price_ladder.insert(20, "twenty")
+    assert price_ladder.delete(20) is True
+    assert price_ladder.search(20) is None
+    assert price_ladder.get_min() is None
+
+
+def test_delete_non_existent_key(price_ladder):
+    assert price_ladder.delete(99) is False
+    price_ladder.insert(20, "twenty")
+    assert price_ladder.delete(21) is False
+
+
+def test_get_min_after_insertions(price_ladder):
+    price_ladder.insert(50, "fifty")
+    price_ladder.insert(10, "ten")
+    price_ladder.insert(30, "thirty")
+    assert price_ladder.get_min().key == 10
+
+
+def test_keys_outside_window_go_to_overflow(price_ladder):
+    price_ladder.insert(0, "zero")
+    price_ladder.insert(1000, "thousand")
+    assert price_ladder.count == 1
+    assert price_ladder.overflow.search(1000) is not None
+    assert price_ladder.search(1000).value == "thousand"
+    assert price_ladder.get_min().key == 0
+
+
+def test_better_key_below_window_recenters(price_ladder):
+    price_ladder.insert(0, "zero")
+    price_ladder.insert(1000, "thousand")
+    price_ladder.insert(-1000, "minus_thousand")
+    assert price_ladder.base <= -1000
+    assert price_ladder.get_min().key == -1000
+    assert price_ladder.search(0).value == "zero"
+    assert price_ladder.search(1000).value == "thousand"
+
+
+def test_draining_window_recenters_on_overflow(price_ladder):
+    price_ladder.insert(0, "zero")
+    price_ladder.insert(1000, "thousand")
+    price_ladder.insert(1001, "thousand_one")
+    price_ladder.delete(0)
+    assert price_ladder.count == 2
+    assert price_ladder.overflow.get_min() is None
+    assert price_ladder.get_min().key == 1000
+
+
+def test_negative_keys(price_ladder):
+    for key in (-105, -101, -103):
+        price_ladder.insert(key, key)
+    assert price_ladder.get_min().key == -105
+    price_ladder.delete(-105)
+    assert price_ladder.get_min().key == -103
+
+
+def test_random_inserts_and_deletes_match_sorted_keys(price_ladder):
+    rng = random.Random(7)
+    keys = set()
+    for _ in range(2000):
+        key = rng.randint(-500, 500)
+        if key in keys and rng.random() < 0.5:
+            assert price_ladder.delete(key) is True
+            keys.discard(key)
+        else:
+            price_ladder.insert(key, key)
+            keys.add(key)
+        min_node = price_ladder.get_min()
+        assert (min_node.key if min_node else None) == (min(keys) if keys else None)
+    for key in keys:
+        assert price_ladder.search(key).value == key
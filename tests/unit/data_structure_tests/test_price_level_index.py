@@ -0,0 +1,102 @@
+import functools
+import random
+
+import pytest
+
+from limit_order_book.b_tree import BTree
+from limit_order_book.price_ladder import PriceLadder
+from limit_order_book.price_level_index import PriceLevelIndex
+from limit_order_book.skip_list import SkipList
+from limit_order_book.sorted_array import SortedArray
+
+
+@pytest.fixture(
+    params=[
+        SkipList,
+        SortedArray,
+        functools.partial(BTree, leaf_size=2),
+        functools.partial(PriceLadder, window=64),
+    ],
+    ids=["skip_list", "sorted_array", "b_tree", "price_ladder"],
+)
+def price_level_index(request):
+    return request.param()
+
+
+def test_pop_min(price_level_index):
+    for key in (30, 10, 20):
+        price_level_index.insert(key, str(key))
+    assert price_level_index.pop_min().key == 10
+    assert price_level_index.search(10) is None
+    assert price_level_index.get_min().key == 20
+    assert price_level_index.pop_min().key == 20
+    assert price_level_index.pop_min().key == 30
+    assert price_level_index.pop_min() is None
+
+
+def test_iter_range(price_level_index):
+    for key in (50, -10, 20, 5, 300, 40):
+        price_level_index.insert(key, str(key))
+    keys = lambda **kwargs: [
+        node.key for node in price_level_index.iter_range(**kwargs)
+    ]
+    assert keys() == [-10, 5, 20, 40, 50, 300]
+    assert keys(lo=5, hi=40) == [5, 20, 40]
+    assert keys(lo=6, hi=39) == [20]
+    assert keys(lo=41) == [50, 300]
+    assert keys(hi=0) == [-10]
+    assert keys(lo=301) == []
+
+
+def test_random_operations_match_sorted_dict(price_level_index):
+    rng = random.Random(3)
+    expected = {}
+    for _ in range(3000):
+        key = rng.randint(-200, 200)
+        operation = rng.random()
+        if operation < 0.5:
+            node = price_level_index.insert(key, key * 2)
+            assert node.key == key
+            expected[key] = key * 2
+        elif operation < 0.8:
+            assert price_level_index.delete(key) is (expected.pop(key, None) is not None)
+        elif operation < 0.9:
+            node = price_level_index.pop_min()
+            if expected:
+                assert node.key == min(expected)
+                del expected[node.key]
+            else:
+                assert node is None
+        else:
+            node = price_level_index.search(key)
+            assert (node.value if node else None) == expected.get(key)
+
+        min_node = price_level_index.get_min()
+        assert (min_node.key if min_node else None) == min(expected, default=None)
+
+    assert [
+        (node.key, node.value) for node in price_level_index.iter_range()
+    ] == sorted(expected.items())
+
+
+def test_bulk_load(price_level_index):
+    keys = list(range(-20, 200, 3))
+    nodes = price_level_index.bulk_load((key, str(key)) for key in keys)
+    assert [node.key for node in nodes] == keys
+    assert [node.key for node in price_level_index.iter_range()] == keys
+    assert price_level_index.search(10).value == "10"
+
+    # The loaded index keeps working as if it had been built by inserts.
+    price_level_index.insert(12, "12")
+    assert price_level_index.delete(-20) is True
+    assert price_level_index.get_min().key == -17
+    assert [node.key for node in price_level_index.iter_range(9, 13)] == [10, 12, 13]
+
+
+def test_incomplete_backend_cannot_be_constructed():
+    class Incomplete(PriceLevelIndex):
+        def insert(self, key, value):
+            pass
+
+    with pytest.raises(TypeError):
+        Incomplete()
@@ -1,3 +1,5 @@
+import random
+
 import pytest
 
 from limit_order_book.skip_list import SkipList
@@ -99,3 +101,66 @@ def test_complex_inserts_and_deletes(skip_list):
         assert skip_list.delete(key) is True
         assert skip_list.search(key) is None
     assert skip_list.get_min() is None
+
+
+def test_pooled_nodes_are_reused(skip_list):
+    skip_list.enable_pooling()
+    for key in range(100):
+        skip_list.insert(key, key)
+    for key in range(100):
+        skip_list.delete(key)
+    assert skip_list.pool_stats() == {"created": 100, "reused": 0, "free": 100}
+
+    for key in range(100):
+        skip_list.insert(key, f"value_{key}")
+    assert skip_list.pool_stats()["reused"] > 0
+    assert [node.value for node in skip_list.iter_range()] == [
+        f"value_{key}" for key in range(100)
+    ]
+
+
+def test_pop_min_unlinks_every_level(skip_list):
+    for key in range(50):
+        skip_list.insert(key, key)
+    for key in range(50):
+        node = skip_list.pop_min()
+        assert node.key == key
+        assert node.value == key
+        assert all(
+            forward is None or forward.key > key
+            for forward in skip_list.header.forward
+        )
+    assert skip_list.pop_min() is None
+    assert skip_list.level == 1
+
+
+def test_near_head_operations_keep_levels_consistent(skip_list):
+    rng = random.Random(7)
+    reference = set()
+    for _ in range(3000):
+        # Keys cluster near the head, as resting orders near the touch do.
+        key = int(rng.expovariate(0.05))
+        operation = rng.random()
+        if operation < 0.5:
+            skip_list.insert(key, key)
+            reference.add(key)
+        elif operation < 0.8:
+            assert skip_list.delete(key) is (key in reference)
+            reference.discard(key)
+        elif reference:
+            assert skip_list.pop_min().key == min(reference)
+            reference.remove(min(reference))
+        assert (skip_list.search(key) is not None) is (key in reference)
+
+    for i in range(skip_list.max_level):
+        keys = []
+        node = skip_list.header.forward[i]
+        while node:
+            keys.append(node.key)
+            node = node.forward[i]
+        assert keys == sorted(keys)
+        assert set(keys) <= reference
+        if i == 0:
+            assert keys == sorted(reference)
+        else:
+            assert not keys or i < skip_list.level
@@ -0,0 +1,109 @@
+import gc
+import random
+
+import pytest
+
+from limit_order_book.array_limit_order_book import ArrayLimitOrderBook
+from limit_order_book.instrument import Instrument
+from limit_order_book.limit_order_book import LimitOrderBook
+from limit_order_book.order_arena import OrderArena
+
+
+@pytest.fixture
+def array_limit_order_book():
+    return ArrayLimitOrderBook(instrument=Instrument(tick_size="1"), capacity=4)
+
+
+def replay(limit_order_book, seed=13, num_operations=3000):
+    rng = random.Random(seed)
+    results = []
+    for i in range(num_operations):
+        if rng.random() < 0.6:
+            results.append(
+                limit_order_book.place_order(
+                    f"O{i}", rng.choice(["buy", "sell"]), rng.randint(95, 105), rng.randint(1, 10)
+                )
+            )
+        else:
+            results.append(limit_order_book.cancel_order(f"O{rng.randint(0, i)}"))
+    return results
+
+
+def test_requires_instrument():
+    with pytest.raises(ValueError):
+        ArrayLimitOrderBook(instrument=None)
+
+
+def test_arena_reuses_released_slots():
+    arena = OrderArena(capacity=2)
+    first_slot = arena.allocate()
+    second_slot = arena.allocate()
+    third_slot = arena.allocate()
+    assert arena.capacity == 4
+    assert len({first_slot, second_slot, third_slot}) == 3
+    arena.release(second_slot)
+    assert arena.allocate() == second_slot
+    assert len(arena) == 3
+
+
+def test_behaves_like_limit_order_book(array_limit_order_book):
+    limit_order_book = LimitOrderBook(instrument=Instrument(tick_size="1"))
+
+    assert replay(array_limit_order_book) == replay(limit_order_book)
+    assert (
+        array_limit_order_book.active_orders.keys()
+        == limit_order_book.active_orders.keys()
+    )
+    assert array_limit_order_book.filled_orders == limit_order_book.filled_orders
+    for side in ("buy", "sell"):
+        assert array_limit_order_book.depth(side, 100) == limit_order_book.depth(
+            side, 100
+        )
+    assert len(array_limit_order_book.arena) == len(
+        array_limit_order_book.active_orders
+    )
+
+
+def test_queue_order_is_preserved(array_limit_order_book):
+    for i in range(5):
+        array_limit_order_book.place_order(f"O{i}", "buy", 10, 1)
+    array_limit_order_book.cancel_order("O0")
+    array_limit_order_book.cancel_order("O2")
+    array_limit_order_book.cancel_order("O4")
+
+    arena = array_limit_order_book.arena
+    price_level = array_limit_order_book.best_bid()
+    assert [arena.order_ids[slot] for slot in arena.iter_queue(price_level)] == [
+        "O1",
+        "O3",
+    ]
+    assert array_limit_order_book.place_order("O5", "sell", 10, 2) == [
+        ("O1", "O5", 1, 10),
+        ("O3", "O5", 1, 10),
+    ]
+    assert array_limit_order_book.best_bid() is None
+
+
+def test_resting_orders_add_no_gc_tracked_objects(array_limit_order_book):
+    gc.collect()
+    num_tracked_objects = len(gc.get_objects())
+    for i in range(10_000):
+        array_limit_order_book.place_order(f"O{i}", "buy", 10 + i % 5, 1)
+    gc.collect()
+    assert len(gc.get_objects()) - num_tracked_objects < 100
+    assert not gc.is_tracked(array_limit_order_book.active_orders)
+
+
+def test_cancel_order_by_handle(array_limit_order_book):
+    handle, _ = array_limit_order_book.place_order(
+        "O1", "buy", 10, 5, return_handle=True
+    )
+    array_limit_order_book.place_order("O2", "sell", 10, 5)
+    new_handle, _ = array_limit_order_book.place_order(
+        "O3", "buy", 10, 5, return_handle=True
+    )
+
+    assert array_limit_order_book.cancel_handle(handle) is False
+    assert array_limit_order_book.cancel_handle(new_handle) is True
+    assert array_limit_order_book.cancel_order("O3") is False
+    assert array_limit_order_book.best_bid() is None
@@ -0,0 +1,98 @@
+from array import array
+from decimal import Decimal
+
+import pytest
+
+from limit_order_book.limit_order_book import LimitOrderBook
+
+
+def test_place_orders_matches_place_order():
+    order_ids = [f"O{i}" for i in range(8)]
+    order_sides = ["buy", "buy", "sell", "sell", "buy", "sell", "sell", "buy"]
+    order_prices = [10, 11, 12, 11, 12, 9, 13, 13]
+    order_quantities = [5, 3, 4, 6, 10, 8, 2, 1]
+
+    expected_matches = []
+    expected_order_indices = []
+    reference_limit_order_book = LimitOrderBook()
+    for i, order in enumerate(
+        zip(order_ids, order_sides, order_prices, order_quantities)
+    ):
+        matches = reference_limit_order_book.place_order(*order)
+        expected_matches.extend(matches)
+        expected_order_indices.extend([i] * len(matches))
+
+    limit_order_book = LimitOrderBook()
+    fills = limit_order_book.place_orders(
+        order_ids, order_sides, order_prices, order_quantities
+    )
+
+    assert list(fills) == expected_matches
+    assert len(fills) == len(expected_matches)
+    assert list(fills.order_indices) == expected_order_indices
+    assert isinstance(fills.quantities, array)
+    assert all(type(price) is Decimal for price in fills.prices)
+    assert (
+        limit_order_book.active_orders.keys()
+        == reference_limit_order_book.active_orders.keys()
+    )
+    assert limit_order_book.filled_orders == reference_limit_order_book.filled_orders
+
+
+def test_place_orders_without_matches():
+    limit_order_book = LimitOrderBook()
+    fills = limit_order_book.place_orders(["O1", "O2"], ["buy", "sell"], [1, 2], [1, 1])
+    assert len(fills) == 0
+    assert list(fills) == []
+    assert len(limit_order_book.active_orders) == 2
+
+
+def test_place_orders_accepts_tolist_columns():
+    class Column(list):
+        def tolist(self):
+            return list(self)
+
+    limit_order_book = LimitOrderBook()
+    fills = limit_order_book.place_orders(
+        Column(["O1", "O2"]),
+        Column(["buy", "sell"]),
+        Column([1.5, 1.5]),
+        Column([2, 2]),
+    )
+    assert list(fills) == [("O1", "O2", 2, Decimal(1.5))]
+    assert list(fills.order_indices) == [1]
+
+
+def test_place_orders_reads_float_prices_by_repr():
+    limit_order_book = LimitOrderBook()
+    limit_order_book.place_orders(["O1", "O2"], ["buy", "buy"], [99.97, 0.1], [1, 1])
+    assert limit_order_book.best_bid().price == Decimal("99.97")
+    assert list(limit_order_book.depth("buy")[0]) == [
+        Decimal("99.97"),
+        Decimal("0.1"),
+    ]
+
+
+def test_place_orders_accepts_numpy_columns():
+    numpy = pytest.importorskip("numpy")
+
+    limit_order_book = LimitOrderBook()
+    fills = limit_order_book.place_orders(
+        numpy.array(["O1", "O2", "O3"]),
+        numpy.array(["sell", "sell", "buy"]),
+        numpy.array([99.97, 99.98, 99.98]),
+        numpy.array([2, 3, 4], dtype=numpy.int64),
+    )
+    assert list(fills) == [
+        ("O3", "O1", 2, Decimal("99.97")),
+        ("O3", "O2", 2, Decimal("99.98")),
+    ]
+    assert all(type(order_id) is str for order_id in fills.buy_order_ids)
+    assert list(limit_order_book.active_orders) == ["O2"]
+    assert limit_order_book.best_ask().quantity == 1
+
+
+def test_place_orders_rejects_ragged_columns():
+    limit_order_book = LimitOrderBook()
+    with pytest.raises(ValueError):
+        limit_order_book.place_orders(["O1", "O2"], ["buy"], [1, 2], [1, 1])
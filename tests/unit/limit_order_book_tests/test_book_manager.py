@@ -0,0 +1,128 @@
+import random
+from decimal import Decimal
+
+import pytest
+
+from limit_order_book.book_manager import BookManager
+from limit_order_book.codec import ACCEPTED, ACK, FILL, UNKNOWN_ORDER
+from limit_order_book.instrument import Instrument
+from limit_order_book.journal import CANCEL, PLACE
+from limit_order_book.limit_order_book import LimitOrderBook
+
+SYMBOLS = ["AAA", "BBB", "CCC", "DDD", "EEE"]
+
+
+def submit_random_orders(manager, seed=3, num_orders=600):
+    rng = random.Random(seed)
+    for i in range(num_orders):
+        symbol = rng.choice(SYMBOLS)
+        if rng.random() < 0.7:
+            manager.new_order(
+                symbol,
+                f"O{i}",
+                rng.choice(["buy", "sell"]),
+                Decimal(rng.randint(95, 105)),
+                rng.randint(1, 10),
+            )
+        else:
+            manager.cancel_order(symbol, f"O{rng.randint(0, i)}")
+
+
+def run(manager):
+    responses = []
+    with manager:
+        for seed in range(3):
+            submit_random_orders(manager, seed)
+            responses.append(manager.flush())
+    return responses
+
+
+def test_single_process_mode():
+    manager = BookManager(instrument=Instrument("1"))
+    manager.new_order("AAA", "S1", "sell", Decimal("10"), 5)
+    manager.new_order("BBB", "S1", "sell", Decimal("10"), 5)
+    manager.new_order("AAA", "B1", "buy", Decimal("10"), 2)
+    manager.cancel_order("BBB", "B1")
+
+    assert manager.flush() == {
+        "AAA": [
+            (ACK, "S1", PLACE, ACCEPTED),
+            (ACK, "B1", PLACE, ACCEPTED),
+            (FILL, "B1", "S1", 2, Decimal("10")),
+        ],
+        "BBB": [
+            (ACK, "S1", PLACE, ACCEPTED),
+            (ACK, "B1", CANCEL, UNKNOWN_ORDER),
+        ],
+    }
+    assert manager.books["AAA"].best_ask().quantity == 3
+    assert manager.flush() == {}
+    assert manager.worker_of("AAA") == 0
+
+
+@pytest.mark.parametrize("num_workers", [1, 2, 3])
+@pytest.mark.parametrize("batch_size", [7, 4096])
+def test_workers_match_single_process_mode(num_workers, batch_size):
+    expected = run(BookManager(instrument=Instrument("1")))
+    manager = BookManager(num_workers, batch_size, instrument=Instrument("1"))
+    assert run(manager) == expected
+
+
+def test_full_batches_are_sent_before_flush():
+    with BookManager(2, batch_size=2) as manager:
+        for i in range(5):
+            manager.new_order("AAA", f"S{i}", "sell", Decimal("10"), 1)
+        worker = manager.worker_of("AAA")
+        assert manager.num_sent[worker] == 2
+        assert manager.num_pending[worker] == 1
+        responses = manager.flush()
+        assert responses["AAA"] == [
+            (ACK, f"S{i}", PLACE, ACCEPTED) for i in range(5)
+        ]
+        assert manager.num_sent == [0, 0]
+
+
+class FailingBook(LimitOrderBook):
+    def cancel_order(self, order_id):
+        if order_id == "FAIL":
+            raise RuntimeError(order_id)
+        return super().cancel_order(order_id)
+
+
+def test_worker_error_is_raised_after_every_reply():
+    symbols = ["DDD", "AAA", "BBB"]
+    with BookManager(2, book_factory=FailingBook) as manager:
+        assert [manager.worker_of(symbol) for symbol in symbols] == [0, 1, 1]
+        for symbol in symbols:
+            manager.new_order(symbol, "S1", "sell", Decimal("10"), 1)
+        # Fails on the worker whose replies are read first.
+        manager.cancel_order("DDD", "FAIL")
+        with pytest.raises(RuntimeError, match="FAIL"):
+            manager.flush()
+
+        # Nothing is left unread, and the workers go on serving.
+        for symbol in symbols:
+            manager.cancel_order(symbol, "S1")
+        assert manager.flush() == {
+            symbol: [(ACK, "S1", CANCEL, ACCEPTED)] for symbol in symbols
+        }
+
+
+def test_symbols_are_pinned_to_workers():
+    with BookManager(3) as manager:
+        workers = {symbol: manager.worker_of(symbol) for symbol in SYMBOLS}
+        assert set(workers.values()) <= {0, 1, 2}
+        assert workers == {symbol: manager.worker_of(symbol) for symbol in SYMBOLS}
+
+        manager.new_order("AAA", "S1", "sell", Decimal("10"), 5)
+        encoded = manager.flush(decode=False)
+        assert list(encoded) == ["AAA"]
+        assert type(encoded["AAA"]) is bytes
+
+
+def test_close_survives_dead_worker():
+    manager = BookManager(2)
+    manager.processes[0].kill()
+    manager.processes[0].join()
+    manager.close()
+    assert manager.processes == []
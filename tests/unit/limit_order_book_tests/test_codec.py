@@ -0,0 +1,90 @@
+from decimal import Decimal
+
+import pytest
+
+from limit_order_book.codec import (
+    FILL_MESSAGE,
+    ORDER,
+    MessageWriter,
+    decode_fills,
+    decode_orders,
+)
+from limit_order_book.instrument import Instrument
+from limit_order_book.journal import AMEND, CANCEL, PLACE
+from limit_order_book.limit_order_book import LimitOrderBook
+
+
+def test_message_sizes():
+    assert ORDER.size == 56
+    assert FILL_MESSAGE.size == 88
+
+
+def test_order_messages_round_trip():
+    writer = MessageWriter(capacity=ORDER.size)
+    writer.new_order("O1", "buy", Decimal("10.25"), 5)
+    writer.new_order("O2", "sell", None, 3, "market")
+    writer.cancel_order("O1")
+    writer.amend_order("O3", 7)
+    writer.amend_order("O4", new_price=Decimal("9.5"))
+
+    assert len(writer) == 5 * ORDER.size
+    assert list(decode_orders(writer.getbuffer())) == [
+        (PLACE, "O1", "buy", Decimal("10.25"), 5, "limit"),
+        (PLACE, "O2", "sell", None, 3, "market"),
+        (CANCEL, "O1", None, None, None, None),
+        (AMEND, "O3", None, None, 7, None),
+        (AMEND, "O4", None, Decimal("9.5"), None, None),
+    ]
+
+
+def test_fill_messages_round_trip():
+    writer = MessageWriter()
+    matches = [("B1", "S1", 4, Decimal("10.5")), ("B1", "S2", 1, Decimal("11"))]
+    for match in matches:
+        writer.fill(match)
+
+    assert list(decode_fills(writer.getbuffer())) == matches
+    writer.clear()
+    assert len(writer) == 0
+    assert list(decode_fills(writer.getbuffer())) == []
+
+
+def test_rejects_long_order_ids():
+    with pytest.raises(ValueError):
+        MessageWriter().cancel_order("O" * 33)
+
+
+def test_rejects_priceless_limit_order():
+    message = ORDER.pack(PLACE, 0, 0, 0, 0, 0, 5, b"O1")
+    with pytest.raises(ValueError):
+        list(decode_orders(message))
+
+
+def test_process_messages():
+    book = LimitOrderBook(instrument=Instrument("0.5"))
+    writer = MessageWriter()
+    writer.new_order("S1", "sell", Decimal("10.5"), 5)
+    writer.new_order("S2", "sell", Decimal("11"), 5)
+    writer.new_order("B1", "buy", Decimal("10.5"), 2)
+    writer.cancel_order("S2")
+    writer.amend_order("S1", new_price=Decimal("10"))
+    writer.new_order("B2", "buy", Decimal("10"), 1)
+
+    receive_buffer = bytearray(writer.getbuffer())
+    assert book.process_messages(memoryview(receive_buffer)) == [
+        ("B1", "S1", 2, Decimal("10.5")),
+        ("B2", "S1", 1, Decimal("10")),
+    ]
+    assert book.active_orders.keys() == {"S1"}
+    assert book.best_ask().quantity == 2
+
+
+def test_process_messages_encodes_fills():
+    book = LimitOrderBook()
+    orders = MessageWriter()
+    orders.new_order("S1", "sell", Decimal("10"), 5)
+    orders.new_order("B1", "buy", Decimal("10"), 3, "ioc")
+    fills = MessageWriter()
+
+    assert book.process_messages(orders.getbuffer(), fills.fill) is None
+    assert list(decode_fills(fills.getbuffer())) == [("B1", "S1", 3, Decimal("10"))]
@@ -0,0 +1,62 @@
+from decimal import Decimal
+
+import pytest
+
+
+@pytest.fixture
+def populated_limit_order_book(book):
+    for i, (side, price, quantity) in enumerate(
+        [
+            ("buy", "99", 1),
+            ("buy", "99", 2),
+            ("buy", "98.5", 4),
+            ("buy", "97", 8),
+            ("sell", "100", 16),
+            ("sell", "101.5", 32),
+            ("sell", "101.5", 64),
+        ]
+    ):
+        book.place_order(f"O{i}", side, Decimal(price), quantity)
+    return book
+
+
+def as_lists(depth):
+    prices, quantities, order_counts = depth
+    return list(prices), list(quantities), list(order_counts)
+
+
+def test_depth_buy_side(populated_limit_order_book):
+    assert as_lists(populated_limit_order_book.depth("buy", levels=2)) == (
+        [Decimal("99"), Decimal("98.5")],
+        [3, 4],
+        [2, 1],
+    )
+
+
+def test_depth_sell_side(populated_limit_order_book):
+    assert as_lists(populated_limit_order_book.depth("sell")) == (
+        [Decimal("100"), Decimal("101.5")],
+        [16, 96],
+        [1, 2],
+    )
+
+
+def test_depth_range(populated_limit_order_book):
+    assert as_lists(populated_limit_order_book.depth_range("buy", 97, "98.7")) == (
+        [Decimal("98.5"), Decimal("97")],
+        [4, 8],
+        [1, 1],
+    )
+    assert as_lists(
+        populated_limit_order_book.depth_range("sell", "100.1", 200)
+    ) == ([Decimal("101.5")], [96], [2])
+    assert as_lists(populated_limit_order_book.depth_range("sell", 0, 99)) == (
+        [],
+        [],
+        [],
+    )
+
+
+def test_depth_rejects_unknown_side(populated_limit_order_book):
+    with pytest.raises(ValueError):
+        populated_limit_order_book.depth("bid")
@@ -0,0 +1,71 @@
+from decimal import Decimal
+
+import pytest
+
+from limit_order_book.fills import FillRingBuffer
+
+
+def place_resting_asks(limit_order_book):
+    limit_order_book.place_order("S1", "sell", 10, 2)
+    limit_order_book.place_order("S2", "sell", 11, 3)
+
+
+def test_submit_order_pushes_matches_to_callback(limit_order_book):
+    place_resting_asks(limit_order_book)
+    matches = []
+    limit_order_book.set_fill_sink(matches.append)
+
+    assert limit_order_book.submit_order("B1", "buy", 9, 1) is not None
+    assert matches == []
+    assert limit_order_book.submit_order("B2", "buy", 11, 4) is None
+    assert matches == [
+        ("B2", "S1", 2, Decimal("10")),
+        ("B2", "S2", 2, Decimal("11")),
+    ]
+
+
+def test_submit_order_requires_fill_sink(limit_order_book):
+    with pytest.raises(ValueError):
+        limit_order_book.submit_order("B1", "buy", 9, 1)
+
+
+def test_submit_order_into_ring_buffer(limit_order_book):
+    place_resting_asks(limit_order_book)
+    fills = FillRingBuffer(capacity=1)
+    limit_order_book.set_fill_sink(fills.append)
+
+    limit_order_book.submit_order("B1", "buy", 11, 4)
+    assert len(fills) == 2
+    assert fills.pop() == ("B1", "S1", 2, Decimal("10"))
+    limit_order_book.submit_order("B2", "buy", 11, 1)
+    assert list(fills.drain()) == [
+        ("B1", "S2", 2, Decimal("11")),
+        ("B2", "S2", 1, Decimal("11")),
+    ]
+    assert fills.pop() is None
+
+
+def test_ring_buffer_wraps_and_grows():
+    fills = FillRingBuffer(capacity=3)
+    for i in range(3):
+        fills.append((f"B{i}", f"S{i}", i, Decimal(i)))
+    assert fills.pop()[0] == "B0"
+    fills.append(("B3", "S3", 3, Decimal(3)))
+    assert fills.capacity == 3
+    fills.append(("B4", "S4", 4, Decimal(4)))
+    assert fills.capacity == 6
+    assert [match[2] for match in fills.drain()] == [1, 2, 3, 4]
+
+
+def test_place_order_iter(limit_order_book):
+    place_resting_asks(limit_order_book)
+    matches = limit_order_book.place_order_iter("B1", "buy", 11, 4)
+    # The order is processed in full before any match is consumed.
+    assert limit_order_book.best_ask().quantity == 1
+    assert next(matches) == ("B1", "S1", 2, Decimal("10"))
+    assert list(matches) == [("B1", "S2", 2, Decimal("11"))]
+    assert list(limit_order_book.place_order_iter("B2", "buy", 9, 1)) == []
+
+    # Placing does not depend on iterating.
+    limit_order_book.place_order_iter("B3", "buy", 9, 1)
+    assert "B3" in limit_order_book.active_orders
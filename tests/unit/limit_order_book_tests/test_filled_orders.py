@@ -0,0 +1,88 @@
+import functools
+
+import pytest
+
+from limit_order_book.filled_orders import BloomFilter, FilledOrders
+from limit_order_book.limit_order_book import LimitOrderBook
+
+
+@pytest.fixture(params=[0, 1 << 12], ids=["without_bloom", "with_bloom"])
+def filled_orders(request):
+    return FilledOrders(generation_size=10, generations=3, bloom_bits=request.param)
+
+
+def test_bloom_filter_has_no_false_negatives():
+    bloom_filter = BloomFilter(1 << 10)
+    for i in range(100):
+        bloom_filter.add(f"O{i}")
+    assert all(f"O{i}" in bloom_filter for i in range(100))
+    bloom_filter.clear()
+    assert "O1" not in bloom_filter
+
+
+def test_ids_are_retained_within_window(filled_orders):
+    for i in range(25):
+        filled_orders.add(f"O{i}")
+    assert all(f"O{i}" in filled_orders for i in range(25))
+    assert "O25" not in filled_orders
+    assert len(filled_orders) == 25
+
+
+def test_oldest_generation_is_evicted(filled_orders):
+    for i in range(31):
+        filled_orders.add(f"O{i}")
+    assert all(f"O{i}" not in filled_orders for i in range(10))
+    assert all(f"O{i}" in filled_orders for i in range(10, 31))
+    assert len(filled_orders) == 21
+
+
+def test_memory_stays_bounded(filled_orders):
+    for i in range(10_000):
+        filled_orders.add(i)
+        assert len(filled_orders) <= 30
+
+
+def test_update_fills_generations_in_chunks(filled_orders):
+    filled_orders.add("O0")
+    filled_orders.update([f"O{i}" for i in range(1, 25)])
+    assert [len(generation) for generation in filled_orders.generations] == [
+        10,
+        10,
+        5,
+    ]
+    assert all(f"O{i}" in filled_orders for i in range(25))
+    filled_orders.update([f"P{i}" for i in range(6)])
+    assert "O0" not in filled_orders
+    assert "P5" in filled_orders
+
+
+def test_invalid_configuration_is_rejected():
+    with pytest.raises(ValueError):
+        FilledOrders(generation_size=0)
+
+
+def test_cancel_filled_order_within_window():
+    limit_order_book = LimitOrderBook(
+        filled_orders=functools.partial(FilledOrders, generation_size=2)
+    )
+    limit_order_book.place_order("O1", "buy", 1, 1)
+    limit_order_book.place_order("O2", "sell", 1, 1)
+    # O1 is filled, then its id is reused by a resting order.
+    limit_order_book.place_order("O1", "buy", 1, 1)
+
+    assert "O1" in limit_order_book.filled_orders
+    assert limit_order_book.cancel_order("O1") is False
+    assert "O1" in limit_order_book.active_orders
+
+
+def test_filled_orders_stay_bounded_in_book():
+    limit_order_book = LimitOrderBook(
+        filled_orders=functools.partial(FilledOrders, generation_size=50)
+    )
+    for i in range(1000):
+        limit_order_book.place_order(f"B{i}", "buy", 1, 1)
+        limit_order_book.place_order(f"S{i}", "sell", 1, 1)
+    assert len(limit_order_book.filled_orders) <= 100
+    assert "S999" in limit_order_book.filled_orders
+    assert "S0" not in limit_order_book.filled_orders
+    assert limit_order_book.cancel_order("S999") is False
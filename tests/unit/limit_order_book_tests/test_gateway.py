@@ -0,0 +1,286 @@
+import asyncio
+from decimal import Decimal
+
+import pytest
+
+from limit_order_book.codec import (
+    ACCEPTED,
+    ACK,
+    FILL,
+    ORDER,
+    REJECTED,
+    UNKNOWN_ORDER,
+    MessageWriter,
+    decode_responses,
+)
+from limit_order_book.gateway import OrderGateway, read_responses
+from limit_order_book.instrument import Instrument
+from limit_order_book.journal import AMEND, CANCEL, PLACE
+from limit_order_book.limit_order_book import LimitOrderBook
+
+
+async def exchange(connect, book):
+    gateway = OrderGateway(book)
+    reader, writer = await connect(gateway)
+    try:
+        messages = MessageWriter()
+        messages.new_order("S1", "sell", Decimal("10.5"), 5)
+        messages.new_order("S2", "sell", Decimal("11"), 5)
+        messages.new_order("B1", "buy", Decimal("11"), 7)
+        messages.new_order("B2", "buy", Decimal("10.25"), 1)  # off the tick grid
+        messages.cancel_order("S1")
+        messages.amend_order("S2", 2)
+        buffer = bytes(messages.getbuffer())
+        # Split mid-message to exercise reassembly.
+        writer.write(buffer[:100])
+        await writer.drain()
+        writer.write(buffer[100:])
+        await writer.drain()
+        responses = await read_responses(reader, 8)
+    finally:
+        writer.close()
+        await writer.wait_closed()
+        await gateway.close()
+    return gateway, responses
+
+
+EXPECTED_RESPONSES = [
+    (ACK, "S1", PLACE, ACCEPTED),
+    (ACK, "S2", PLACE, ACCEPTED),
+    (ACK, "B1", PLACE, ACCEPTED),
+    (FILL, "B1", "S1", 5, Decimal("10.5")),
+    (FILL, "B1", "S2", 2, Decimal("11.0")),
+    (ACK, "B2", PLACE, REJECTED),
+    (ACK, "S1", CANCEL, UNKNOWN_ORDER),
+    (ACK, "S2", AMEND, ACCEPTED),
+]
+
+
+def test_gateway_over_unix_socket(tmp_path):
+    path = str(tmp_path / "gateway.sock")
+
+    async def connect(gateway):
+        await gateway.start_unix(path)
+        return await asyncio.open_unix_connection(path)
+
+    book = LimitOrderBook(instrument=Instrument("0.5"))
+    gateway, responses = asyncio.run(exchange(connect, book))
+    assert responses == EXPECTED_RESPONSES
+    assert gateway.num_messages == 6
+    assert book.best_ask().quantity == 2
+
+
+def test_gateway_over_tcp():
+    async def connect(gateway):
+        server = await gateway.start_tcp()
+        host, port = server.sockets[0].getsockname()[:2]
+        return await asyncio.open_connection(host, port)
+
+    book = LimitOrderBook(instrument=Instrument("0.5"))
+    _, responses = asyncio.run(exchange(connect, book))
+    assert responses == EXPECTED_RESPONSES
+
+
+def test_gateway_batches_across_connections(tmp_path):
+    path = str(tmp_path / "gateway.sock")
+
+    async def run():
+        gateway = OrderGateway(LimitOrderBook(), max_queued_chunks=2)
+        await gateway.start_unix(path)
+        connections = [await asyncio.open_unix_connection(path) for _ in range(3)]
+        for i, (_, writer) in enumerate(connections):
+            messages = MessageWriter()
+            for j in range(100):
+                messages.new_order(f"O{i}-{j}", "buy", Decimal(90 + j % 10), 1)
+            writer.write(bytes(messages.getbuffer()))
+        results = [await read_responses(reader, 100) for reader, _ in connections]
+        for _, writer in connections:
+            writer.close()
+        await gateway.close()
+        return gateway, results
+
+    gateway, results = asyncio.run(run())
+    for i, responses in enumerate(results):
+        assert responses == [
+            (ACK, f"O{i}-{j}", PLACE, ACCEPTED) for j in range(100)
+        ]
+    assert gateway.num_messages == 300
+    assert gateway.num_batches <= 300
+
+
+def place_messages(*order_ids):
+    messages = MessageWriter()
+    for order_id in order_ids:
+        messages.new_order(order_id, "buy", Decimal("10"), 1)
+    return bytes(messages.getbuffer())
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        b"\x09" + bytes(55),
+        # A limit order without the HAS_PRICE flag.
+        ORDER.pack(PLACE, 0, 0, 0, 0, 0, 5, b"O1"),
+        # An unknown side.
+        ORDER.pack(PLACE, 7, 0, 0, 1, 10, 5, b"O1"),
+    ],
+)
+def test_gateway_closes_connection_on_malformed_message(tmp_path, payload):
+    path = str(tmp_path / "gateway.sock")
+
+    async def run():
+        gateway = OrderGateway(LimitOrderBook())
+        await gateway.start_unix(path)
+        reader, writer = await asyncio.open_unix_connection(path)
+        writer.write(payload)
+        data = await reader.read()
+        writer.close()
+
+        # The gateway keeps serving other connections.
+        reader, writer = await asyncio.open_unix_connection(path)
+        writer.write(place_messages("O2"))
+        responses = await read_responses(reader, 1)
+        writer.close()
+        await gateway.close()
+        return data, responses
+
+    data, responses = asyncio.run(run())
+    assert data == b""
+    assert responses == [(ACK, "O2", PLACE, ACCEPTED)]
+
+
+def test_gateway_sends_fills_to_both_connections(tmp_path):
+    path = str(tmp_path / "gateway.sock")
+
+    async def run():
+        gateway = OrderGateway(LimitOrderBook())
+        await gateway.start_unix(path)
+        seller_reader, seller = await asyncio.open_unix_connection(path)
+        buyer_reader, buyer = await asyncio.open_unix_connection(path)
+        messages = MessageWriter()
+        messages.new_order("S1", "sell", Decimal("10"), 2)
+        messages.new_order("S2", "sell", Decimal("11"), 2)
+        seller.write(bytes(messages.getbuffer()))
+        seller_responses = await read_responses(seller_reader, 2)
+        messages = MessageWriter()
+        messages.new_order("B1", "buy", Decimal("11"), 3)
+        buyer.write(bytes(messages.getbuffer()))
+        buyer_responses = await read_responses(buyer_reader, 3)
+        seller_responses += await read_responses(seller_reader, 2)
+        seller.close()
+        buyer.close()
+        await gateway.close()
+        return seller_responses, buyer_responses
+
+    seller_responses, buyer_responses = asyncio.run(run())
+    fills = [
+        (FILL, "B1", "S1", 2, Decimal("10")),
+        (FILL, "B1", "S2", 1, Decimal("11")),
+    ]
+    assert buyer_responses == [(ACK, "B1", PLACE, ACCEPTED)] + fills
+    assert seller_responses == [
+        (ACK, "S1", PLACE, ACCEPTED),
+        (ACK, "S2", PLACE, ACCEPTED),
+    ] + fills
+
+
+def test_gateway_closes_with_connected_client(tmp_path):
+    path = str(tmp_path / "gateway.sock")
+
+    async def run():
+        gateway = OrderGateway(LimitOrderBook())
+        await gateway.start_unix(path)
+        reader, writer = await asyncio.open_unix_connection(path)
+        writer.write(place_messages("O1"))
+        await read_responses(reader, 1)
+        await asyncio.wait_for(gateway.close(), 5)
+        data = await reader.read()
+        writer.close()
+        return gateway, data
+
+    gateway, data = asyncio.run(run())
+    assert data == b""
+    assert not gateway.connections
+
+
+class RecordingTransport:
+    def __init__(self) -> None:
+        self.write_buffer_size = 0
+        self.aborted = False
+
+    def get_write_buffer_size(self):
+        return self.write_buffer_size
+
+    def abort(self):
+        self.aborted = True
+
+
+class RecordingWriter:
+    def __init__(self) -> None:
+        self.data = bytearray()
+        self.closed = False
+        self.transport = RecordingTransport()
+
+    def writelines(self, buffers):
+        for buffer in buffers:
+            self.data += buffer
+
+    def close(self):
+        self.closed = True
+
+
+def test_gateway_drops_chunks_queued_by_closed_connection():
+    async def run():
+        book = LimitOrderBook()
+        gateway = OrderGateway(book)
+        gateway.matcher = asyncio.create_task(gateway._match())
+        bad, good = RecordingWriter(), RecordingWriter()
+        await gateway.queue.put((bad, place_messages("B1") + b"\x09" + bytes(55)))
+        while not bad.closed:
+            await asyncio.sleep(0)
+        # Queued by the reader before it saw the connection close.
+        await gateway.queue.put((bad, place_messages("B2")))
+        await gateway.queue.put((bad, None))
+        await gateway.queue.put((good, place_messages("G1")))
+        await gateway.queue.put((good, None))
+        while not good.closed:
+            await asyncio.sleep(0)
+        await gateway.close()
+        return book, bad, good
+
+    book, bad, good = asyncio.run(run())
+    assert book.active_orders.keys() == {"B1", "G1"}
+    assert [response[1] for response in read_all(bad.data)] == ["B1"]
+    assert [response[1] for response in read_all(good.data)] == ["G1"]
+
+
+def read_all(data):
+    responses, consumed = decode_responses(data)
+    assert consumed == len(data)
+    return responses
+
+
+def test_gateway_aborts_slow_reader():
+    async def run():
+        book = LimitOrderBook()
+        gateway = OrderGateway(book, max_unread_bytes=1000)
+        gateway.matcher = asyncio.create_task(gateway._match())
+        slow, good = RecordingWriter(), RecordingWriter()
+        slow.transport.write_buffer_size = 1001
+        await gateway.queue.put((slow, place_messages("S1")))
+        await gateway.queue.put((good, place_messages("G1")))
+        while not slow.closed:
+            await asyncio.sleep(0)
+        await gateway.queue.put((slow, place_messages("S2")))
+        await gateway.queue.put((good, place_messages("G2")))
+        await gateway.queue.put((good, None))
+        while not good.closed:
+            await asyncio.sleep(0)
+        await gateway.close()
+        return book, slow, good
+
+    book, slow, good = asyncio.run(run())
+    assert slow.transport.aborted
+    assert not good.transport.aborted
+    assert book.active_orders.keys() == {"S1", "G1", "G2"}
+    assert [response[1] for response in read_all(good.data)] == ["G1", "G2"]
@@ -0,0 +1,107 @@
+from decimal import Decimal
+
+import pytest
+
+from limit_order_book.instrument import Instrument
+from limit_order_book.limit_order_book import LimitOrderBook
+from limit_order_book.price_ladder import PriceLadder
+
+
+@pytest.fixture
+def instrument():
+    return Instrument(tick_size="0.01", lot_size=10)
+
+
+@pytest.fixture
+def tick_limit_order_book(instrument):
+    return LimitOrderBook(instrument=instrument)
+
+
+def test_price_to_ticks(instrument):
+    assert instrument.price_to_ticks(Decimal("99.99")) == 9999
+    assert instrument.price_to_ticks("100") == 10000
+    assert instrument.price_to_ticks(99.99) == 9999
+    assert instrument.price_to_ticks(1) == 100
+
+
+def test_ticks_to_price(instrument):
+    assert instrument.ticks_to_price(9999) == Decimal("99.99")
+
+
+def test_price_off_tick_grid_is_rejected(instrument):
+    with pytest.raises(ValueError):
+        instrument.price_to_ticks(Decimal("99.995"))
+
+
+def test_quantity_off_lot_size_is_rejected(tick_limit_order_book):
+    with pytest.raises(ValueError):
+        tick_limit_order_book.place_order(
+            order_id="O1", order_side="buy", order_price=1, order_quantity=15
+        )
+    assert len(tick_limit_order_book.active_orders) == 0
+
+
+def test_invalid_instrument_is_rejected():
+    with pytest.raises(ValueError):
+        Instrument(tick_size=0)
+    with pytest.raises(ValueError):
+        Instrument(tick_size="0.01", lot_size=0)
+
+
+def test_resting_orders_are_keyed_by_ticks(tick_limit_order_book):
+    tick_limit_order_book.place_order(
+        order_id="O1",
+        order_side="buy",
+        order_price=Decimal("99.99"),
+        order_quantity=10,
+    )
+    tick_limit_order_book.place_order(
+        order_id="O2",
+        order_side="sell",
+        order_price=Decimal("100.01"),
+        order_quantity=10,
+    )
+
+    buy_level_node = tick_limit_order_book.buy_orders.get_min()
+    assert buy_level_node.key == -9999
+    assert type(buy_level_node.key) is int
+    assert buy_level_node.value.price == Decimal("99.99")
+    assert buy_level_node.value.queue.head.next.data.order_price == 9999
+
+    sell_level_node = tick_limit_order_book.sell_orders.get_min()
+    assert sell_level_node.key == 10001
+    assert sell_level_node.value.price == Decimal("100.01")
+
+
+def test_fills_report_decimal_prices(tick_limit_order_book):
+    tick_limit_order_book.place_order(
+        order_id="O1",
+        order_side="sell",
+        order_price=Decimal("99.98"),
+        order_quantity=10,
+    )
+    tick_limit_order_book.place_order(
+        order_id="O2",
+        order_side="sell",
+        order_price=Decimal("99.99"),
+        order_quantity=10,
+    )
+    matches = tick_limit_order_book.place_order(
+        order_id="O3",
+        order_side="buy",
+        order_price=Decimal("100.00"),
+        order_quantity=20,
+    )
+
+    assert matches == [
+        ("O3", "O1", 10, Decimal("99.98")),
+        ("O3", "O2", 10, Decimal("99.99")),
+    ]
+    assert all(type(match[3]) is Decimal for match in matches)
+    assert tick_limit_order_book.sell_orders.get_min() is None
+    assert tick_limit_order_book.cancel_order("O3") is False
+
+
+def test_price_ladder_requires_instrument():
+    with pytest.raises(ValueError):
+        LimitOrderBook(price_index=PriceLadder)
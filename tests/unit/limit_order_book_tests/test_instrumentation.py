@@ -0,0 +1,176 @@
+import random
+import time
+from decimal import Decimal
+
+import pytest
+
+from limit_order_book.array_limit_order_book import ArrayLimitOrderBook
+from limit_order_book.instrument import Instrument
+from limit_order_book.journal import Journal, read_journal
+from limit_order_book.limit_order_book import LimitOrderBook
+from limit_order_book.price_ladder import PriceLadder
+from limit_order_book.skip_list import SkipList
+
+
+def replay(limit_order_book, seed=5, num_operations=2000):
+    rng = random.Random(seed)
+    results = []
+    for i in range(num_operations):
+        if rng.random() < 0.6:
+            results.append(
+                limit_order_book.place_order(
+                    f"O{i}",
+                    rng.choice(["buy", "sell"]),
+                    rng.randint(95, 105),
+                    rng.randint(1, 10),
+                )
+            )
+        else:
+            results.append(limit_order_book.cancel_order(f"O{rng.randint(0, i)}"))
+    return results
+
+
+def test_uninstrumented_book_has_no_metrics():
+    book = LimitOrderBook()
+    assert book.metrics is None
+    assert book.metrics_snapshot() is None
+    assert "_place_order" not in vars(book)
+
+
+@pytest.mark.parametrize(
+    "make_book",
+    [
+        lambda **kwargs: LimitOrderBook(**kwargs),
+        lambda **kwargs: LimitOrderBook(
+            instrument=Instrument("1"), price_index=PriceLadder, **kwargs
+        ),
+        lambda **kwargs: ArrayLimitOrderBook(Instrument("1"), **kwargs),
+    ],
+)
+def test_instrumented_book_behaves_the_same(make_book):
+    assert replay(make_book(instrumented=True)) == replay(make_book())
+
+
+def test_counters():
+    book = LimitOrderBook(instrumented=True)
+    book.place_order("S1", "sell", Decimal("101"), 5)
+    book.place_order("S2", "sell", Decimal("101"), 5)
+    book.place_order("S3", "sell", Decimal("102"), 5)
+    book.place_order("B1", "buy", Decimal("99"), 5)
+    # Sweeps the level at 101 and part of 102.
+    book.place_order("B2", "buy", Decimal("102"), 12)
+    assert book.cancel_order("B1")
+    assert not book.cancel_order("S1")
+    assert not book.cancel_order("X")
+
+    snapshot = book.metrics_snapshot()
+    assert {name: snapshot[name] for name in book.metrics.counters} == {
+        "orders_placed": 5,
+        "orders_matched": 3,
+        "levels_created": 3,
+        "levels_deleted": 2,
+        "skip_list_nodes_traversed": snapshot["skip_list_nodes_traversed"],
+        "cancels": 1,
+        "cancels_unknown": 1,
+        "cancels_filled": 1,
+        "amends": 0,
+    }
+    assert snapshot["place_order_ns_count"] == 5
+    assert snapshot["cancel_order_ns_count"] == 3
+    assert snapshot["sweep_level_ns_count"] == 1
+    assert snapshot["new_price_level_ns_count"] == 3
+    assert snapshot["matches_per_order_max"] == 3
+    assert snapshot["matches_per_order_sum"] == 3
+    assert snapshot["index_search_ns_p99"] > 0
+    assert all(type(value) is int for value in snapshot.values())
+
+    book.metrics.reset()
+    assert book.metrics_snapshot()["orders_placed"] == 0
+
+
+def test_counts_skip_list_nodes_traversed():
+    book = LimitOrderBook(instrumented=True)
+    for price in range(100, 110):
+        book.place_order(f"S{price}", "sell", price, 1)
+    traversed = book.metrics.counters["skip_list_nodes_traversed"]
+    assert traversed > 0
+
+    skip_list = book.sell_orders
+    assert skip_list.traversal_length(109) >= 1
+    book.cancel_order("S109")
+    assert book.metrics.counters["skip_list_nodes_traversed"] > traversed
+
+
+def test_traversal_walks_are_not_timed():
+    book = LimitOrderBook()
+    for skip_list in (book.buy_orders, book.sell_orders):
+        traversal_length = skip_list.traversal_length
+
+        def slow_traversal_length(key, traversal_length=traversal_length):
+            time.sleep(0.01)
+            return traversal_length(key)
+
+        skip_list.traversal_length = slow_traversal_length
+    book._instrument()
+    book.place_order("S1", "sell", 101, 1)
+    book.cancel_order("S1")
+
+    snapshot = book.metrics_snapshot()
+    assert snapshot["place_order_ns_max"] < 5_000_000
+    assert snapshot["cancel_order_ns_max"] < 5_000_000
+
+
+def test_amends_are_not_counted_as_cancels_or_placements():
+    book = LimitOrderBook(instrumented=True)
+    book.place_order("S1", "sell", Decimal("101"), 5)
+    book.place_order("B1", "buy", Decimal("99"), 5)
+    assert book.amend_order("B1", new_quantity=3) == []
+    assert book.amend_order("B1", new_price=Decimal("101")) == [
+        ("B1", "S1", 3, Decimal("101"))
+    ]
+    handle, _ = book.place_order("B2", "buy", Decimal("98"), 5, return_handle=True)
+    book.amend_handle(handle, new_price=Decimal("97"))
+
+    counters = book.metrics.counters
+    assert counters["amends"] == 3
+    assert counters["orders_placed"] == 3
+    assert counters["orders_matched"] == 0
+    assert counters["cancels"] == 0
+    assert book.metrics_snapshot()["place_order_ns_count"] == 3
+    assert book.metrics_snapshot()["cancel_order_ns_count"] == 0
+
+
+def test_traversal_length_of_empty_skip_list():
+    assert SkipList().traversal_length(5) == 0
+
+
+def test_instrumentation_wraps_journal(tmp_path):
+    path = tmp_path / "book.journal"
+    with Journal(path) as journal:
+        book = LimitOrderBook(journal=journal, instrumented=True)
+        book.place_order("O1", "buy", Decimal("10"), 5)
+        book.cancel_order("O1")
+
+    assert [record[2] for record in read_journal(path)] == ["O1", "O1"]
+    assert book.metrics.counters["orders_placed"] == 1
+    assert book.metrics.counters["cancels"] == 1
+
+
+def test_recovered_book_stays_instrumented(tmp_path):
+    path = tmp_path / "book.journal"
+    with Journal(path) as journal:
+        book = LimitOrderBook(journal=journal)
+        book.place_order("O1", "buy", Decimal("10"), 5)
+        book.place_order("O2", "buy", Decimal("9"), 5)
+
+    with Journal(path) as journal:
+        book = LimitOrderBook.recover(path, journal=journal, instrumented=True)
+        # Replayed operations are not counted.
+        assert book.metrics.counters["orders_placed"] == 0
+        book.place_order("O3", "sell", Decimal("11"), 1)
+        book.cancel_order("O2")
+
+    assert [record[2] for record in read_journal(path)] == ["O1", "O2", "O3", "O2"]
+    assert book.metrics.counters["orders_placed"] == 1
+    assert book.metrics.counters["cancels"] == 1
+    assert book.metrics.counters["levels_created"] == 1
@@ -0,0 +1,143 @@
+from decimal import Decimal
+
+import pytest
+
+from limit_order_book.array_limit_order_book import ArrayLimitOrderBook
+from limit_order_book.instrument import Instrument
+from limit_order_book.journal import (
+    AMEND,
+    CANCEL,
+    PLACE,
+    RECORD,
+    Journal,
+    read_journal,
+)
+from limit_order_book.limit_order_book import LimitOrderBook
+
+
+def place_and_cancel(book):
+    book.place_order("O1", "buy", Decimal("10.5"), 5)
+    book.place_order("O2", "buy", Decimal("10"), 3)
+    handle, _ = book.place_order("O3", "sell", Decimal("11"), 4, return_handle=True)
+    book.place_order("O4", "sell", Decimal("10.5"), 2)
+    book.place_order("O5", "sell", Decimal("12"), 1)
+    book.cancel_order("O2")
+    book.cancel_handle(handle)
+    book.cancel_order("O4")  # filled, not journaled
+    book.place_order("O6", "hold", Decimal("10"), 1)  # invalid side, not journaled
+
+
+def assert_same_book(book, recovered):
+    assert recovered.active_orders.keys() == book.active_orders.keys()
+    for side in ("buy", "sell"):
+        assert recovered.depth(side) == book.depth(side)
+    assert recovered.filled_orders == book.filled_orders
+    assert recovered.sequence == book.sequence
+
+
+def test_journal_round_trip(tmp_path):
+    path = tmp_path / "book.journal"
+    with Journal(path) as journal:
+        journal.append_place(1, "O1", "buy", Decimal("10.25"), 5)
+        journal.append_cancel(2, "O1")
+        journal.append_place(3, "O2", "sell", None, 2, "market")
+        journal.append_amend(4, "O3", 7)
+
+    assert list(read_journal(path)) == [
+        (PLACE, 1, "O1", "buy", Decimal("10.25"), 5, "limit"),
+        (CANCEL, 2, "O1", None, None, None, None),
+        (PLACE, 3, "O2", "sell", None, 2, "market"),
+        (AMEND, 4, "O3", None, None, 7, None),
+    ]
+
+
+def test_read_journal_ignores_partial_record(tmp_path):
+    path = tmp_path / "book.journal"
+    with Journal(path, fsync="never") as journal:
+        journal.append_place(1, "O1", "sell", Decimal("7"), 1)
+        journal.append_place(2, "O2", "sell", Decimal("8"), 1)
+    with open(path, "r+b") as file:
+        file.truncate(RECORD.size + RECORD.size // 2)
+
+    assert [record[2] for record in read_journal(path)] == ["O1"]
+
+
+def test_journal_rejects_unknown_fsync_policy(tmp_path):
+    with pytest.raises(ValueError):
+        Journal(tmp_path / "book.journal", fsync="sometimes")
+
+
+def test_recover_rebuilds_book(tmp_path):
+    path = tmp_path / "book.journal"
+    with Journal(path) as journal:
+        book = LimitOrderBook(journal=journal)
+        place_and_cancel(book)
+
+    assert book.sequence == 7
+    recovered = LimitOrderBook.recover(path)
+    assert_same_book(book, recovered)
+
+
+@pytest.mark.parametrize(
+    "make_book",
+    [
+        lambda **kwargs: LimitOrderBook(instrument=Instrument("0.5"), **kwargs),
+        lambda **kwargs: ArrayLimitOrderBook(Instrument("0.5"), **kwargs),
+    ],
+)
+def test_recover_rebuilds_book_with_instrument(tmp_path, make_book):
+    path = tmp_path / "book.journal"
+    with Journal(path) as journal:
+        book = make_book(journal=journal)
+        place_and_cancel(book)
+
+    recovered = type(book).recover(path, instrument=Instrument("0.5"))
+    assert_same_book(book, recovered)
+
+
+def test_recovered_book_continues_journal(tmp_path):
+    path = tmp_path / "book.journal"
+    with Journal(path) as journal:
+        book = LimitOrderBook(journal=journal)
+        book.place_order("O1", "buy", Decimal("10"), 5)
+
+    with Journal(path) as journal:
+        book = LimitOrderBook.recover(path, journal=journal)
+        # Replaying does not produce fills, but later orders match as usual.
+        assert book.place_order("O2", "sell", Decimal("10"), 2) == [
+            ("O1", "O2", 2, Decimal("10"))
+        ]
+
+    assert [record[1] for record in read_journal(path)] == [1, 2]
+    recovered = LimitOrderBook.recover(path)
+    assert recovered.active_orders.keys() == {"O1"}
+    assert recovered.best_bid().quantity == 3
+
+
+def test_reopened_journal_truncates_partial_record(tmp_path):
+    path = tmp_path / "book.journal"
+    with Journal(path) as journal:
+        book = LimitOrderBook(journal=journal)
+        book.place_order("A", "buy", Decimal("10"), 1)
+        book.place_order("B", "buy", Decimal("9"), 1)
+    with open(path, "ab") as file:
+        file.write(b"\x01\x00\x00")
+
+    with Journal(path) as journal:
+        book = LimitOrderBook.recover(path, journal=journal)
+        book.place_order("C", "buy", Decimal("8"), 1)
+
+    assert [record[2] for record in read_journal(path)] == ["A", "B", "C"]
+    recovered = LimitOrderBook.recover(path)
+    assert recovered.active_orders.keys() == {"A", "B", "C"}
+
+
+def test_rejected_order_is_not_journaled(tmp_path):
+    path = tmp_path / "book.journal"
+    with Journal(path) as journal:
+        book = LimitOrderBook(instrument=Instrument("0.5"), journal=journal)
+        with pytest.raises(ValueError):
+            book.place_order("O1", "buy", Decimal("10.25"), 5)
+
+    assert list(read_journal(path)) == []
+    assert book.sequence == 0
@@ -0,0 +1,69 @@
+from decimal import Decimal
+
+import pytest
+
+from limit_order_book.limit_order_book import LimitOrderBook
+
+
+@pytest.fixture
+def book(book):
+    handles = {}
+    for level, price in enumerate((10, 11, 12)):
+        for i in range(3):
+            order_id = f"S{level}{i}"
+            handles[order_id], _ = book.place_order(
+                order_id, "sell", price, i + 1, return_handle=True
+            )
+    book.handles = handles
+    return book
+
+
+def test_sweep_fills_levels_in_price_time_order(book):
+    assert book.place_order("B1", "buy", 12, 14) == [
+        ("B1", "S00", 1, Decimal("10")),
+        ("B1", "S01", 2, Decimal("10")),
+        ("B1", "S02", 3, Decimal("10")),
+        ("B1", "S10", 1, Decimal("11")),
+        ("B1", "S11", 2, Decimal("11")),
+        ("B1", "S12", 3, Decimal("11")),
+        ("B1", "S20", 1, Decimal("12")),
+        ("B1", "S21", 1, Decimal("12")),
+    ]
+    assert book.top_of_book() == (None, None, Decimal("12"), 4)
+    assert book.depth("sell")[2].tolist() == [2]
+    assert set(book.active_orders) == {"S21", "S22"}
+
+
+def test_sweep_updates_bookkeeping(book):
+    book.place_order("B1", "buy", 11, 12)
+    for order_id in ("S00", "S01", "S02", "S10", "S11", "S12"):
+        assert order_id not in book.active_orders
+        assert book.cancel_order(order_id) is False
+        assert book.cancel_order(book.handles[order_id]) is False
+        assert book.amend_order(order_id, new_quantity=1) is None
+    assert book.sell_orders.search(10) is None
+    assert book.sell_orders.search(11) is None
+
+    # Emptied levels can be used again.
+    book.place_order("S3", "sell", 10, 5)
+    assert book.place_order("B2", "buy", 10, 5) == [("B2", "S3", 5, Decimal("10"))]
+    assert book.top_of_book() == (None, None, Decimal("12"), 6)
+
+
+def test_sweep_of_exact_level_quantity(book):
+    assert len(book.place_order("B1", "buy", 10, 6)) == 3
+    assert book.top_of_book() == (None, None, Decimal("11"), 6)
+    assert book.best_bid() is None
+
+
+def test_sell_sweep():
+    book = LimitOrderBook()
+    book.place_order("B1", "buy", 10, 1)
+    book.place_order("B2", "buy", 10, 2)
+    book.place_order("B3", "buy", 9, 4)
+    assert book.place_order("S1", "sell", 9, 5) == [
+        ("B1", "S1", 1, Decimal("10")),
+        ("B2", "S1", 2, Decimal("10")),
+        ("B3", "S1", 2, Decimal("9")),
+    ]
+    assert book.top_of_book() == (Decimal("9"), 2, None, None)
@@ -0,0 +1,92 @@
+from decimal import Decimal
+
+import pytest
+
+from limit_order_book.instrument import Instrument
+from limit_order_book.journal import Journal
+from limit_order_book.limit_order_book import LimitOrderBook
+
+
+def bid_depth(book):
+    prices, quantities, order_counts = book.depth("buy")
+    return prices, list(quantities), list(order_counts)
+
+
+def place_bids(book):
+    book.place_order("B1", "buy", 10, 5)
+    book.place_order("B2", "buy", 10, 3)
+    book.place_order("B3", "buy", 9, 4)
+
+
+def test_size_down_keeps_queue_position(book):
+    place_bids(book)
+    handle = book.active_orders["B1"]
+    assert book.amend_order("B1", new_quantity=2) == []
+    assert book.active_orders["B1"] == handle
+    assert book.top_of_book()[:2] == (Decimal("10"), 5)
+
+    assert book.place_order("S1", "sell", 10, 3) == [
+        ("B1", "S1", 2, Decimal("10")),
+        ("B2", "S1", 1, Decimal("10")),
+    ]
+
+
+def test_size_down_by_handle(book):
+    handle, _ = book.place_order("B1", "buy", 10, 5, return_handle=True)
+    assert book.amend_handle(handle, new_quantity=1) == []
+    assert bid_depth(book) == ([Decimal("10")], [1], [1])
+
+
+def test_size_up_loses_queue_position(book):
+    place_bids(book)
+    assert book.amend_order("B1", new_quantity=6) == []
+    assert book.top_of_book()[:2] == (Decimal("10"), 9)
+    assert book.place_order("S1", "sell", 10, 3) == [("B2", "S1", 3, Decimal("10"))]
+
+
+def test_price_change_is_cancel_replace(book):
+    place_bids(book)
+    assert book.amend_order("B3", new_price=10) == []
+    assert bid_depth(book) == ([Decimal("10")], [12], [3])
+
+    book.place_order("S1", "sell", 12, 2)
+    assert book.amend_order("B2", new_quantity=4, new_price=12) == [
+        ("B2", "S1", 2, Decimal("12"))
+    ]
+    assert book.best_ask() is None
+    assert book.top_of_book()[:2] == (Decimal("12"), 2)
+
+
+def test_amend_unknown_or_filled_order(book):
+    assert book.amend_order("B1", new_quantity=1) is None
+    book.place_order("B1", "buy", 10, 5)
+    book.place_order("S1", "sell", 10, 5)
+    assert book.amend_order("B1", new_quantity=1) is None
+
+
+def test_amend_rejects_invalid_values_without_touching_order():
+    book = LimitOrderBook(instrument=Instrument("0.5", lot_size=2))
+    book.place_order("B1", "buy", 10, 4)
+    with pytest.raises(ValueError):
+        book.amend_order("B1", new_quantity=0)
+    with pytest.raises(ValueError):
+        book.amend_order("B1", new_quantity=3)
+    with pytest.raises(ValueError):
+        book.amend_order("B1", new_price=Decimal("10.25"))
+    assert bid_depth(book) == ([Decimal("10")], [4], [1])
+
+
+def test_recover_replays_amends(tmp_path):
+    path = tmp_path / "book.journal"
+    with Journal(path) as journal:
+        book = LimitOrderBook(journal=journal)
+        place_bids(book)
+        book.amend_order("B1", new_quantity=1)
+        book.amend_order("B2", new_price=11)
+
+    recovered = LimitOrderBook.recover(path)
+    assert recovered.sequence == 6
+    assert recovered.depth("buy") == book.depth("buy")
+    assert recovered.place_order("S1", "sell", 9, 3) == [
+        ("B2", "S1", 3, Decimal("11")),
+    ]
@@ -0,0 +1,107 @@
+from decimal import Decimal
+
+from limit_order_book.journal import CANCEL, PLACE, Journal, read_journal
+from limit_order_book.limit_order_book import LimitOrderBook
+from limit_order_book.order_records import OrderRecords
+
+
+def test_records_reuse_slots_with_new_generation():
+    records = OrderRecords()
+    first_handle = records.add("node1", "level1")
+    records.release(first_handle)
+    second_handle = records.add("node2", "level2")
+
+    assert second_handle != first_handle
+    assert records.slot(first_handle) is None
+    assert records.slot(second_handle) == 0
+    assert records.order_nodes[0] == "node2"
+    assert len(records) == 1
+
+
+def test_place_order_returns_handle(limit_order_book):
+    handle, matches = limit_order_book.place_order(
+        "O1", "buy", 10, 5, return_handle=True
+    )
+    assert matches == []
+    assert limit_order_book.active_orders["O1"] == handle
+
+    handle, matches = limit_order_book.place_order(
+        "O2", "sell", 10, 5, return_handle=True
+    )
+    assert handle is None
+    assert matches == [("O1", "O2", 5, Decimal("10"))]
+
+
+def test_cancel_order_by_handle(limit_order_book):
+    handle, _ = limit_order_book.place_order("O1", "buy", 10, 5, return_handle=True)
+    assert limit_order_book.cancel_handle(handle) is True
+    assert "O1" not in limit_order_book.active_orders
+    assert limit_order_book.buy_orders.get_min() is None
+    assert limit_order_book.cancel_handle(handle) is False
+    assert limit_order_book.cancel_order("O1") is False
+
+
+def test_stale_handle_does_not_cancel_slot_reuser(limit_order_book):
+    handle, _ = limit_order_book.place_order("O1", "buy", 10, 5, return_handle=True)
+    limit_order_book.place_order("O2", "sell", 10, 5)
+    new_handle, _ = limit_order_book.place_order(
+        "O3", "buy", 10, 5, return_handle=True
+    )
+
+    assert new_handle & 0xFFFFFFFF == handle & 0xFFFFFFFF
+    assert limit_order_book.cancel_handle(handle) is False
+    assert "O3" in limit_order_book.active_orders
+    assert limit_order_book.cancel_handle(new_handle) is True
+
+
+def test_cancel_by_id_and_handle_mixed(limit_order_book):
+    handles = [
+        limit_order_book.place_order(f"O{i}", "sell", 10 + i, 1, return_handle=True)[0]
+        for i in range(4)
+    ]
+    assert limit_order_book.cancel_order("O1") is True
+    assert limit_order_book.cancel_handle(handles[1]) is False
+    assert limit_order_book.cancel_handle(handles[2]) is True
+    assert limit_order_book.cancel_order("O2") is False
+    assert len(limit_order_book.records) == 2
+    assert list(limit_order_book.depth("sell")[0]) == [Decimal("10"), Decimal("13")]
+
+
+def test_integer_order_ids_are_not_handles(limit_order_book):
+    handle, _ = limit_order_book.place_order(
+        "O1", "buy", 10, 5, return_handle=True
+    )
+    limit_order_book.place_order(100, "buy", 9, 5)
+
+    assert limit_order_book.cancel_order(handle) is False
+    assert "O1" in limit_order_book.active_orders
+    assert limit_order_book.amend_order(handle, new_quantity=1) is None
+    assert limit_order_book.cancel_order(100) is True
+    assert limit_order_book.cancel_handle(handle) is True
+
+
+def test_amend_by_handle(limit_order_book):
+    handle, _ = limit_order_book.place_order("O1", "buy", 10, 5, return_handle=True)
+    assert limit_order_book.amend_handle(handle, new_quantity=2) == []
+    assert limit_order_book.top_of_book()[:2] == (Decimal("10"), 2)
+
+    # A price change re-places the order, so its old handle is stale.
+    assert limit_order_book.amend_handle(handle, new_price=11) == []
+    assert limit_order_book.amend_handle(handle, new_quantity=1) is None
+    assert limit_order_book.cancel_handle(handle) is False
+
+
+def test_cancel_handle_is_journaled_and_instrumented(tmp_path):
+    path = tmp_path / "book.journal"
+    with Journal(path) as journal:
+        book = LimitOrderBook(journal=journal, instrumented=True)
+        handle, _ = book.place_order("O1", "buy", 10, 5, return_handle=True)
+        assert book.cancel_handle(handle) is True
+        assert book.cancel_handle(handle) is False
+
+    assert [record[:3] for record in read_journal(path)] == [
+        (PLACE, 1, "O1"),
+        (CANCEL, 2, "O1"),
+    ]
+    assert book.metrics.counters["cancels"] == 1
+    assert book.metrics.counters["cancels_unknown"] == 1
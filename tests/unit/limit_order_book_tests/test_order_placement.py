@@ -21,11 +21,11 @@ def test_place_buy_order(limit_order_book):
     assert "O1" in limit_order_book.active_orders
     assert "O1" not in limit_order_book.filled_orders
 
-    assert limit_order_book.active_orders["O1"][3].data == buy_order
-    assert limit_order_book.active_orders["O1"][2].key == -1
-    assert limit_order_book.active_orders["O1"][2].value.price == 1
-    assert limit_order_book.active_orders["O1"][1] == -1
-    assert limit_order_book.active_orders["O1"][0] == "buy"
+    handle = limit_order_book.active_orders["O1"]
+    slot = limit_order_book.records.slot(handle)
+    assert limit_order_book.records.order_nodes[slot].data == buy_order
+    assert limit_order_book.records.level_nodes[slot].key == -1
+    assert limit_order_book.records.level_nodes[slot].value.price == 1
 
 
 def test_place_sell_order(limit_order_book):
@@ -48,11 +48,11 @@ def test_place_sell_order(limit_order_book):
     assert "O1" in limit_order_book.active_orders
     assert "O1" not in limit_order_book.filled_orders
 
-    assert limit_order_book.active_orders["O1"][3].data == sell_order
-    assert limit_order_book.active_orders["O1"][2].key == 1
-    assert limit_order_book.active_orders["O1"][2].value.price == 1
-    assert limit_order_book.active_orders["O1"][1] == 1
-    assert limit_order_book.active_orders["O1"][0] == "sell"
+    handle = limit_order_book.active_orders["O1"]
+    slot = limit_order_book.records.slot(handle)
+    assert limit_order_book.records.order_nodes[slot].data == sell_order
+    assert limit_order_book.records.level_nodes[slot].key == 1
+    assert limit_order_book.records.level_nodes[slot].value.price == 1
 
 
 def test_partial_match_with_buy_order(limit_order_book):
@@ -0,0 +1,103 @@
+from decimal import Decimal
+
+import pytest
+
+from limit_order_book.journal import Journal
+from limit_order_book.limit_order_book import LimitOrderBook
+
+
+@pytest.fixture
+def book(book):
+    book.place_order("S1", "sell", 10, 2)
+    book.place_order("S2", "sell", 11, 3)
+    book.place_order("S3", "sell", 12, 4)
+    return book
+
+
+def ask_depth(book):
+    prices, quantities, order_counts = book.depth("sell")
+    return prices, list(quantities), list(order_counts)
+
+
+def test_market_order_matches_any_price_and_never_rests(book):
+    handle, matches = book.place_order(
+        "B1", "buy", None, 20, return_handle=True, order_type="market"
+    )
+    assert handle is None
+    assert matches == [
+        ("B1", "S1", 2, Decimal("10")),
+        ("B1", "S2", 3, Decimal("11")),
+        ("B1", "S3", 4, Decimal("12")),
+    ]
+    assert book.best_ask() is None
+    assert book.best_bid() is None
+    assert "B1" not in book.active_orders
+
+
+def test_ioc_order_cancels_remainder(book):
+    assert book.place_order("B1", "buy", 11, 10, order_type="ioc") == [
+        ("B1", "S1", 2, Decimal("10")),
+        ("B1", "S2", 3, Decimal("11")),
+    ]
+    assert book.best_bid() is None
+    assert book.cancel_order("B1") is False
+    assert ask_depth(book) == ([Decimal("12")], [4], [1])
+
+
+def test_ioc_order_without_match(book):
+    assert book.place_order("B1", "buy", 9, 10, order_type="ioc") == []
+    assert book.best_bid() is None
+    assert book.buy_orders.get_min() is None
+
+
+def test_fok_order_fills_completely(book):
+    assert book.place_order("B1", "buy", 11, 5, order_type="fok") == [
+        ("B1", "S1", 2, Decimal("10")),
+        ("B1", "S2", 3, Decimal("11")),
+    ]
+    assert book.cancel_order("B1") is False
+    assert ask_depth(book) == ([Decimal("12")], [4], [1])
+
+
+def test_fok_order_is_killed_without_touching_book(book):
+    before = ask_depth(book)
+    assert book.place_order("B1", "buy", 11, 6, order_type="fok") == []
+    assert ask_depth(book) == before
+    assert book.best_bid() is None
+    assert book.place_order("B2", "buy", 100, 10, order_type="fok") == []
+    assert ask_depth(book) == before
+
+
+def test_sell_order_types_against_bids():
+    book = LimitOrderBook()
+    book.place_order("B1", "buy", 10, 2)
+    book.place_order("B2", "buy", 9, 2)
+    assert book.place_order("S1", "sell", 10, 3, order_type="fok") == []
+    assert book.place_order("S2", "sell", 9, 3, order_type="fok") == [
+        ("B1", "S2", 2, Decimal("10")),
+        ("B2", "S2", 1, Decimal("9")),
+    ]
+    assert book.place_order("S3", "sell", None, 5, order_type="market") == [
+        ("B2", "S3", 1, Decimal("9")),
+    ]
+
+
+def test_unknown_order_type(book):
+    with pytest.raises(ValueError):
+        book.place_order("B1", "buy", 11, 1, order_type="gtc")
+
+
+def test_recover_replays_order_types(tmp_path):
+    path = tmp_path / "book.journal"
+    with Journal(path) as journal:
+        book = LimitOrderBook(journal=journal)
+        book.place_order("S1", "sell", 10, 2)
+        book.place_order("S2", "sell", 11, 2)
+        book.place_order("B1", "buy", 10, 3, order_type="ioc")
+        book.place_order("B2", "buy", None, 1, order_type="market")
+        book.place_order("B3", "buy", 11, 5, order_type="fok")
+
+    recovered = LimitOrderBook.recover(path)
+    assert recovered.active_orders.keys() == book.active_orders.keys() == {"S2"}
+    assert recovered.best_ask().quantity == 1
+    assert recovered.best_bid() is None
@@ -0,0 +1,68 @@
+import random
+
+from limit_order_book.limit_order_book import LimitOrderBook
+from limit_order_book.object_pool import ObjectPool
+from limit_order_book.order import Order
+
+
+def replay(limit_order_book, seed=11, num_operations=3000):
+    rng = random.Random(seed)
+    matches = []
+    cancels = []
+    for i in range(num_operations):
+        if rng.random() < 0.6:
+            matches.extend(
+                limit_order_book.place_order(
+                    f"O{i}", rng.choice(["buy", "sell"]), rng.randint(95, 105), rng.randint(1, 10)
+                )
+            )
+        else:
+            cancels.append(limit_order_book.cancel_order(f"O{rng.randint(0, i)}"))
+    return matches, cancels
+
+
+def test_object_pool_reuses_released_objects():
+    pool = ObjectPool(Order, max_size=1)
+    order = pool.acquire("O1", "buy", 1, 1)
+    pool.release(order)
+    pool.release(Order("O2", "buy", 1, 1))
+    assert pool.stats() == {"created": 1, "reused": 0, "free": 1}
+
+    reused_order = pool.acquire("O3", "sell", 2, 3)
+    assert reused_order is order
+    assert reused_order == Order("O3", "sell", 2, 3)
+    assert pool.stats() == {"created": 1, "reused": 1, "free": 0}
+
+
+def test_pooling_disabled_by_default(limit_order_book):
+    assert limit_order_book.pool_stats() is None
+
+
+def test_pooled_book_behaves_like_unpooled_book():
+    limit_order_book = LimitOrderBook()
+    pooled_limit_order_book = LimitOrderBook(pooling=True)
+
+    assert replay(pooled_limit_order_book) == replay(limit_order_book)
+    assert (
+        pooled_limit_order_book.active_orders.keys()
+        == limit_order_book.active_orders.keys()
+    )
+    assert pooled_limit_order_book.depth("buy", 100) == limit_order_book.depth(
+        "buy", 100
+    )
+    assert pooled_limit_order_book.depth("sell", 100) == limit_order_book.depth(
+        "sell", 100
+    )
+
+
+def test_pool_stats_report_reuse():
+    limit_order_book = LimitOrderBook(pooling=True)
+    replay(limit_order_book)
+    stats = limit_order_book.pool_stats()
+    assert set(stats) == {"orders", "price_levels", "list_nodes", "index_nodes"}
+    for pool_stats in stats.values():
+        assert pool_stats["reused"] > 0
+    order_stats = stats["orders"]
+    assert order_stats["created"] == (
+        len(limit_order_book.active_orders) + order_stats["free"]
+    )
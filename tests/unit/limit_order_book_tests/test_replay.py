@@ -0,0 +1,94 @@
+import csv
+from decimal import Decimal
+
+import pytest
+
+from limit_order_book.instrument import Instrument
+from limit_order_book.limit_order_book import LimitOrderBook
+from limit_order_book.replay import (
+    convert,
+    main,
+    read_binary,
+    read_csv,
+    read_orders,
+    replay,
+)
+
+
+def orders_path(test_case_id):
+    return f"tests/functional/testcase{test_case_id}/orders.csv"
+
+
+def expected_fills(test_case_id):
+    with open(f"tests/functional/testcase{test_case_id}/matches.csv") as file:
+        reader = csv.reader(file)
+        next(reader)
+        return [
+            (buy_order_id, sell_order_id, Decimal(price), int(quantity))
+            for buy_order_id, sell_order_id, price, quantity in reader
+        ]
+
+
+def read_fills(path):
+    with open(path) as file:
+        reader = csv.reader(file)
+        next(reader)
+        return [
+            (buy_order_id, sell_order_id, Decimal(price), int(quantity))
+            for buy_order_id, sell_order_id, price, quantity in reader
+        ]
+
+
+@pytest.mark.parametrize("test_case_id", ["00", "01", "02"])
+def test_binary_round_trip(tmp_path, test_case_id):
+    binary_path = tmp_path / "orders.bin"
+    num_orders = convert(orders_path(test_case_id), binary_path, chunk_records=4)
+
+    csv_orders = []
+    for chunk in read_csv(orders_path(test_case_id), chunk_records=4):
+        csv_orders.extend(zip(*chunk))
+    binary_orders = []
+    for chunk in read_binary(binary_path):
+        binary_orders.extend(zip(*chunk))
+
+    assert num_orders == len(csv_orders) == len(binary_orders)
+    for csv_order, binary_order in zip(csv_orders, binary_orders):
+        # Cancels only carry their order id.
+        assert binary_order[:2] == csv_order[:2]
+        if csv_order[2] is not None:
+            assert binary_order == csv_order
+
+
+@pytest.mark.parametrize("test_case_id", ["00", "01", "02"])
+@pytest.mark.parametrize("binary", [False, True], ids=["csv", "binary"])
+def test_replay_writes_fills(tmp_path, test_case_id, binary):
+    path = orders_path(test_case_id)
+    if binary:
+        path = tmp_path / "orders.bin"
+        convert(orders_path(test_case_id), path)
+    fills_path = tmp_path / "fills.csv"
+
+    assert main([str(path), "--fills", str(fills_path), "--tick-size", "0.01"]) == 0
+    assert read_fills(fills_path) == expected_fills(test_case_id)
+
+
+def test_replay_counts_orders_and_fills():
+    book = LimitOrderBook(instrument=Instrument("1"))
+    num_orders, num_fills = replay(book, read_orders(orders_path("02"), 8))
+    assert num_fills == len(expected_fills("02"))
+    with open(orders_path("02")) as file:
+        assert num_orders == len(file.readlines()) - 1
+
+
+def test_read_csv_rejects_unknown_action(tmp_path):
+    path = tmp_path / "orders.csv"
+    path.write_text("action,order_id,order_side,order_price,order_quantity\n")
+    with open(path, "a") as file:
+        file.write("modify,O1,buy,10,1\n")
+    with pytest.raises(ValueError):
+        list(read_csv(path))
+
+
+def test_read_binary_rejects_other_files():
+    with pytest.raises(ValueError):
+        list(read_binary(orders_path("00")))
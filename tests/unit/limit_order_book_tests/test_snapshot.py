@@ -0,0 +1,95 @@
+from decimal import Decimal
+
+import pytest
+
+from limit_order_book.journal import Journal
+from limit_order_book.limit_order_book import LimitOrderBook
+from limit_order_book.snapshot import read_snapshot
+
+
+def place_resting_orders(book):
+    book.place_order("B1", "buy", Decimal("10"), 5)
+    book.place_order("B2", "buy", Decimal("10.5"), 3)
+    book.place_order("B3", "buy", Decimal("10"), 2)
+    book.place_order("S1", "sell", Decimal("12"), 4)
+    book.place_order("S2", "sell", Decimal("11"), 1)
+    book.place_order("S3", "sell", Decimal("11"), 6)
+    book.place_order("S4", "sell", Decimal("10.5"), 1)  # fills part of B2
+    book.cancel_order("S1")
+
+
+def test_snapshot_layout(tmp_path, make_book):
+    path = tmp_path / "book.snapshot"
+    book = make_book()
+    place_resting_orders(book)
+    book.snapshot(path)
+
+    sequence, (buy_side, sell_side) = read_snapshot(path)
+    assert sequence == 0
+    levels, order_ids, quantities = buy_side
+    assert levels == [(Decimal("10.5"), 1), (Decimal("10"), 2)]
+    assert order_ids == ["B2", "B1", "B3"]
+    assert list(quantities) == [2, 5, 2]
+    levels, order_ids, quantities = sell_side
+    assert levels == [(Decimal("11"), 2)]
+    assert order_ids == ["S2", "S3"]
+    assert list(quantities) == [1, 6]
+
+
+def test_load_restores_price_time_priority(tmp_path, make_book):
+    path = tmp_path / "book.snapshot"
+    book = make_book()
+    place_resting_orders(book)
+    book.snapshot(path)
+
+    empty_book = make_book()
+    loaded = type(book).load(path, instrument=empty_book.instrument)
+    assert loaded.active_orders.keys() == book.active_orders.keys()
+    for side in ("buy", "sell"):
+        assert loaded.depth(side) == book.depth(side)
+    assert loaded.top_of_book() == (Decimal("10.5"), 2, Decimal("11"), 7)
+
+    assert loaded.place_order("S5", "sell", Decimal("10"), 8) == [
+        ("B2", "S5", 2, Decimal("10.5")),
+        ("B1", "S5", 5, Decimal("10")),
+        ("B3", "S5", 1, Decimal("10")),
+    ]
+    assert loaded.cancel_order("B3") is True
+    assert loaded.best_bid() is None
+    handle, _ = loaded.place_order("B4", "buy", Decimal("11"), 7, return_handle=True)
+    assert handle is None
+    assert loaded.best_ask() is None
+
+
+def test_load_empty_book(tmp_path, make_book):
+    path = tmp_path / "book.snapshot"
+    book = make_book()
+    book.snapshot(path)
+
+    loaded = type(book).load(path, instrument=book.instrument)
+    assert loaded.active_orders == {}
+    assert loaded.top_of_book() == (None, None, None, None)
+
+
+def test_load_rejects_other_files(tmp_path):
+    path = tmp_path / "book.snapshot"
+    path.write_bytes(bytes(64))
+    with pytest.raises(ValueError):
+        LimitOrderBook.load(path)
+
+
+def test_recover_from_snapshot_and_journal(tmp_path):
+    journal_path = tmp_path / "book.journal"
+    snapshot_path = tmp_path / "book.snapshot"
+    with Journal(journal_path) as journal:
+        book = LimitOrderBook(journal=journal)
+        book.place_order("B1", "buy", Decimal("10"), 5)
+        book.place_order("S1", "sell", Decimal("11"), 5)
+        book.snapshot(snapshot_path)
+        book.cancel_order("B1")
+        book.place_order("B2", "buy", Decimal("10"), 1)
+
+    recovered = LimitOrderBook.recover(journal_path, snapshot_path=snapshot_path)
+    assert recovered.sequence == 4
+    assert recovered.active_orders.keys() == {"S1", "B2"}
+    assert recovered.depth("buy") == book.depth("buy")
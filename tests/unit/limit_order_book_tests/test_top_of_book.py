@@ -0,0 +1,70 @@
+import random
+from decimal import Decimal
+
+
+def level_totals(price_level):
+    orders = list(price_level.queue)
+    return sum(order.order_quantity for order in orders), len(orders)
+
+
+def test_empty_book(limit_order_book):
+    assert limit_order_book.best_bid() is None
+    assert limit_order_book.best_ask() is None
+    assert limit_order_book.spread() is None
+    assert limit_order_book.top_of_book() == (None, None, None, None)
+
+
+def test_best_bid_and_ask(limit_order_book):
+    limit_order_book.place_order("O1", "buy", Decimal("9.5"), 3)
+    limit_order_book.place_order("O2", "buy", Decimal("9.5"), 4)
+    limit_order_book.place_order("O3", "buy", Decimal("9"), 10)
+    limit_order_book.place_order("O4", "sell", Decimal("10.25"), 5)
+
+    best_bid = limit_order_book.best_bid()
+    assert best_bid.price == Decimal("9.5")
+    assert best_bid.quantity == 7
+    assert best_bid.order_count == 2
+
+    best_ask = limit_order_book.best_ask()
+    assert best_ask.price == Decimal("10.25")
+    assert best_ask.quantity == 5
+    assert best_ask.order_count == 1
+
+    assert limit_order_book.spread() == Decimal("0.75")
+    assert limit_order_book.top_of_book() == (
+        Decimal("9.5"),
+        7,
+        Decimal("10.25"),
+        5,
+    )
+
+
+def test_aggregates_after_partial_fill_and_cancel(limit_order_book):
+    limit_order_book.place_order("O1", "sell", 10, 3)
+    limit_order_book.place_order("O2", "sell", 10, 4)
+    limit_order_book.place_order("O3", "buy", 10, 5)
+
+    best_ask = limit_order_book.best_ask()
+    assert (best_ask.quantity, best_ask.order_count) == (2, 1)
+
+    limit_order_book.cancel_order("O2")
+    assert limit_order_book.best_ask() is None
+    assert limit_order_book.top_of_book() == (None, None, None, None)
+
+
+def test_aggregates_match_queues_under_random_flow(limit_order_book):
+    rng = random.Random(5)
+    for i in range(2000):
+        if rng.random() < 0.7:
+            limit_order_book.place_order(
+                f"O{i}", rng.choice(["buy", "sell"]), rng.randint(95, 105), rng.randint(1, 10)
+            )
+        else:
+            limit_order_book.cancel_order(f"O{rng.randint(0, i)}")
+
+    for side in (limit_order_book.buy_orders, limit_order_book.sell_orders):
+        for node in side.iter_range():
+            price_level = node.value
+            assert (price_level.quantity, price_level.order_count) == level_totals(
+                price_level
+            )